@@ -0,0 +1,141 @@
+"""
+Compara a leitura do arquivo de pagamentos com o csv.reader e com o
+LeitorRapido, em linhas por segundo.
+
+Uso (a partir da raiz do projeto):
+
+    python -m benchmarks.leitura [arquivo] [--replicar N] [--repeticoes R]
+
+Com --replicar, o benchmark gera um arquivo temporário com N cópias dos
+registros do arquivo (códigos de lançamento deslocados a cada cópia), para
+medir em volumes maiores que a amostra.
+
+Etapas medidas:
+    - csv.reader: só a divisão em campos, em modo texto (limite inferior da
+      carga comum);
+    - carga csv.reader: Ingestor padrão (divisão, conversão e estruturas);
+    - carga rápida: Ingestor com rapido=True;
+    - cache: restauração do cache binário da carga (Ingestor com cache=True,
+      depois de gravado; o cache criado pelo benchmark é removido ao final).
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+import time
+
+from projeto_ped.ingestao import ESQUEMA_PAGAMENTOS, Ingestor, arquivo_cache
+
+ARQUIVO = "pagamentos_gestao_pactuada_2019_2024.csv"
+
+
+def replicar(caminho: str, copias: int, destino: str, encoding: str = "latin-1"):
+    """
+    Grava em destino o cabeçalho e `copias` cópias dos registros do arquivo,
+    deslocando o código do lançamento para que continue único.
+    """
+    with open(caminho, encoding=encoding, newline="") as ficheiro:
+        leitor = csv.reader(ficheiro, delimiter=";")
+        cabecalho = next(leitor)
+        registros = list(leitor)
+    indice = ESQUEMA_PAGAMENTOS.indices(cabecalho)["codigo_lancamento"]
+    deslocamento = 10 ** len(str(len(registros) * 10))
+
+    with open(destino, "w", encoding=encoding, newline="") as ficheiro:
+        escritor = csv.writer(
+            ficheiro, delimiter=";", quoting=csv.QUOTE_ALL, lineterminator="\r\n"
+        )
+        escritor.writerow(cabecalho)
+        for copia in range(copias):
+            for registro in registros:
+                if copia and registro[indice].isdigit():
+                    registro = list(registro)
+                    registro[indice] = str(int(registro[indice]) + copia * deslocamento)
+                escritor.writerow(registro)
+
+
+def _medir(funcao, repeticoes: int) -> float:
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def _somente_csv(caminho: str, encoding: str) -> int:
+    with open(caminho, encoding=encoding) as ficheiro:
+        return sum(1 for _ in csv.reader(ficheiro, delimiter=";")) - 1
+
+
+def _carga(caminho: str, encoding: str, rapido: bool, cache: bool = False):
+    ingestor = Ingestor(
+        encoding=encoding,
+        progresso=False,
+        arquivo_quarentena=None,
+        erros="ignorar",
+        rapido=rapido,
+        cache=cache,
+    )
+    return ingestor.carregar(caminho)
+
+
+def _cache(caminho: str, encoding: str, repeticoes: int) -> float:
+    gravado = os.path.exists(arquivo_cache(caminho))
+    try:
+        _carga(caminho, encoding, True, cache=True)
+        return _medir(lambda: _carga(caminho, encoding, True, cache=True), repeticoes)
+    finally:
+        if not gravado and os.path.exists(arquivo_cache(caminho)):
+            os.remove(arquivo_cache(caminho))
+
+
+def executar(
+    caminho: str, repeticoes: int = 3, encoding: str = "latin-1"
+) -> dict[str, float]:
+    """
+    Executa as etapas e retorna o melhor tempo (segundos) de cada uma.
+    """
+    linhas = _somente_csv(caminho, encoding)
+    tempos = {
+        "csv.reader": _medir(lambda: _somente_csv(caminho, encoding), repeticoes),
+        "carga csv.reader": _medir(
+            lambda: _carga(caminho, encoding, False), repeticoes
+        ),
+        "carga rápida": _medir(lambda: _carga(caminho, encoding, True), repeticoes),
+        "cache": _cache(caminho, encoding, repeticoes),
+    }
+
+    tamanho = os.path.getsize(caminho)
+    print(f"{caminho}: {linhas} registros, {tamanho / 1e6:.1f} MB")
+    for etapa, segundos in tempos.items():
+        print(f"  {etapa:<18} {segundos:8.3f} s {linhas / segundos:>14,.0f} linhas/s")
+    aceleracao = tempos["carga csv.reader"] / tempos["carga rápida"]
+    print(f"  carga rápida: {aceleracao:.1f}x a carga com csv.reader")
+    aceleracao = tempos["carga csv.reader"] / tempos["cache"]
+    print(f"  cache: {aceleracao:.1f}x a carga com csv.reader")
+    return tempos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("arquivo", nargs="?", default=ARQUIVO)
+    parser.add_argument("--replicar", type=int, default=1, help="Cópias dos registros.")
+    parser.add_argument(
+        "--repeticoes", type=int, default=3, help="Repetições de cada etapa."
+    )
+    parser.add_argument("--encoding", default="latin-1")
+    argumentos = parser.parse_args()
+
+    if argumentos.replicar <= 1:
+        executar(argumentos.arquivo, argumentos.repeticoes, argumentos.encoding)
+        return
+    with tempfile.TemporaryDirectory() as diretorio:
+        destino = os.path.join(diretorio, os.path.basename(argumentos.arquivo))
+        replicar(argumentos.arquivo, argumentos.replicar, destino, argumentos.encoding)
+        executar(destino, argumentos.repeticoes, argumentos.encoding)
+
+
+if __name__ == "__main__":
+    main()
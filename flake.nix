@@ -22,6 +22,7 @@
             isort
             black
             python3
+            python3Packages.pytest
           ];
 
           env.LD_LIBRARY_PATH = pkgs.lib.makeLibraryPath [
@@ -1,135 +1,116 @@
 """
-Processa um arquivo CSV contendo informações de despesas.
+Processa um arquivo CSV contendo informações de despesas e abre o menu.
 
-A variável 'reader' lê o arquivo CSV utilizando `csv.reader`, garantindo que o delimitador (`;`)
-e as aspas (`"`) sejam tratados corretamente, evitando problemas com vírgulas indevidas.
+A carga é feita por projeto_ped.ingestao.Ingestor, que lê o arquivo CSV utilizando `csv.reader`,
+garantindo que o delimitador (`;`) e as aspas (`"`) sejam tratados corretamente, evitando
+problemas com vírgulas indevidas.
 
 A versão anterior do código usava `split(';')`, o que causava erros ao quebrar
 strings que continham vírgulas dentro de aspas. A solução implementada usa "csv.reader(delimiter=";")"
 para manter a estrutura correta do CSV.
-"""
 
-import csv
-from datetime import datetime
+Opções da carga:
+    --processos N      divide o arquivo em blocos carregados por N processos;
+    --rapido           lê o CSV com o leitor vetorizado (LeitorRapido);
+    --indice           usa o índice dos registros, gravado ao lado do CSV;
+    --sem-cache        não usa nem grava o cache da carga. Por padrão, o estado
+                       da carga é gravado ao lado do CSV (CSV.carga.npz) e
+                       restaurado enquanto o arquivo não mudar;
+    --encoding, --erros, --sem-progresso (ver --help).
+"""
 
-from alive_progress import alive_bar
+import argparse
 
-from projeto_ped.despesa import Despesa, GestorDespesas
-from projeto_ped.gestores import (
-    Credor,
-    GestaoCredor,
-    GestorCategoriasDespesas,
-    GestorOrgs,
-    OrganizacaoSocial,
-    desmascarar_cpf,
-)
+from projeto_ped.ingestao import POLITICAS_ERRO, Ingestor
 from projeto_ped.interface.menu import Menu
-from projeto_ped.utils import DatasetInfo, Logger, Stats
-
-# Abertura do arquiuvo CSV
-ficheiro = open("pagamentos_gestao_pactuada_2019_2024.csv", "r", encoding="latin-1")
-reader = csv.reader(
-    ficheiro, delimiter=";"
-)  # Delimiter está substituindo o .split(";"), pois o split estava causando problemas.
-
-tam_ficheiro = sum(1 for linha in ficheiro if linha.strip()) - 1
-ficheiro.seek(0)
-
-# Criando logging e informações do dataset (linhas processadas, carregadas e descartas).
-logger = Logger()
-datasetinfo = DatasetInfo()
-
-# Instanciando estruturas de dados
-gestor_despesas = GestorDespesas()
-gestor_credor = GestaoCredor()
-gestor_categoria = GestorCategoriasDespesas()
-gestor_organizacao_social = GestorOrgs()
-
-stats = Stats()
-
-menu = Menu(
-    datasetinfo,
-    gestor_despesas,
-    gestor_credor,
-    gestor_categoria,
-    gestor_organizacao_social,
-    stats,
-)
-
-with alive_bar(tam_ficheiro, bar="filling", spinner="radioactive") as bar:
-    for linha in reader:
-        try:
-
-            datasetinfo.update_processed()
-            if datasetinfo.processed == 1:  # Descartando o cabeçalho
-                datasetinfo.update_disregard()
-                bar(skipped=True)
-                continue
-
-            despesa = Despesa(
-                str(linha[1].replace('"', "")),  # Coluna 2, COMPETENCIA
-                int(linha[2].replace('"', "")),  # Coluna 3, CODIGO_ORGANIZACAO_SOCIAL
-                int(linha[4].replace('"', "")),  # Coluna 5, CODIGO_LANCAMENTO
-                datetime.strptime(
-                    linha[5].replace('"', ""), "%Y-%m-%d"
-                ),  # Coluna 6, DATA_LANCAMENTO
-                str(linha[9].replace('"', "")),  # Coluna 10, CODIGO_CATEGORIA_DESPESA
-                str(linha[11].replace('"', "")),  # Coluna 12, CPFCNPJ_CREDOR
-                float(linha[13].replace('"', "")),  # Coluna 14, VALOR_LANCAMENTO
-                str(linha[14].replace('"', "")),  # Coluna 15, OBSERVACAO_LANCAMENTO
-            )
-
-            datasetinfo.update_loaded()  # Se o objeto foi instanciado sem problemas, incrementa quantidade de linhas que foram carregadas com sucesso
-
-            # Adiciona na árvore binária
-            gestor_despesas.adicionar_despesa(despesa)
-
-            gestor_credor.adicionar_credor(
-                Credor(
-                    desmascarar_cpf(despesa.cpf_cpnj_credor),
-                    str(linha[12].replace('"', "")),  # Coluna 13, NOME_CREDOR
-                ),
-                despesa.data_lancamento.strftime("%Y-%m-%d"),
-                despesa.valor,
-            )
-
-            gestor_categoria.add(
-                despesa.codigo_categoria_despesa,
-                str(linha[10].replace('"', "")),  # Coluna 11, NOME_CATEGORIA
-                despesa.data_lancamento,
-                despesa.valor,
-            )
-
-            gestor_organizacao_social.adicionar_org(
-                OrganizacaoSocial(
-                    despesa.codigo_organizacao_social,
-                    str(
-                        linha[3].replace('"', "")
-                    ),  # Coluna 11, NOME_ORGANIZACAO_SOCIAL
-                ),
-                despesa.data_lancamento,
-                despesa.valor,
-            )
-
-            # Exibe na tela o progresso a cada 1000 registros lidos
-            # datasetinfo.show_progress()
-
-            stats.acumular(
-                despesa.valor,
-                despesa.data_lancamento,
-            )
-
-        except Exception as _:
-            """
-            Se entrar aqui, houve algum problema na instanciação de alguma linha do csv,
-            e então ela será descartada. O cabeçalho sempre é descartado."
-            """
-            logger.log_error(linha)
-            datasetinfo.update_disregard
-            # print('Erro:', e)
-            # print(linha)
-            # break
-        finally:
-            bar()
-
-menu.run()
+from projeto_ped.utils import Logger
+
+ARQUIVO = "pagamentos_gestao_pactuada_2019_2024.csv"
+ARQUIVO_QUARENTENA = "quarentena_despesas.csv"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Carrega o arquivo de pagamentos e abre o menu."
+    )
+    parser.add_argument(
+        "arquivo",
+        nargs="?",
+        default=ARQUIVO,
+        help=f"CSV de pagamentos. Padrão: {ARQUIVO}.",
+    )
+    parser.add_argument(
+        "--processos",
+        type=int,
+        default=1,
+        help="Processos usados na carga (1 = carga sequencial). Padrão: 1.",
+    )
+    parser.add_argument("--encoding", default="latin-1", help="Padrão: latin-1.")
+    parser.add_argument(
+        "--erros",
+        choices=POLITICAS_ERRO,
+        default=POLITICAS_ERRO[0],
+        help="O que fazer com linhas que não podem ser convertidas. Padrão: registrar.",
+    )
+    parser.add_argument(
+        "--rapido",
+        action="store_true",
+        help="Lê o CSV com o leitor vetorizado (LeitorRapido) em vez do csv.reader.",
+    )
+    parser.add_argument(
+        "--indice",
+        action="store_true",
+        help="Usa o índice dos registros do CSV (gravado ao lado dele na primeira carga).",
+    )
+    parser.add_argument(
+        "--sem-cache",
+        action="store_true",
+        help="Sempre lê o CSV, sem usar nem gravar o cache da carga (gravado ao lado dele).",
+    )
+    parser.add_argument(
+        "--sem-progresso",
+        action="store_true",
+        help="Não mostra a barra de progresso da carga.",
+    )
+    argumentos = parser.parse_args()
+
+    ingestor = Ingestor(
+        encoding=argumentos.encoding,
+        erros=argumentos.erros,
+        progresso=not argumentos.sem_progresso,
+        processos=argumentos.processos,
+        logger=Logger(),
+        arquivo_quarentena=ARQUIVO_QUARENTENA,
+        rapido=argumentos.rapido,
+        indice=argumentos.indice,
+        cache=not argumentos.sem_cache,
+    )
+    carga = ingestor.carregar(argumentos.arquivo)
+
+    if carga.validador.rejeitados:
+        print(
+            f"{carga.validador.rejeitados} CPF/CNPJ inválidos enviados para "
+            f"{ingestor.arquivo_quarentena}: {carga.validador.rejeitados_por_motivo}"
+        )
+    if carga.validador.mascarados:
+        print(
+            f"{carga.validador.mascarados} CPFs mascarados, "
+            f"{carga.validador.desmascarados} calculados "
+            f"(taxa de acertos: {carga.validador.taxa_acertos:.1%})"
+        )
+
+    Menu(
+        carga.datasetinfo,
+        carga.gestor_despesas,
+        carga.gestor_credor,
+        carga.gestor_categoria,
+        carga.gestor_organizacao_social,
+        carga.stats,
+        carga.indice,
+    ).run()
+
+
+# Guarda necessária para a carga paralela: os processos filhos importam este
+# módulo e não devem repetir a carga.
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,638 @@
+import heapq
+from itertools import islice, pairwise
+from operator import itemgetter
+from typing import Any
+
+
+class ArvoreAVLError(Exception):
+    """Classe de exceção lançada quando uma operação inválida é realizada
+    sobre a árvore AVL.
+    """
+
+    def __init__(self, msg):
+        """Construtor padrão da classe, que recebe uma mensagem que se deseja
+        embutir na exceção
+        """
+        super().__init__(msg)
+
+
+class NoAVL:
+    """
+    Classe de objetos para criação de um nó da árvore AVL.
+    Cada nó guarda a chave de ordenação, a carga associada a ela,
+    os filhos e a altura e o tamanho (quantidade de nós) da subárvore
+    enraizada no nó.
+    """
+
+    __slots__ = ("altura", "carga", "chave", "dir", "esq", "tamanho")
+
+    def __init__(self, chave: any, carga: any):
+        self.chave = chave
+        self.carga = carga
+        self.esq = None
+        self.dir = None
+        self.altura = 1
+        self.tamanho = 1
+
+    def __str__(self):
+        return f"{self.chave}: {self.carga}"
+
+
+def _altura(no: NoAVL | None) -> int:
+    return no.altura if no is not None else 0
+
+
+def _tamanho(no: NoAVL | None) -> int:
+    return no.tamanho if no is not None else 0
+
+
+def _atualizar(no: NoAVL):
+    no.altura = 1 + max(_altura(no.esq), _altura(no.dir))
+    no.tamanho = 1 + _tamanho(no.esq) + _tamanho(no.dir)
+
+
+def _rotacao_direita(no: NoAVL) -> NoAVL:
+    raiz = no.esq
+    no.esq = raiz.dir
+    raiz.dir = no
+    _atualizar(no)
+    _atualizar(raiz)
+    return raiz
+
+
+def _rotacao_esquerda(no: NoAVL) -> NoAVL:
+    raiz = no.dir
+    no.dir = raiz.esq
+    raiz.esq = no
+    _atualizar(no)
+    _atualizar(raiz)
+    return raiz
+
+
+def _balancear(no: NoAVL) -> NoAVL:
+    _atualizar(no)
+    fator = _altura(no.esq) - _altura(no.dir)
+    if fator > 1:
+        if _altura(no.esq.esq) < _altura(no.esq.dir):
+            no.esq = _rotacao_esquerda(no.esq)
+        return _rotacao_direita(no)
+    if fator < -1:
+        if _altura(no.dir.dir) < _altura(no.dir.esq):
+            no.dir = _rotacao_direita(no.dir)
+        return _rotacao_esquerda(no)
+    return no
+
+
+def _construir(pares: list, inicio: int, fim: int) -> NoAVL | None:
+    """
+    Monta uma subárvore perfeitamente balanceada com os pares
+    (chave, carga) ordenados de pares[inicio:fim].
+    """
+    if inicio >= fim:
+        return None
+    meio = (inicio + fim) // 2
+    no = NoAVL(*pares[meio])
+    no.esq = _construir(pares, inicio, meio)
+    no.dir = _construir(pares, meio + 1, fim)
+    _atualizar(no)
+    return no
+
+
+def _remover_posicao(no: NoAVL, posicao: int) -> tuple[NoAVL | None, NoAVL]:
+    """
+    Remove o nó da posição informada (em ordem, a partir de 0) da subárvore
+    e a rebalanceia. Retorna a nova raiz da subárvore e o nó removido.
+    """
+    esquerda = _tamanho(no.esq)
+    if posicao < esquerda:
+        no.esq, removido = _remover_posicao(no.esq, posicao)
+    elif posicao > esquerda:
+        no.dir, removido = _remover_posicao(no.dir, posicao - esquerda - 1)
+    else:
+        removido = no
+        if no.esq is None:
+            return no.dir, removido
+        if no.dir is None:
+            return no.esq, removido
+        # O sucessor (primeiro da subárvore direita) ocupa o lugar do nó,
+        # o que mantém a ordem entre chaves repetidas
+        direita, sucessor = _remover_posicao(no.dir, 0)
+        sucessor.esq = no.esq
+        sucessor.dir = direita
+        no = sucessor
+    return _balancear(no), removido
+
+
+def _em_ordem(pilha: list, fim: Any | None = None):
+    """
+    Continua o percurso em ordem a partir de uma pilha de nós pendentes
+    (o topo é o próximo nó), até a maior chave não maior que fim.
+    """
+    while pilha:
+        no = pilha.pop()
+        if fim is not None and fim < no.chave:
+            return
+        yield no
+        cursor = no.dir
+        while cursor is not None:
+            pilha.append(cursor)
+            cursor = cursor.esq
+
+
+class ArvoreAVL:
+    """
+    Classe de objetos para armazenamento e gerenciamento de pares
+    chave/carga em uma árvore binária de busca balanceada (AVL).
+    Inserção e busca custam O(log n) e o percurso em ordem devolve as
+    cargas ordenadas pela chave.
+    Chaves repetidas são aceitas e mantêm a ordem de inserção entre si.
+    Cada nó guarda o tamanho da sua subárvore, o que permite o acesso, a
+    remoção e a busca da posição (em ordem, a partir de 0) em O(log n),
+    como em arvore[i], arvore[i:j] e del arvore[i].
+
+    A árvore guarda a sua espinha direita (o caminho até a maior chave),
+    o que torna baratas as inserções em ordem ou quase em ordem.
+
+    Atributos:
+        rapidas (int): pares anexados depois da maior chave da árvore, por
+            inserir ou por um lote ordenado de inserir_lote.
+        dedo (int): pares de inserir procurados a partir do fim da espinha
+            direita, por serem pouco menores que a maior chave.
+        lentas (int): pares de inserir procurados a partir da raiz e pares
+            de inserir_lote que precisaram ser ordenados e intercalados com
+            a árvore.
+    """
+
+    def __init__(self):
+        self.__raiz = None
+        self.__tamanho = 0
+        # Caminho da raiz até a maior chave; None quando precisa ser refeito
+        self.__espinha = []
+        self.rapidas = 0
+        self.dedo = 0
+        self.lentas = 0
+
+    @classmethod
+    def from_iterable(cls, pares) -> "ArvoreAVL":
+        """
+        Cria uma árvore a partir de pares (chave, carga), em lote (ver
+        inserir_lote).
+        Parâmetros:
+            pares: iterável de tuplas (chave, carga)
+        Retorno:
+            A nova árvore
+        """
+        arvore = cls()
+        arvore.extend(pares)
+        return arvore
+
+    def estaVazia(self) -> bool:
+        """
+        Verifica se a árvore está vazia
+        Retorno:
+          True se a árvore estiver vazia e False caso contrário
+        """
+        return self.__tamanho == 0
+
+    @property
+    def altura(self) -> int:
+        """
+        Retorna a altura da árvore (0 para a árvore vazia)
+        """
+        return _altura(self.__raiz)
+
+    def __obter_espinha(self) -> list:
+        """
+        Retorna a espinha direita (caminho da raiz até a maior chave),
+        refazendo-a se alguma operação a invalidou.
+        """
+        if self.__espinha is None:
+            espinha = []
+            cursor = self.__raiz
+            while cursor is not None:
+                espinha.append(cursor)
+                cursor = cursor.dir
+            self.__espinha = espinha
+        return self.__espinha
+
+    def __corrigir_espinha(self, i: int, raiz: NoAVL):
+        """
+        Atualiza a espinha depois de uma rotação no seu i-ésimo nó, que deu
+        lugar a raiz. A rotação só mexe nos dois níveis abaixo do nó, então
+        a espinha antiga volta a ser seguida em no máximo três passos.
+        """
+        espinha = self.__espinha
+        seguinte = espinha[i + 1] if i + 1 < len(espinha) else None
+        if raiz is seguinte:
+            # Rotação à esquerda, a de todo anexo que desbalanceia a espinha
+            del espinha[i]
+            return
+        depois = espinha[i + 2] if i + 2 < len(espinha) else None
+        novos = []
+        cursor = raiz
+        while cursor is not None and cursor is not seguinte and cursor is not depois:
+            novos.append(cursor)
+            cursor = cursor.dir
+        if cursor is None:
+            fim = len(espinha)
+        else:
+            fim = i + 1 if cursor is seguinte else i + 2
+        espinha[i:fim] = novos
+
+    def __rebalancear(self, caminho: list, na_espinha: int):
+        """
+        Rebalanceia, de baixo para cima, os nós de um caminho a partir da
+        raiz cuja subárvore cresceu. Os na_espinha primeiros nós do caminho
+        são os primeiros da espinha direita, corrigida a cada rotação.
+        """
+        for i in range(len(caminho) - 1, -1, -1):
+            no = caminho[i]
+            altura_anterior = no.altura
+            raiz = _balancear(no)
+            if i == 0:
+                self.__raiz = raiz
+            elif caminho[i - 1].esq is no:
+                caminho[i - 1].esq = raiz
+            else:
+                caminho[i - 1].dir = raiz
+            if raiz is not no and i < na_espinha:
+                self.__corrigir_espinha(i, raiz)
+            if raiz is no and no.altura == altura_anterior:
+                break
+
+    def inserir(self, chave: any, carga: any):
+        """
+        Insere uma carga na árvore, ordenada pela chave informada.
+
+        Uma chave não menor que a maior da árvore é anexada no fim da
+        espinha direita, sem comparações (caminho rápido). Uma chave um
+        pouco menor é procurada a partir do fim da espinha ("dedo"), em
+        O(log d) comparações para d elementos entre ela e a maior chave;
+        as demais descem a partir da raiz (caminho lento).
+        Parâmetros:
+            chave(any): a chave de ordenação
+            carga(any): a carga associada à chave
+        """
+        # Desce iterativamente guardando o caminho e rebalanceia na volta,
+        # evitando a recursão para árvores com milhões de nós.
+        novo = NoAVL(chave, carga)
+        self.__tamanho += 1
+        if self.__raiz is None:
+            self.__raiz = novo
+            self.__espinha = [novo]
+            self.rapidas += 1
+            return
+
+        espinha = self.__obter_espinha()
+        if not chave < espinha[-1].chave:
+            caminho = espinha.copy()
+            for no in caminho:
+                no.tamanho += 1
+            caminho[-1].dir = novo
+            espinha.append(novo)
+            self.rapidas += 1
+            self.__rebalancear(caminho, len(caminho))
+            return
+
+        # Sobe pela espinha até a primeira chave não maior que a nova: a
+        # descida a partir da raiz seguiria a espinha até ali e então
+        # entraria à esquerda do nó seguinte
+        j = len(espinha) - 2
+        while j >= 0 and chave < espinha[j].chave:
+            j -= 1
+        if j >= 0:
+            self.dedo += 1
+        else:
+            self.lentas += 1
+        caminho = espinha[: j + 1]
+        for no in caminho:
+            no.tamanho += 1
+        cursor = espinha[j + 1]
+        while cursor is not None:
+            # O novo nó entrará na subárvore de todos os nós do caminho
+            cursor.tamanho += 1
+            caminho.append(cursor)
+            cursor = cursor.esq if chave < cursor.chave else cursor.dir
+
+        pai = caminho[-1]
+        if chave < pai.chave:
+            pai.esq = novo
+        else:
+            pai.dir = novo
+        self.__rebalancear(caminho, j + 2)
+
+    def __juntar(self, pivo: NoAVL, direita: NoAVL | None):
+        """
+        Anexa à direita da árvore o nó pivo seguido da subárvore direita
+        (chaves não menores que as da árvore, altura no máximo uma acima da
+        dela), em O(log n): o pivo entra no lugar do primeiro nó da espinha
+        com altura compatível com a da subárvore e a espinha é rebalanceada.
+        """
+        espinha = self.__obter_espinha()
+        altura = _altura(direita)
+        i = 0
+        while i < len(espinha) and espinha[i].altura > altura + 1:
+            i += 1
+        pivo.esq = espinha[i] if i < len(espinha) else None
+        pivo.dir = direita
+        _atualizar(pivo)
+        acrescimo = pivo.tamanho - _tamanho(pivo.esq)
+
+        caminho = espinha[:i]
+        for no in caminho:
+            no.tamanho += acrescimo
+        if caminho:
+            caminho[-1].dir = pivo
+        else:
+            self.__raiz = pivo
+        del espinha[i:]
+        cursor = pivo
+        while cursor is not None:
+            espinha.append(cursor)
+            cursor = cursor.dir
+        self.__tamanho += acrescimo
+        self.__rebalancear(caminho, len(caminho))
+
+    def inserir_lote(self, chaves: list, cargas: list):
+        """
+        Insere vários pares chave/carga, com o mesmo resultado de inserir um
+        a um na ordem dada (chaves repetidas mantêm a ordem de inserção).
+
+        Um lote já ordenado que começa na maior chave da árvore (o arquivo
+        de pagamentos vem quase sempre ordenado pelo código do lançamento)
+        vira uma subárvore balanceada que é ligada à espinha direita, em
+        O(k + log n), sem percorrer a árvore (caminho rápido). Um lote
+        pequeno em relação à árvore é inserido um a um (ver inserir). Nos
+        demais casos os pares são ordenados, intercalados com o percurso em
+        ordem da árvore e a árvore é remontada balanceada em
+        O(n + k log k), em vez de k inserções com rebalanceamento.
+        Parâmetros:
+            chaves(list): as chaves de ordenação
+            cargas(list): as cargas, na mesma ordem das chaves
+        """
+        if len(chaves) != len(cargas):
+            raise ArvoreAVLError("Quantidades diferentes de chaves e cargas")
+        quantidade = len(chaves)
+        if not quantidade:
+            return
+
+        espinha = self.__obter_espinha()
+        if all(a <= b for a, b in pairwise(chaves)) and (
+            not espinha or not chaves[0] < espinha[-1].chave
+        ):
+            novos = list(zip(chaves, cargas))
+            direita = _construir(novos, 1, quantidade)
+            self.rapidas += quantidade
+            if _altura(direita) <= self.altura + 1:
+                self.__juntar(NoAVL(*novos[0]), direita)
+                return
+            # Árvore bem menor que o lote: remontar tudo também é O(k)
+            pares = list(self.intervalo())
+            pares.extend(novos)
+        elif quantidade * max(self.__tamanho.bit_length(), 1) < self.__tamanho:
+            for chave, carga in zip(chaves, cargas):
+                self.inserir(chave, carga)
+            return
+        else:
+            # sorted é estável: chaves iguais mantêm a ordem do lote, e
+            # heapq.merge põe as já existentes (inseridas antes) na frente
+            novos = sorted(zip(chaves, cargas), key=itemgetter(0))
+            pares = list(heapq.merge(self.intervalo(), novos, key=itemgetter(0)))
+            self.lentas += quantidade
+        self.__raiz = _construir(pares, 0, len(pares))
+        self.__tamanho = len(pares)
+        self.__espinha = None
+
+    def extend(self, pares):
+        """
+        Insere vários pares (chave, carga) de uma vez (ver inserir_lote).
+        Parâmetros:
+            pares: iterável de tuplas (chave, carga)
+        """
+        pares = list(pares)
+        self.inserir_lote([chave for chave, _ in pares], [carga for _, carga in pares])
+
+    def busca(self, chave: any) -> any:
+        """
+        Busca a carga associada a uma chave.
+        Parâmetros:
+            chave(any): a chave de busca
+        Retorno:
+            a carga associada à chave (a primeira inserida, se houver repetição)
+        Raises:
+            KeyError: se a chave não for encontrada
+        """
+        cursor = self.__raiz
+        encontrado = None
+        while cursor is not None:
+            if chave < cursor.chave:
+                cursor = cursor.esq
+            elif cursor.chave < chave:
+                cursor = cursor.dir
+            else:
+                # Continua à esquerda para achar a primeira ocorrência
+                encontrado = cursor
+                cursor = cursor.esq
+
+        if encontrado is None:
+            raise KeyError(f"A chave {chave} não está armazenada na árvore")
+        return encontrado.carga
+
+    def __contains__(self, chave: any) -> bool:
+        try:
+            self.busca(chave)
+            return True
+        except KeyError:
+            return False
+
+    def posicao(self, chave: any) -> int:
+        """
+        Retorna a posição (em ordem, a partir de 0) da primeira ocorrência
+        de uma chave, em O(log n).
+        Parâmetros:
+            chave(any): a chave de busca
+        Retorno:
+            a quantidade de chaves menores que a chave informada
+        Raises:
+            KeyError: se a chave não for encontrada
+        """
+        cursor = self.__raiz
+        menores = 0
+        encontrada = False
+        while cursor is not None:
+            if cursor.chave < chave:
+                menores += _tamanho(cursor.esq) + 1
+                cursor = cursor.dir
+            else:
+                encontrada = encontrada or not chave < cursor.chave
+                cursor = cursor.esq
+
+        if not encontrada:
+            raise KeyError(f"A chave {chave} não está armazenada na árvore")
+        return menores
+
+    def __normalizar(self, posicao: int) -> int:
+        if posicao < 0:
+            posicao += self.__tamanho
+        if not 0 <= posicao < self.__tamanho:
+            raise IndexError(
+                f"Posição inválida. A árvore contém {self.__tamanho} elementos"
+            )
+        return posicao
+
+    def __pilha_da_posicao(self, posicao: int) -> list:
+        """
+        Retorna a pilha de percurso em ordem (ver _em_ordem) cujo topo é o
+        nó da posição informada.
+        """
+        pilha = []
+        cursor = self.__raiz
+        while cursor is not None:
+            esquerda = _tamanho(cursor.esq)
+            if posicao <= esquerda:
+                pilha.append(cursor)
+                if posicao == esquerda:
+                    break
+                cursor = cursor.esq
+            else:
+                posicao -= esquerda + 1
+                cursor = cursor.dir
+        return pilha
+
+    def get(self, posicao: int) -> any:
+        """
+        Retorna a carga armazenada em uma posição (em ordem de chave, a
+        partir de 0; posições negativas contam a partir do final).
+        Parâmetros:
+            posicao(int): a posição do elemento desejado
+        Retorno:
+            a carga armazenada na posição
+        Raises:
+            IndexError: se a posição for inválida
+        """
+        return self.__pilha_da_posicao(self.__normalizar(posicao))[-1].carga
+
+    def remover(self, posicao: int) -> any:
+        """
+        Remove o elemento de uma posição (ver get), em O(log n).
+        Parâmetros:
+            posicao(int): a posição do elemento a ser removido
+        Retorno:
+            a carga do elemento removido
+        Raises:
+            IndexError: se a posição for inválida
+        """
+        posicao = self.__normalizar(posicao)
+        self.__raiz, removido = _remover_posicao(self.__raiz, posicao)
+        self.__tamanho -= 1
+        self.__espinha = None
+        return removido.carga
+
+    def __getitem__(self, posicao: int | slice):
+        """
+        Acesso por posição (ver get). Uma fatia devolve a lista das cargas,
+        em O(log n + k) quando o passo é positivo.
+        """
+        if not isinstance(posicao, slice):
+            return self.get(posicao)
+        inicio, fim, passo = posicao.indices(self.__tamanho)
+        if passo < 0:
+            return [self.get(i) for i in range(inicio, fim, passo)]
+        if inicio >= fim:
+            return []
+        nos = _em_ordem(self.__pilha_da_posicao(inicio))
+        return [no.carga for no in islice(nos, 0, fim - inicio, passo)]
+
+    def __delitem__(self, posicao: int):
+        """
+        Remove o elemento de uma posição (ver remover).
+        """
+        self.remover(posicao)
+
+    def intervalo(self, inicio: Any | None = None, fim: Any | None = None):
+        """
+        Percorre em ordem as cargas cujas chaves estão no intervalo
+        fechado [inicio, fim]. Um limite None deixa o intervalo aberto
+        daquele lado.
+        Parâmetros:
+            inicio(any): menor chave desejada
+            fim(any): maior chave desejada
+        Retorno:
+            gerador de tuplas (chave, carga) em ordem crescente de chave
+        Raises:
+            ArvoreAVLError: se inicio for maior que fim
+        """
+        if inicio is not None and fim is not None and fim < inicio:
+            raise ArvoreAVLError(f"Intervalo inválido: {inicio} > {fim}")
+
+        pilha = []
+        cursor = self.__raiz
+        # Desce à esquerda apenas enquanto a subárvore pode conter o início
+        while cursor is not None:
+            if inicio is not None and cursor.chave < inicio:
+                cursor = cursor.dir
+            else:
+                pilha.append(cursor)
+                cursor = cursor.esq
+        for no in _em_ordem(pilha, fim):
+            yield no.chave, no.carga
+
+    def iter_from(self, chave: any):
+        """
+        Percorre sob demanda as cargas a partir da primeira chave não menor
+        que a informada, em O(log n) até a primeira e O(1) amortizado por
+        carga seguinte.
+        Parâmetros:
+            chave(any): a chave inicial
+        Retorno:
+            gerador das cargas em ordem crescente de chave
+        """
+        for _, carga in self.intervalo(chave):
+            yield carga
+
+    def iter_between(self, inicio: any, fim: any):
+        """
+        Percorre sob demanda as cargas com chave no intervalo fechado
+        [inicio, fim] (ver iter_from).
+        Parâmetros:
+            inicio(any): menor chave desejada
+            fim(any): maior chave desejada
+        Retorno:
+            gerador das cargas em ordem crescente de chave
+        Raises:
+            ArvoreAVLError: se inicio for maior que fim
+        """
+        if fim < inicio:
+            raise ArvoreAVLError(f"Intervalo inválido: {inicio} > {fim}")
+        for _, carga in self.intervalo(inicio, fim):
+            yield carga
+
+    def __iter__(self):
+        """
+        Percorre as cargas em ordem crescente de chave
+        """
+        for _, carga in self.intervalo():
+            yield carga
+
+    def __reversed__(self):
+        pilha = []
+        cursor = self.__raiz
+        while pilha or cursor is not None:
+            while cursor is not None:
+                pilha.append(cursor)
+                cursor = cursor.dir
+            no = pilha.pop()
+            yield no.carga
+            cursor = no.esq
+
+    def __len__(self) -> int:
+        """
+        Retorna o número de elementos armazenados na árvore
+        """
+        return self.__tamanho
+
+    def __str__(self):
+        """
+        Retorna uma representação em string da árvore, em ordem
+        """
+        return "[ " + ", ".join(str(carga) for carga in self) + " ]"
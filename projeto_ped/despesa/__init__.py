@@ -1,4 +1,5 @@
+from .armazem import ArmazemDespesas
 from .despesa import Despesa
 from .gestor_despesas import GestorDespesas
 
-__all__ = ["Despesa", "GestorDespesas"]
+__all__ = ["ArmazemDespesas", "Despesa", "GestorDespesas"]
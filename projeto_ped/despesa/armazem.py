@@ -0,0 +1,260 @@
+from datetime import date
+
+import numpy as np
+
+from projeto_ped.gestores.credor.identificador import IdentificadorCredor
+from projeto_ped.utils.calendario import anos_dos_dias, como_dia, dia_para_data
+from projeto_ped.utils.pool import PoolStrings
+from projeto_ped.utils.vetor import VetorNumpy
+
+from .despesa import Despesa
+
+
+class ColunaTexto:
+    """
+    Coluna de texto codificada por dicionário.
+
+    Cada valor distinto é guardado uma única vez no pool da coluna; as
+    linhas guardam apenas o código inteiro (int32) do valor.
+    """
+
+    def __init__(self):
+        self.__codigos = VetorNumpy(np.int32)
+        self.__pool = PoolStrings()
+
+    def anexar(self, valor: str):
+        self.__codigos.anexar(self.__pool.codificar(valor))
+
+    def codigo_de(self, valor: str) -> int | None:
+        """
+        Retorna o código de um valor já registrado, ou None se ele não existir.
+        """
+        return self.__pool.codigo_de(valor)
+
+    def linhas_com(self, valor: str) -> np.ndarray:
+        """
+        Retorna as linhas que contêm o valor, comparando apenas códigos inteiros.
+        """
+        codigo = self.__pool.codigo_de(valor)
+        if codigo is None:
+            return np.empty(0, dtype=np.int64)
+        return np.flatnonzero(self.codigos == codigo)
+
+    @property
+    def codigos(self) -> np.ndarray:
+        return self.__codigos.valores
+
+    @property
+    def pool(self) -> PoolStrings:
+        return self.__pool
+
+    def estado(self) -> dict:
+        """
+        Retorna a coluna em forma compacta (códigos e textos distintos),
+        serializável entre processos.
+        """
+        return {"codigos": self.codigos.copy(), "valores": list(self.__pool.valores)}
+
+    def estender_estado(self, estado: dict):
+        """
+        Anexa as linhas de uma coluna parcial (ver estado), recodificando os
+        textos para o pool desta coluna.
+        """
+        mapa = np.fromiter(
+            (self.__pool.codificar(v) for v in estado["valores"]),
+            dtype=np.int32,
+            count=len(estado["valores"]),
+        )
+        if len(estado["codigos"]):
+            self.__codigos.estender(mapa[estado["codigos"]])
+
+    def __getitem__(self, linha: int) -> str:
+        return self.__pool[self.__codigos[linha]]
+
+    def __len__(self) -> int:
+        return len(self.__codigos)
+
+
+class ArmazemDespesas:
+    """
+    Armazenamento colunar das despesas.
+
+    Os campos numéricos ficam em arrays numpy (um por coluna) e os campos de
+    texto em colunas codificadas por dicionário. Objetos Despesa só são
+    criados quando uma linha é devolvida a quem consulta.
+
+    Attributes:
+        codigo_lancamento (np.ndarray): int64
+        codigo_organizacao_social (np.ndarray): int64
+        cpf_cpnj_credor (np.ndarray): int64, IdentificadorCredor compactado
+        dia_lancamento (np.ndarray): int32, dias desde 01/01/1970
+        valor (np.ndarray): int64, em centavos
+        registro (np.ndarray): int64, número do registro de origem no arquivo
+            (a partir de 0, sem o cabeçalho), ou -1 se desconhecido
+    """
+
+    def __init__(self):
+        self.__codigo_lancamento = VetorNumpy(np.int64)
+        self.__codigo_organizacao_social = VetorNumpy(np.int64)
+        self.__dia_lancamento = VetorNumpy(np.int32)
+        self.__valor = VetorNumpy(np.int64)
+        self.__competencia = ColunaTexto()
+        self.__codigo_categoria_despesa = ColunaTexto()
+        self.__cpf_cpnj_credor = VetorNumpy(np.int64)
+        self.__observacao_lancamento = ColunaTexto()
+        self.__registro = VetorNumpy(np.int64)
+
+    def adicionar(
+        self,
+        competencia: str,
+        codigo_organizacao_social: int,
+        codigo_lancamento: int,
+        data_lancamento: int | date,
+        codigo_categoria_despesa: str,
+        cpf_cpnj_credor: IdentificadorCredor,
+        valor_lancamento: int,
+        observacao_lancamento: str,
+        registro: int = -1,
+    ) -> int:
+        """
+        Adiciona um lançamento ao armazenamento. A data pode ser informada
+        como número de dias desde 01/01/1970 (ver DimensaoData) ou datetime.
+        `registro` é o número do registro de origem no arquivo, se houver.
+
+        Returns:
+            int: Número da linha (a partir de 0) do lançamento adicionado.
+        """
+        linha = self.__codigo_lancamento.anexar(codigo_lancamento)
+        self.__codigo_organizacao_social.anexar(codigo_organizacao_social)
+        self.__dia_lancamento.anexar(como_dia(data_lancamento))
+        self.__valor.anexar(valor_lancamento)
+        self.__competencia.anexar(competencia)
+        self.__codigo_categoria_despesa.anexar(codigo_categoria_despesa)
+        self.__cpf_cpnj_credor.anexar(cpf_cpnj_credor)
+        self.__observacao_lancamento.anexar(observacao_lancamento)
+        self.__registro.anexar(registro)
+        return linha
+
+    def despesa(self, linha: int) -> Despesa:
+        """
+        Cria o objeto Despesa correspondente a uma linha.
+        """
+        return Despesa(
+            self.__competencia[linha],
+            int(self.__codigo_organizacao_social[linha]),
+            int(self.__codigo_lancamento[linha]),
+            dia_para_data(self.__dia_lancamento[linha]),
+            self.__codigo_categoria_despesa[linha],
+            IdentificadorCredor.de_codigo(int(self.__cpf_cpnj_credor[linha])),
+            int(self.__valor[linha]),
+            self.__observacao_lancamento[linha],
+        )
+
+    def estado(self) -> dict:
+        """
+        Retorna as colunas em forma compacta (arrays numpy e colunas de texto
+        codificadas), serializável entre processos.
+        """
+        return {
+            "codigo_lancamento": self.codigo_lancamento.copy(),
+            "codigo_organizacao_social": self.codigo_organizacao_social.copy(),
+            "dia_lancamento": self.dia_lancamento.copy(),
+            "valor": self.valor.copy(),
+            "competencia": self.__competencia.estado(),
+            "codigo_categoria_despesa": self.__codigo_categoria_despesa.estado(),
+            "cpf_cpnj_credor": self.cpf_cpnj_credor.copy(),
+            "observacao_lancamento": self.__observacao_lancamento.estado(),
+            "registro": self.registro.copy(),
+        }
+
+    def estender_estado(self, estado: dict, registro_inicial: int = 0) -> range:
+        """
+        Anexa ao final as linhas de um armazenamento parcial (ver estado).
+        Os números de registro conhecidos são deslocados por
+        `registro_inicial` (registros do arquivo antes da parte).
+
+        Returns:
+            range: Linhas adicionadas.
+        """
+        inicio = len(self)
+        self.__codigo_lancamento.estender(estado["codigo_lancamento"])
+        self.__codigo_organizacao_social.estender(estado["codigo_organizacao_social"])
+        self.__dia_lancamento.estender(estado["dia_lancamento"])
+        self.__valor.estender(estado["valor"])
+        self.__competencia.estender_estado(estado["competencia"])
+        self.__codigo_categoria_despesa.estender_estado(
+            estado["codigo_categoria_despesa"]
+        )
+        self.__cpf_cpnj_credor.estender(estado["cpf_cpnj_credor"])
+        self.__observacao_lancamento.estender_estado(estado["observacao_lancamento"])
+        registros = np.asarray(estado["registro"], dtype=np.int64)
+        self.__registro.estender(
+            np.where(registros >= 0, registros + registro_inicial, -1)
+        )
+        return range(inicio, len(self))
+
+    # Colunas completas, sem cópia, para consultas vetorizadas
+    @property
+    def codigo_lancamento(self) -> np.ndarray:
+        return self.__codigo_lancamento.valores
+
+    @property
+    def codigo_organizacao_social(self) -> np.ndarray:
+        return self.__codigo_organizacao_social.valores
+
+    @property
+    def dia_lancamento(self) -> np.ndarray:
+        return self.__dia_lancamento.valores
+
+    @property
+    def valor(self) -> np.ndarray:
+        return self.__valor.valores
+
+    @property
+    def competencia(self) -> ColunaTexto:
+        return self.__competencia
+
+    @property
+    def codigo_categoria_despesa(self) -> ColunaTexto:
+        return self.__codigo_categoria_despesa
+
+    @property
+    def cpf_cpnj_credor(self) -> np.ndarray:
+        return self.__cpf_cpnj_credor.valores
+
+    @property
+    def observacao_lancamento(self) -> ColunaTexto:
+        return self.__observacao_lancamento
+
+    @property
+    def registro(self) -> np.ndarray:
+        return self.__registro.valores
+
+    def anos(self) -> np.ndarray:
+        """
+        Retorna o ano de lançamento de cada linha.
+        """
+        return anos_dos_dias(self.dia_lancamento).astype(np.int64)
+
+    def total(self) -> int:
+        """
+        Retorna a soma dos valores de todos os lançamentos, em centavos.
+        """
+        return int(self.valor.sum())
+
+    def total_por_ano(self) -> dict[int, int]:
+        """
+        Retorna a soma dos valores (em centavos) agrupada pelo ano do lançamento.
+        """
+        if len(self) == 0:
+            return {}
+        anos = self.anos()
+        primeiro = int(anos.min())
+        contagens = np.bincount(anos - primeiro)
+        # bincount com pesos soma em float64; np.add.at mantém a soma exata
+        totais = np.zeros(len(contagens), dtype=np.int64)
+        np.add.at(totais, anos - primeiro, self.valor)
+        return {primeiro + int(i): int(totais[i]) for i in np.flatnonzero(contagens)}
+
+    def __len__(self) -> int:
+        return len(self.__codigo_lancamento)
@@ -1,5 +1,8 @@
 from datetime import datetime
 
+from projeto_ped.gestores.credor.identificador import IdentificadorCredor
+from projeto_ped.utils.dinheiro import centavos_para_reais
+
 
 class Despesa:
     """
@@ -11,11 +14,22 @@ class Despesa:
         codigo_lancamento (int): Código do lançamento (coluna 4 do arquivo .csv).
         data_lancamento (datetime): Data do lançamento (coluna 5 do arquivo .csv).
         codigo_categoria_despesa (str): Código da categoria da despesa (coluna 9 do arquivo .csv).
-        cpf_cpnj_credor (str): CPF ou CNPJ do credor (coluna 11 do arquivo .csv).
-        valor (float): Valor do lançamento (coluna 13 do arquivo .csv).
+        cpf_cpnj_credor (IdentificadorCredor): CPF ou CNPJ do credor (coluna 11 do arquivo .csv).
+        valor (int): Valor do lançamento em centavos (coluna 13 do arquivo .csv).
         observacao_lancamento (str): Observação do lançamento (coluna 14 do arquivo .csv).
     """
 
+    __slots__ = (
+        "codigo_categoria_despesa",
+        "codigo_lancamento",
+        "codigo_organizacao_social",
+        "competencia",
+        "cpf_cpnj_credor",
+        "data_lancamento",
+        "observacao_lancamento",
+        "valor",
+    )
+
     def __init__(
         self,
         competencia: str,
@@ -23,8 +37,8 @@ class Despesa:
         codigo_lancamento: int,
         data_lancamento: datetime,
         codigo_categoria_despesa: str,
-        cpf_cpnj_credor: str,
-        valor_lancamento: float,
+        cpf_cpnj_credor: IdentificadorCredor,
+        valor_lancamento: int,
         observacao_lancamento: str,
     ):
         """
@@ -33,8 +47,8 @@ class Despesa:
         codigo_lancamento (int) = coluna[4];
         data_lancamento (datetime) = coluna[5];
         codigo_categoria_despesa (str) = coluna[9];
-        cpf_cpnj_credor (str) = coulna[11];
-        valor (float) = coluna[13];
+        cpf_cpnj_credor (IdentificadorCredor) = coulna[11];
+        valor (int, centavos) = coluna[13];
         observacao_lancamento (str) = coluna[14].
         """
         self.competencia = competencia
@@ -53,7 +67,7 @@ class Despesa:
         Returns:
             #str: String formatada com o código do lançamento, data e valor.
         """
-        return f'{self.codigo_lancamento}: {self.data_lancamento.strftime("%d/%m/%Y")} - R$ {self.valor:5.2f}'
+        return f'{self.codigo_lancamento}: {self.data_lancamento.strftime("%d/%m/%Y")} - R$ {centavos_para_reais(self.valor):5.2f}'
 
     # Método __str__ alternativo, retornando todos os atributos do objeto despesa
     """
@@ -64,7 +78,7 @@ class Despesa:
                 f"Data do Lançamento: {self.data_lancamento.strftime('%d/%m/%Y')}\n"
                 f"Código da Categoria da Despesa: {self.codigo_categoria_despesa}\n"
                 f"CPF/CNPJ do Credor: {self.cpf_cpnj_credor}\n"
-                f"Valor do Lançamento: R$ {self.valor:.2f}\n"
+                f"Valor do Lançamento: R$ {centavos_para_reais(self.valor):.2f}\n"
                 f"Observação do Lançamento: {self.observacao_lancamento}")
     """
 
@@ -1,52 +1,538 @@
+from datetime import date, datetime
+
+import numpy as np
+
+from projeto_ped.gestores.credor.identificador import IdentificadorCredor
+from projeto_ped.utils.calendario import como_dia
+from projeto_ped.utils.vetor import VetorNumpy
+
+from .armazem import ArmazemDespesas
+from .ArvoreAVL import ArvoreAVL
 from .despesa import Despesa
-from .ListaEncadeadaOrdenada import Lista, ListaError
+from .indice_texto import IndiceTexto, tokenizar
 
 
 class GestorDespesas:
     """
-    Classe responsável por gerenciar uma lista de despesas.
+    Classe responsável por gerenciar as despesas.
+
+    Os lançamentos ficam em um armazenamento colunar (arrays numpy e colunas
+    de texto codificadas por dicionário). Uma árvore AVL indexada pelo código
+    do lançamento aponta para a linha de cada despesa, o que garante inserção
+    e busca em O(log n) e percurso ordenado pelo código. Os lançamentos
+    novos entram na árvore em lote (ArvoreAVL.inserir_lote) na primeira
+    consulta depois da carga, e não um a um. Objetos Despesa só são criados
+    quando devolvidos. A árvore também dá acesso por posição na ordem do
+    código (gestor[i], gestor[i:j]) em O(log n), para paginar relatórios.
+
+    Índices invertidos (listas de linhas, em arrays compactos de inteiros)
+    por credor, organização social e categoria permitem recuperar os
+    lançamentos de uma chave sem percorrer todas as despesas.
+
+    Visões ordenadas por data e por valor (arrays de linhas ordenadas,
+    construídos sob demanda e descartados a cada inserção) respondem
+    consultas por faixa com busca binária, em O(log n + k).
+
+    Um índice invertido de texto sobre a observação do lançamento permite
+    buscas por termos (E/OU) e por frase sem percorrer as observações.
 
     Atributos:
-        despesas (list): Lista que armazena objetos do tipo Despesa.
+        despesas (ArvoreAVL): Índice código do lançamento -> linha no armazenamento.
+        armazem (ArmazemDespesas): Colunas com os dados dos lançamentos.
+        indice_texto (IndiceTexto): Índice dos termos das observações.
     """
 
     def __init__(self):
         """
         Inicializa uma instância da classe GestorDespesas.
 
-        Cria uma lista vazia para armazenar objetos do tipo Despesa.
+        Cria o armazenamento e o índice vazios.
         """
-        self.despesas = Lista()
+        self.armazem = ArmazemDespesas()
+        self.__arvore = ArvoreAVL()
+        # Linhas do armazenamento já inseridas na árvore; as demais estão pendentes
+        self.__na_arvore = 0
+        self.indice_texto = IndiceTexto()
+        self.__por_credor: dict[IdentificadorCredor, VetorNumpy] = {}
+        self.__por_organizacao: dict[int, VetorNumpy] = {}
+        self.__por_categoria: dict[str, VetorNumpy] = {}
+        # Visões ordenadas (cache): campo -> (linhas ordenadas, chaves ordenadas)
+        self.__ordens: dict[str, tuple[np.ndarray, np.ndarray]] = {}
 
     def adicionar_despesa(self, despesa: Despesa):
         """
-        Adiciona uma despesa à lista de despesas.
+        Adiciona uma despesa ao gestor.
+
+        Args:
+            despesa (Despesa): Objeto do tipo Despesa a ser adicionado.
+        """
+        self.adicionar_lancamento(
+            despesa.competencia,
+            despesa.codigo_organizacao_social,
+            despesa.codigo_lancamento,
+            despesa.data_lancamento,
+            despesa.codigo_categoria_despesa,
+            despesa.cpf_cpnj_credor,
+            despesa.valor,
+            despesa.observacao_lancamento,
+        )
+
+    def adicionar_lancamento(
+        self,
+        competencia: str,
+        codigo_organizacao_social: int,
+        codigo_lancamento: int,
+        data_lancamento: int | date,
+        codigo_categoria_despesa: str,
+        cpf_cpnj_credor: IdentificadorCredor,
+        valor_lancamento: int,
+        observacao_lancamento: str,
+        registro: int = -1,
+    ) -> int:
+        """
+        Adiciona um lançamento a partir dos seus campos, sem criar um objeto Despesa.
+        A data pode ser o número de dias desde 01/01/1970 (ver DimensaoData) e
+        `registro` é o número do registro de origem no arquivo, se houver.
+
+        Returns:
+            int: Linha do lançamento no armazenamento.
+        """
+        linha = self.armazem.adicionar(
+            competencia,
+            codigo_organizacao_social,
+            codigo_lancamento,
+            data_lancamento,
+            codigo_categoria_despesa,
+            cpf_cpnj_credor,
+            valor_lancamento,
+            observacao_lancamento,
+            registro,
+        )
+        self.__ordens.clear()
+        self.indice_texto.adicionar(linha, observacao_lancamento)
+        self.__indexar(self.__por_credor, cpf_cpnj_credor, linha)
+        self.__indexar(self.__por_organizacao, codigo_organizacao_social, linha)
+        self.__indexar(self.__por_categoria, codigo_categoria_despesa, linha)
+        return linha
+
+    @property
+    def despesas(self) -> ArvoreAVL:
+        """
+        Árvore código do lançamento -> linha, com os lançamentos pendentes
+        já inseridos.
+        """
+        if self.__na_arvore < len(self.armazem):
+            linhas = np.arange(self.__na_arvore, len(self.armazem))
+            self.__arvore.inserir_lote(
+                self.armazem.codigo_lancamento[linhas].tolist(), linhas.tolist()
+            )
+            self.__na_arvore = len(self.armazem)
+        return self.__arvore
+
+    def estado(self) -> dict:
+        """
+        Retorna o estado parcial do gestor (colunas do armazenamento e índice
+        de texto), serializável entre processos.
+        """
+        return {
+            "armazem": self.armazem.estado(),
+            "indice_texto": self.indice_texto.estado(),
+        }
+
+    def merge_estado(self, estado: dict, registro_inicial: int = 0):
+        """
+        Anexa os lançamentos de um gestor parcial (ver estado) ao final deste,
+        atualizando a árvore e os índices. Combinando os estados na ordem do
+        arquivo, o resultado é o mesmo da carga sequencial.
 
         Args:
-            despesa (Despesa): Objeto do tipo Despesa a ser adicionado à lista.
+            registro_inicial (int): Registros do arquivo antes da parte, somados
+                aos números de registro dos lançamentos dela.
+        """
+        linhas = self.armazem.estender_estado(estado["armazem"], registro_inicial)
+        if not linhas:
+            return
+        self.__ordens.clear()
+        self.indice_texto.merge_estado(estado["indice_texto"], linhas.start)
+        linhas = np.arange(linhas.start, linhas.stop, dtype=np.int32)
+
+        self.__indexar_lote(
+            self.__por_credor,
+            self.armazem.cpf_cpnj_credor[linhas],
+            linhas,
+            IdentificadorCredor.de_codigo,
+        )
+        self.__indexar_lote(
+            self.__por_organizacao,
+            self.armazem.codigo_organizacao_social[linhas],
+            linhas,
+            int,
+        )
+        categorias = self.armazem.codigo_categoria_despesa
+        self.__indexar_lote(
+            self.__por_categoria,
+            categorias.codigos[linhas],
+            linhas,
+            lambda codigo: categorias.pool[codigo],
+        )
+
+    def merge(self, other: "GestorDespesas"):
+        """
+        Anexa os lançamentos de outro gestor ao final deste (ver merge_estado).
+        """
+        self.merge_estado(other.estado())
+
+    @staticmethod
+    def __indexar_lote(indice: dict, chaves: np.ndarray, linhas: np.ndarray, chave_de):
+        """
+        Versão em lote de __indexar: agrupa as linhas por chave (ordenação
+        estável, preservando a ordem das linhas) e estende cada lista uma vez.
         """
-        self.despesas.inserir(despesa)
+        ordem = np.argsort(chaves, kind="stable")
+        distintas, inicios = np.unique(chaves[ordem], return_index=True)
+        fins = np.append(inicios[1:], len(ordem))
+        for bruta, inicio, fim in zip(distintas.tolist(), inicios, fins):
+            chave = chave_de(bruta)
+            lista = indice.get(chave)
+            if lista is None:
+                lista = indice[chave] = VetorNumpy(np.int32, capacidade=16)
+            lista.estender(linhas[ordem[inicio:fim]])
+
+    @staticmethod
+    def __indexar(indice: dict, chave, linha: int):
+        lista = indice.get(chave)
+        if lista is None:
+            lista = indice[chave] = VetorNumpy(np.int32, capacidade=16)
+        lista.anexar(linha)
+
+    @staticmethod
+    def __linhas(indice: dict, chave) -> np.ndarray:
+        lista = indice.get(chave)
+        if lista is None:
+            return np.empty(0, dtype=np.int32)
+        return lista.valores
 
-    def busca(self, despesa: Despesa) -> Despesa | None:
+    def linhas_filtradas(
+        self,
+        credor: IdentificadorCredor | str | None = None,
+        organizacao: int | None = None,
+        categoria: str | None = None,
+    ) -> np.ndarray:
         """
-        Busca uma despesa na lista com base em um objeto de referência.
+        Retorna as linhas dos lançamentos que atendem a todas as chaves
+        informadas (interseção dos índices invertidos).
 
         Args:
-            despesa (Despesa): Objeto do tipo Despesa usado como referência para a busca.
+            credor (IdentificadorCredor | str | None): CPF/CNPJ do credor.
+            organizacao (int | None): Código da organização social.
+            categoria (str | None): Código da categoria da despesa.
 
         Returns:
-            Despesa: O objeto Despesa encontrado na lista, ou None se não for encontrado.
+            np.ndarray: Linhas no armazenamento, em ordem crescente.
+
+        Raises:
+            ValueError: Se nenhuma chave for informada ou se o CPF/CNPJ for inválido.
+        """
+        listas = []
+        if credor is not None:
+            listas.append(
+                self.__linhas(self.__por_credor, IdentificadorCredor.parse(credor))
+            )
+        if organizacao is not None:
+            listas.append(self.__linhas(self.__por_organizacao, organizacao))
+        if categoria is not None:
+            listas.append(self.__linhas(self.__por_categoria, categoria))
+        if not listas:
+            raise ValueError("Informe ao menos uma chave de filtro")
+
+        # Interseção começando pela menor lista
+        listas.sort(key=len)
+        linhas = listas[0]
+        for outra in listas[1:]:
+            linhas = np.intersect1d(linhas, outra, assume_unique=True)
+        return linhas
+
+    def despesas_filtradas(
+        self,
+        credor: IdentificadorCredor | str | None = None,
+        organizacao: int | None = None,
+        categoria: str | None = None,
+    ) -> list[Despesa]:
+        """
+        Retorna as despesas que atendem a todas as chaves informadas,
+        ordenadas pelo código do lançamento.
+
+        Args:
+            credor (IdentificadorCredor | str | None): CPF/CNPJ do credor.
+            organizacao (int | None): Código da organização social.
+            categoria (str | None): Código da categoria da despesa.
+
+        Returns:
+            list[Despesa]: Despesas encontradas.
+        """
+        linhas = self.linhas_filtradas(credor, organizacao, categoria)
+        ordem = np.argsort(self.armazem.codigo_lancamento[linhas], kind="stable")
+        return [self.armazem.despesa(linha) for linha in linhas[ordem]]
+
+    def despesas_por_credor(self, credor: IdentificadorCredor | str) -> list[Despesa]:
+        """
+        Retorna as despesas pagas a um credor (CPF/CNPJ).
+        """
+        return self.despesas_filtradas(credor=credor)
+
+    def despesas_por_organizacao(self, organizacao: int) -> list[Despesa]:
+        """
+        Retorna as despesas de uma organização social.
+        """
+        return self.despesas_filtradas(organizacao=organizacao)
+
+    def despesas_por_categoria(self, categoria: str) -> list[Despesa]:
+        """
+        Retorna as despesas de uma categoria.
+        """
+        return self.despesas_filtradas(categoria=categoria)
+
+    def busca(self, chave: int | Despesa) -> Despesa | None:
+        """
+        Busca uma despesa pelo código do lançamento.
+
+        Args:
+            chave (int | Despesa): Código do lançamento, ou um objeto Despesa
+                cujo código será usado como referência para a busca.
+
+        Returns:
+            Despesa: O objeto Despesa encontrado, ou None se não for encontrado.
+        """
+        if isinstance(chave, Despesa):
+            chave = chave.codigo_lancamento
+        try:
+            return self.armazem.despesa(self.despesas.busca(chave))
+        except KeyError:
+            return None
+
+    def registro(self, chave: int | Despesa) -> int | None:
+        """
+        Retorna o número do registro de origem de um lançamento no arquivo
+        (a partir de 0, sem o cabeçalho), para reler a linha original (ver
+        IndiceRegistros). None se o lançamento não existir ou não tiver vindo
+        de um arquivo.
+        """
+        if isinstance(chave, Despesa):
+            chave = chave.codigo_lancamento
+        try:
+            registro = int(self.armazem.registro[self.despesas.busca(chave)])
+        except KeyError:
+            return None
+        return registro if registro >= 0 else None
+
+    def intervalo(self, inicio: int | None = None, fim: int | None = None):
+        """
+        Percorre, em ordem, as despesas com código de lançamento entre
+        inicio e fim (inclusive).
+
+        Args:
+            inicio (int | None): Menor código desejado. None para não limitar.
+            fim (int | None): Maior código desejado. None para não limitar.
+
+        Returns:
+            Gerador de objetos Despesa ordenados pelo código do lançamento.
+        """
+        for _, linha in self.despesas.intervalo(inicio, fim):
+            yield self.armazem.despesa(linha)
+
+    def iter_from(self, codigo: int):
+        """
+        Percorre sob demanda, em ordem, as despesas a partir do primeiro
+        código de lançamento não menor que o informado, sem percorrer as
+        anteriores nem criar a lista do resultado.
+
+        Returns:
+            Gerador de objetos Despesa ordenados pelo código do lançamento.
+        """
+        for linha in self.despesas.iter_from(codigo):
+            yield self.armazem.despesa(linha)
+
+    def iter_between(self, inicio: int, fim: int):
+        """
+        Percorre sob demanda, em ordem, as despesas com código de lançamento
+        entre inicio e fim (inclusive).
+
+        Returns:
+            Gerador de objetos Despesa ordenados pelo código do lançamento.
+
+        Raises:
+            ArvoreAVLError: Se inicio for maior que fim.
+        """
+        for linha in self.despesas.iter_between(inicio, fim):
+            yield self.armazem.despesa(linha)
+
+    def posicao(self, chave: int | Despesa) -> int | None:
+        """
+        Retorna a posição de um lançamento na ordem do código (a partir de
+        0), ou None se ele não existir.
+        """
+        if isinstance(chave, Despesa):
+            chave = chave.codigo_lancamento
+        try:
+            return self.despesas.posicao(chave)
+        except KeyError:
+            return None
+
+    def __getitem__(self, posicao: int | slice) -> Despesa | list[Despesa]:
+        """
+        Retorna a despesa de uma posição na ordem do código do lançamento
+        (ver ArvoreAVL.get), ou a lista das despesas de uma fatia, o que
+        permite paginar as despesas sem percorrê-las desde o início.
+
+        Raises:
+            IndexError: Se a posição for inválida.
+        """
+        linhas = self.despesas[posicao]
+        if isinstance(posicao, slice):
+            return [self.armazem.despesa(linha) for linha in linhas]
+        return self.armazem.despesa(linhas)
+
+    def __ordem(self, campo: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Retorna as linhas ordenadas por data ou por valor, junto com as
+        chaves já ordenadas. Empates são desfeitos pelo código do lançamento.
+        """
+        visao = self.__ordens.get(campo)
+        if visao is None:
+            if campo == "data":
+                chave = self.armazem.dia_lancamento
+            else:
+                chave = self.armazem.valor
+            ordem = np.lexsort((self.armazem.codigo_lancamento, chave))
+            visao = (ordem, chave[ordem])
+            self.__ordens[campo] = visao
+        return visao
+
+    def __faixa(self, campo: str, minimo, maximo) -> np.ndarray:
+        ordem, valores = self.__ordem(campo)
+        inicio = 0 if minimo is None else np.searchsorted(valores, minimo, "left")
+        fim = (
+            len(ordem) if maximo is None else np.searchsorted(valores, maximo, "right")
+        )
+        return ordem[inicio:fim]
+
+    def despesas_entre_datas(
+        self, inicio: datetime | None = None, fim: datetime | None = None
+    ) -> list[Despesa]:
+        """
+        Retorna as despesas lançadas entre duas datas (inclusive),
+        ordenadas pela data.
+
+        Args:
+            inicio (datetime | None): Data inicial. None para não limitar.
+            fim (datetime | None): Data final. None para não limitar.
+
+        Returns:
+            list[Despesa]: Despesas encontradas.
+        """
+        linhas = self.__faixa(
+            "data",
+            None if inicio is None else como_dia(inicio),
+            None if fim is None else como_dia(fim),
+        )
+        return [self.armazem.despesa(linha) for linha in linhas]
+
+    def despesas_por_valor(
+        self, minimo: int | None = None, maximo: int | None = None
+    ) -> list[Despesa]:
+        """
+        Retorna as despesas com valor entre minimo e maximo (inclusive),
+        em ordem crescente de valor.
+
+        Args:
+            minimo (int | None): Menor valor desejado, em centavos. None para não limitar.
+            maximo (int | None): Maior valor desejado, em centavos. None para não limitar.
+
+        Returns:
+            list[Despesa]: Despesas encontradas.
+        """
+        linhas = self.__faixa("valor", minimo, maximo)
+        return [self.armazem.despesa(linha) for linha in linhas]
+
+    def maiores_despesas(self, n: int) -> list[Despesa]:
+        """
+        Retorna as n despesas de maior valor, da maior para a menor.
+        """
+        if n <= 0:
+            return []
+        linhas = self.__ordem("valor")[0][-n:][::-1]
+        return [self.armazem.despesa(linha) for linha in linhas]
+
+    def pesquisar_observacao(
+        self, consulta: str, modo: str = "e", apenas_contagem: bool = False
+    ) -> list[Despesa] | int:
+        """
+        Pesquisa termos na observação dos lançamentos. A busca ignora
+        acentos e maiúsculas/minúsculas.
+
+        Args:
+            consulta (str): Termos a pesquisar.
+            modo (str): "e" (todos os termos), "ou" (algum dos termos) ou
+                "frase" (os termos juntos e na ordem informada).
+            apenas_contagem (bool): Se True, retorna apenas a quantidade de
+                lançamentos encontrados, sem criar os objetos Despesa.
+
+        Returns:
+            list[Despesa] | int: Despesas ordenadas pelo código do lançamento,
+            ou a quantidade delas.
+
+        Raises:
+            ValueError: Se o modo for inválido.
+        """
+        if modo == "ou":
+            linhas = self.indice_texto.buscar_algum(consulta)
+        elif modo in ("e", "frase"):
+            linhas = self.indice_texto.buscar_todos(consulta)
+        else:
+            raise ValueError(f"Modo de pesquisa inválido: {modo}")
+
+        if modo == "frase":
+            # O índice não guarda posições: confirma a frase nos candidatos
+            frase = " " + " ".join(tokenizar(consulta)) + " "
+            observacoes = self.armazem.observacao_lancamento
+            linhas = np.array(
+                [
+                    linha
+                    for linha in linhas.tolist()
+                    if frase in " " + " ".join(tokenizar(observacoes[linha])) + " "
+                ],
+                dtype=np.int64,
+            )
+        if apenas_contagem:
+            return len(linhas)
+
+        ordem = np.argsort(self.armazem.codigo_lancamento[linhas], kind="stable")
+        return [self.armazem.despesa(linha) for linha in linhas[ordem].tolist()]
+
+    def total(self) -> int:
+        """
+        Retorna a soma dos valores de todas as despesas, em centavos (vetorizada).
+        """
+        return self.armazem.total()
+
+    def total_por_ano(self) -> dict[int, int]:
+        """
+        Retorna a soma dos valores das despesas, em centavos, agrupada por ano (vetorizada).
+        """
+        return self.armazem.total_por_ano()
+
+    def __iter__(self):
+        """
+        Percorre as despesas em ordem crescente de código do lançamento.
         """
-        for d in self.despesas:
-            if d == despesa:
-                return d
-        return None
+        for linha in self.despesas:
+            yield self.armazem.despesa(linha)
 
     def __len__(self):
         """
-        Retorna o número de despesas armazenadas na lista.
+        Retorna o número de despesas armazenadas.
 
         Returns:
-            int: Número de despesas na lista.
+            int: Número de despesas armazenadas.
         """
-        return len(self.despesas)
+        return len(self.armazem)
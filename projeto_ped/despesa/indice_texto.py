@@ -0,0 +1,179 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+import numpy as np
+
+from projeto_ped.utils.vetor import VetorNumpy
+
+_PADRAO_TERMO = re.compile(r"[a-z0-9]+")
+
+
+def normalizar(texto: str) -> str:
+    """
+    Remove acentos e converte o texto para minúsculas
+    ("MANUTENÇÃO" -> "manutencao").
+    """
+    decomposto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in decomposto if not unicodedata.combining(c)).lower()
+
+
+@lru_cache(maxsize=65536)
+def tokenizar(texto: str) -> tuple[str, ...]:
+    """
+    Divide o texto normalizado em termos alfanuméricos.
+    Textos repetidos (muito comuns nas observações) são tokenizados uma vez.
+    """
+    return tuple(_PADRAO_TERMO.findall(normalizar(texto)))
+
+
+def comprimir(codigos: np.ndarray) -> bytes:
+    """
+    Comprime uma lista ordenada de códigos: guarda as diferenças entre
+    códigos consecutivos em varint (7 bits por byte, bit alto indica
+    continuação).
+    """
+    deltas = np.diff(codigos, prepend=0).astype(np.uint64)
+    grupos = np.ones(len(deltas), dtype=np.int64)
+    resto = deltas >> np.uint64(7)
+    while resto.any():
+        grupos += resto > 0
+        resto >>= np.uint64(7)
+
+    saida = np.zeros(int(grupos.sum()), dtype=np.uint8)
+    inicios = np.cumsum(grupos) - grupos
+    for g in range(int(grupos.max(initial=0))):
+        mascara = grupos > g
+        byte = (deltas[mascara] >> np.uint64(7 * g)) & np.uint64(0x7F)
+        continua = grupos[mascara] - 1 > g
+        saida[inicios[mascara] + g] = byte.astype(np.uint8) | (continua * 0x80).astype(
+            np.uint8
+        )
+    return saida.tobytes()
+
+
+def descomprimir(dados: bytes) -> np.ndarray:
+    """
+    Operação inversa de comprimir, vetorizada.
+    """
+    if not dados:
+        return np.empty(0, dtype=np.int64)
+    b = np.frombuffer(dados, dtype=np.uint8)
+    fim = (b & 0x80) == 0
+    grupo = np.concatenate(([0], np.cumsum(fim)[:-1]))
+    inicios = np.flatnonzero(np.concatenate(([True], fim[:-1])))
+    deslocamento = (np.arange(len(b)) - inicios[grupo]) * 7
+    deltas = np.zeros(len(inicios), dtype=np.uint64)
+    np.add.at(
+        deltas, grupo, (b & 0x7F).astype(np.uint64) << deslocamento.astype(np.uint64)
+    )
+    return np.cumsum(deltas).astype(np.int64)
+
+
+class IndiceTexto:
+    """
+    Índice invertido de texto: termo normalizado -> linhas (no armazenamento
+    do GestorDespesas) dos lançamentos em que ele aparece. O índice guarda
+    linhas e não códigos de lançamento porque um mesmo código pode se repetir
+    com observações diferentes.
+
+    Durante a carga as linhas são anexadas em vetores numpy; ao consultar
+    (ou ao chamar compactar) cada lista é ordenada, sem repetições, e
+    guardada comprimida (deltas em varint).
+    """
+
+    def __init__(self):
+        self.__pendentes: dict[str, VetorNumpy] = {}
+        self.__comprimidas: dict[str, bytes] = {}
+
+    def adicionar(self, linha: int, texto: str):
+        """
+        Indexa os termos de um texto para a linha informada.
+        """
+        for termo in set(tokenizar(texto)):
+            lista = self.__pendentes.get(termo)
+            if lista is None:
+                lista = self.__pendentes[termo] = VetorNumpy(np.int64, capacidade=16)
+            lista.anexar(linha)
+
+    def compactar(self):
+        """
+        Move as listas pendentes para a forma comprimida.
+        """
+        for termo in list(self.__pendentes):
+            self.__compactar_termo(termo)
+
+    def __compactar_termo(self, termo: str):
+        pendente = self.__pendentes.pop(termo, None)
+        if pendente is None:
+            return
+        linhas = pendente.valores
+        if termo in self.__comprimidas:
+            linhas = np.concatenate((descomprimir(self.__comprimidas[termo]), linhas))
+        self.__comprimidas[termo] = comprimir(np.unique(linhas))
+
+    def linhas(self, termo: str) -> np.ndarray:
+        """
+        Retorna as linhas (ordenadas) dos lançamentos que contêm o termo.
+        """
+        termos = tokenizar(termo)
+        if len(termos) != 1:
+            return self.buscar_todos(termo)
+        self.__compactar_termo(termos[0])
+        return descomprimir(self.__comprimidas.get(termos[0], b""))
+
+    def buscar_todos(self, consulta: str) -> np.ndarray:
+        """
+        Retorna as linhas que contêm todos os termos da consulta (E).
+        """
+        listas = [self.linhas(t) for t in set(tokenizar(consulta))]
+        if not listas:
+            return np.empty(0, dtype=np.int64)
+        listas.sort(key=len)
+        resultado = listas[0]
+        for outra in listas[1:]:
+            resultado = np.intersect1d(resultado, outra, assume_unique=True)
+        return resultado
+
+    def buscar_algum(self, consulta: str) -> np.ndarray:
+        """
+        Retorna as linhas que contêm ao menos um termo da consulta (OU).
+        """
+        listas = [self.linhas(t) for t in set(tokenizar(consulta))]
+        if not listas:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(listas))
+
+    def estado(self) -> dict[str, np.ndarray]:
+        """
+        Retorna o índice em forma serializável: termo -> linhas.
+        """
+        termos = self.__comprimidas.keys() | self.__pendentes.keys()
+        estado = {}
+        for termo in termos:
+            self.__compactar_termo(termo)
+            estado[termo] = descomprimir(self.__comprimidas[termo])
+        return estado
+
+    def merge_estado(self, estado: dict[str, np.ndarray], deslocamento: int = 0):
+        """
+        Acrescenta as linhas de um índice parcial (ver estado), somando
+        `deslocamento` (a linha em que os lançamentos da parte começam). As
+        listas são unidas, sem repetições, na próxima consulta ao termo.
+        """
+        for termo, linhas in estado.items():
+            lista = self.__pendentes.get(termo)
+            if lista is None:
+                lista = self.__pendentes[termo] = VetorNumpy(
+                    np.int64, capacidade=max(len(linhas), 16)
+                )
+            lista.estender(np.asarray(linhas, dtype=np.int64) + deslocamento)
+
+    def merge(self, other: "IndiceTexto", deslocamento: int = 0):
+        self.merge_estado(other.estado(), deslocamento)
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de termos distintos indexados.
+        """
+        return len(self.__comprimidas.keys() | self.__pendentes.keys())
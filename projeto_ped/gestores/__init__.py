@@ -1,13 +1,25 @@
 from .categoria_despesa import CategoriaDespesa, GestorCategoriasDespesas
-from .credor import Credor, GestaoCredor, desmascarar_cpf
+from .credor import (
+    Credor,
+    DesmascaradorCPF,
+    GestaoCredor,
+    IdentificadorCredor,
+    ValidadorCredores,
+    desmascarador,
+    desmascarar_cpf,
+)
 from .organizacao_social import GestorOrgs, OrganizacaoSocial
 
 __all__ = [
-    "GestorCategoriasDespesas",
     "CategoriaDespesa",
     "Credor",
+    "DesmascaradorCPF",
     "GestaoCredor",
-    "desmascarar_cpf",
+    "GestorCategoriasDespesas",
     "GestorOrgs",
+    "IdentificadorCredor",
     "OrganizacaoSocial",
+    "ValidadorCredores",
+    "desmascarador",
+    "desmascarar_cpf",
 ]
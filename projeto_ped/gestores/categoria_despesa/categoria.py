@@ -1,6 +1,9 @@
 """Módulo para representação de categorias de despesas e gestão de registros financeiros."""
 
-from datetime import datetime
+from datetime import date
+
+from projeto_ped.utils.acumulador import LinhaAnual
+from projeto_ped.utils.calendario import ano_do_dia, como_dia
 
 
 class CategoriaDespesa:
@@ -9,30 +12,30 @@ class CategoriaDespesa:
     Attributes:
         codigo_categoria: Código único identificador da categoria
         categoria: Nome descritivo da categoria
-        ocorrencias: Dicionário dos anos em que a categoria aparece com o valor gasto no ano
+        ocorrencias: Dicionário dos anos em que a categoria aparece com o valor gasto no ano (em centavos)
     """
 
+    __slots__ = ("_categoria", "_codigo_categoria", "_receitas")
+
     def __init__(
         self,
         cod_categoria: str,
         categoria: str,
+        receitas: LinhaAnual | None = None,
     ) -> None:
         self._codigo_categoria = cod_categoria
         self._categoria = categoria
-        self._ocorrencias: dict[int, float] = {}
+        # Totais por ano: linha da categoria na matriz do gestor, ou própria
+        self._receitas = receitas if receitas is not None else LinhaAnual()
 
-    def add_receita(self, data_lancamento: datetime, valor: float) -> None:
+    def add_receita(self, data_lancamento: int | date, valor: int) -> None:
         """Adiciona um novo valor à categoria no ano especificado.
 
         Args:
-            data_lancamento: Data do registro financeiro
-            valor: Valor monetário a ser adicionado
+            data_lancamento: Data do registro financeiro (dias desde 01/01/1970 ou date)
+            valor: Valor monetário a ser adicionado, em centavos
         """
-        ano = data_lancamento.year
-        if ano not in self._ocorrencias:
-            self._ocorrencias[ano] = valor
-        else:
-            self._ocorrencias[ano] += valor
+        self._receitas.acumular(ano_do_dia(como_dia(data_lancamento)), valor)
 
     @property
     def codigo_categoria(self) -> str:
@@ -47,11 +50,11 @@ class CategoriaDespesa:
         return self._categoria
 
     @property
-    def ocorrencias(self) -> dict[int, float]:
-        return self._ocorrencias.copy()
+    def ocorrencias(self) -> dict[int, int]:
+        return self._receitas.por_ano()
 
     def __str__(self):
-        return f"{self._categoria}: {self._ocorrencias}"
+        return f"{self._categoria}: {self.ocorrencias}"
 
     def __lt__(self, other):  # <
         return self.codigo_categoria < other.codigo_categoria
@@ -1,6 +1,13 @@
 """Módulo para gestão de categorias de despesas e análise de registros financeiros."""
 
-from datetime import datetime
+from datetime import date
+
+import numpy as np
+
+from projeto_ped.utils.acumulador import AcumuladorAnual, LinhaAnual
+from projeto_ped.utils.calendario import ano_do_dia, como_dia
+from projeto_ped.utils.dimensao import Dimensao
+from projeto_ped.utils.pool import PoolStrings
 
 from .categoria import CategoriaDespesa
 
@@ -8,12 +15,35 @@ from .categoria import CategoriaDespesa
 class GestorCategoriasDespesas:
     """Gerencia categorias de despesas.
 
+    Cada categoria recebe um id denso da dimensão de categorias; os totais
+    por ano ficam em uma matriz (id x ano) endereçada diretamente por ele.
+    Gestores parciais podem ser combinados com merge/merge_estado.
+
     Attributes:
         categorias: Lista de tuplas contendo códigos e nomes de categorias
     """
 
-    def __init__(self) -> None:
-        self.__categorias: dict[str, CategoriaDespesa] = {}
+    def __init__(self, dimensao: Dimensao | None = None) -> None:
+        self.__ids = dimensao if dimensao is not None else Dimensao("categorias")
+        self.__categorias: list[CategoriaDespesa | None] = []  # índice: id denso
+        self.__receitas = AcumuladorAnual()  # matriz id x ano
+        self.__quantidade = 0
+        self.__nomes = PoolStrings()  # nomes das categorias, sem cópias repetidas
+
+    def __indice(self, cod: str) -> int:
+        """Retorna o id denso de uma categoria cadastrada.
+
+        Raises:
+            KeyError: Se o código não existir
+        """
+        indice = self.__ids.buscar(cod)
+        if (
+            indice is None
+            or indice >= len(self.__categorias)
+            or self.__categorias[indice] is None
+        ):
+            raise KeyError(cod)
+        return indice
 
     @property
     def categorias(self) -> list[tuple[str, str]]:
@@ -24,17 +54,31 @@ class GestorCategoriasDespesas:
         """
 
         lista: list[tuple[str, str]] = []
-        for k, v in self.__categorias.items():
-            lista.append((k, v.categoria))
+        for v in self.__categorias:
+            if v is not None:
+                lista.append((v.codigo_categoria, v.categoria))
 
         return lista
 
+    def __garantir_categoria(self, cod_cat: str, cat: str) -> int:
+        indice = self.__ids.id_de(cod_cat)
+        if indice >= len(self.__categorias):
+            self.__categorias.extend([None] * (indice + 1 - len(self.__categorias)))
+        if self.__categorias[indice] is None:
+            self.__categorias[indice] = CategoriaDespesa(
+                cod_cat,
+                self.__nomes.internar(cat),
+                LinhaAnual(self.__receitas, indice),
+            )
+            self.__quantidade += 1
+        return indice
+
     def add(
         self,
         cod_cat: str,
         cat: str,
-        date: datetime,
-        valor: float,
+        data: int | date,
+        valor: int,
     ) -> None:
         """Adiciona um novo registro financeiro à categoria especificada.
 
@@ -43,17 +87,61 @@ class GestorCategoriasDespesas:
         Args:
             cod_cat: Código único da categoria
             cat: Nome descritivo da categoria
-            date: Data do registro financeiro
-            valor: Valor monetário da transação
+            data: Data do registro financeiro (dias desde 01/01/1970 ou date)
+            valor: Valor monetário da transação, em centavos
+        """
+
+        indice = self.__garantir_categoria(cod_cat, cat)
+        self.__receitas.acumular(indice, ano_do_dia(como_dia(data)), valor)
+
+    def estado(self) -> dict:
+        """Retorna o estado parcial compacto do gestor, serializável entre processos.
+
+        As categorias são identificadas pelo código (chave natural), pois os
+        ids densos de gestores diferentes não coincidem.
+
+        Returns:
+            dict com codigos (list[str]), nomes (list[str]) e receitas
+            (estado do AcumuladorAnual, nas mesmas posições)
         """
+        linhas = [i for i, c in enumerate(self.__categorias) if c is not None]
+        return {
+            "codigos": [self.__categorias[i].codigo_categoria for i in linhas],
+            "nomes": [self.__categorias[i].categoria for i in linhas],
+            "receitas": self.__receitas.estado(linhas),
+        }
 
-        if cod_cat not in self.__categorias:
-            self.__categorias[cod_cat] = CategoriaDespesa(cod_cat, cat)
+    def merge_estado(self, estado: dict) -> None:
+        """Combina um estado parcial com este gestor, somando os totais por ano.
 
-        self.__categorias[cod_cat].add_receita(
-            date,
-            valor,
+        A soma é associativa e comutativa; para uma categoria presente nos
+        dois lados, o nome já cadastrado prevalece.
+
+        Args:
+            estado: Estado produzido por estado()
+        """
+        indices = np.fromiter(
+            (
+                self.__garantir_categoria(cod, nome)
+                for cod, nome in zip(estado["codigos"], estado["nomes"])
+            ),
+            dtype=np.int64,
+            count=len(estado["codigos"]),
         )
+        self.__receitas.somar_estado(estado["receitas"], indices)
+
+    def merge(self, other: "GestorCategoriasDespesas") -> None:
+        """Combina outro gestor com este (ver merge_estado)."""
+        self.merge_estado(other.estado())
+
+    @classmethod
+    def de_estado(
+        cls, estado: dict, dimensao: Dimensao | None = None
+    ) -> "GestorCategoriasDespesas":
+        """Reconstrói um gestor a partir de um estado parcial."""
+        gestor = cls(dimensao)
+        gestor.merge_estado(estado)
+        return gestor
 
     def busca_categoria(self, cod: str) -> CategoriaDespesa:
         """Retorna o objeto CodigoCategoria especificado como argumento.
@@ -68,9 +156,9 @@ class GestorCategoriasDespesas:
         Raises:
             KeyError: Se o código não existir
         """
-        return self.__categorias[cod]
+        return self.__categorias[self.__indice(cod)]
 
-    def receitas(self, cod: str) -> dict[int, float]:
+    def receitas(self, cod: str) -> dict[int, int]:
         """Obtém o histórico completo de ocorrências de anos e totais registrados
            para a categoria especificada.
 
@@ -78,13 +166,13 @@ class GestorCategoriasDespesas:
             cod (str): Código da categoria a consultar
 
         Returns:
-            dict[int, float]
+            dict[int, int]
                 - Dicionário com a chave correspondente ao ano
                 - Os valores correspondentes ao total por ano
         """
-        return self.__categorias[cod]._ocorrencias.copy()
+        return self.__receitas.por_ano(self.__indice(cod))
 
-    def total_receitas(self, cod: str) -> float:
+    def total_receitas(self, cod: str) -> int:
         """Retorna o total de de valores acumulados em todos os anos de uma categoria.
 
         Args:
@@ -93,9 +181,9 @@ class GestorCategoriasDespesas:
         Returns:
             Dicionário no formato {ano: valor_total}
         """
-        return sum(self.__categorias[cod]._ocorrencias.values())
+        return self.__receitas.total(self.__indice(cod))
 
-    def receitas_em_um_ano(self, cod: str, year: int) -> float:
+    def receitas_em_um_ano(self, cod: str, year: int) -> int:
         """Obtém o total acumulado em uma categoria específica durante um ano.
 
         Args:
@@ -108,7 +196,7 @@ class GestorCategoriasDespesas:
         Errors:
             KeyError: Se o ano especificado não existir na categoria
         """
-        return self.__categorias[cod]._ocorrencias[year]
+        return self.__receitas.valor(self.__indice(cod), year)
 
     def __len__(self):
-        return len(self.__categorias)
+        return self.__quantidade
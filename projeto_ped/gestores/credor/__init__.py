@@ -1,5 +1,17 @@
-from .cpf import desmascarar_cpf
+from .cpf import DesmascaradorCPF, desmascarador, desmascarar_cpf
 from .credor import Credor
 from .gestao import GestaoCredor
+from .identificador import IdentificadorCredor
+from .validacao import DESCRICAO_MOTIVOS, ValidadorCredores, validar_identificadores
 
-__all__ = ["desmascarar_cpf", "Credor", "GestaoCredor"]
+__all__ = [
+    "DESCRICAO_MOTIVOS",
+    "Credor",
+    "DesmascaradorCPF",
+    "GestaoCredor",
+    "IdentificadorCredor",
+    "ValidadorCredores",
+    "desmascarador",
+    "desmascarar_cpf",
+    "validar_identificadores",
+]
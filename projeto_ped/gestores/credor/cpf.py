@@ -1,4 +1,17 @@
 import re
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+# Padrão do CPF mascarado na fonte: ***.123.456-**
+_PADRAO_MASCARADO = re.compile(r"\*{3}\.\d{3}\.\d{3}-\*{2}")
+
+# Pesos dos dígitos verificadores do CPF
+_PESOS_DV1 = np.arange(10, 1, -1)
+_PESOS_DV2 = np.arange(11, 1, -1)
+
+# Estatísticas do cache, nos moldes de functools.lru_cache().cache_info()
+InfoCache = namedtuple("InfoCache", ["acertos", "falhas", "maximo", "tamanho"])
 
 
 def calcular_digito_verificador(cpf_base: str) -> str:
@@ -17,16 +30,206 @@ def calcular_digito_verificador(cpf_base: str) -> str:
     return primeiro_dv + segundo_dv
 
 
-def desmascarar_cpf(cpf_mascarado: str) -> str:
-    """
-    Substitui os asteriscos em um CPF mascarado pelo cálculo correto dos dígitos verificadores.
-    """
+def _desmascarar(cpf_mascarado: str) -> str:
     if len(cpf_mascarado) != 14:
         return cpf_mascarado
-    if not re.match(r"\*{3}\.\d{3}\.\d{3}-\*{2}", cpf_mascarado):
+    if not _PADRAO_MASCARADO.fullmatch(cpf_mascarado):
         raise ValueError("Formato inválido de CPF mascarado")
 
     cpf_base = "000" + cpf_mascarado[4:7] + cpf_mascarado[8:11]
     digitos_verificadores = calcular_digito_verificador(cpf_base)
 
     return f"000.{cpf_base[3:6]}.{cpf_base[6:9]}-{digitos_verificadores}"
+
+
+class DesmascaradorCPF:
+    """
+    Serviço de desmascaramento de CPFs com cache limitado.
+
+    O mesmo CPF mascarado se repete milhares de vezes no arquivo de
+    pagamentos; o cache (LRU, indexado pelo texto mascarado) evita refazer a
+    validação e o cálculo dos dígitos verificadores a cada linha. Colunas
+    inteiras são desmascaradas de uma vez por desmascarar_lote (usado pela
+    validação da carga, ver ValidadorCredores), que consulta o mesmo cache e
+    só calcula, vetorizados, os CPFs que não estão nele.
+
+    Attributes
+    ----------
+    acertos : int
+        Consultas respondidas pelo cache.
+    falhas : int
+        Consultas que precisaram calcular o CPF.
+    taxa_acertos : float
+        Fração das consultas respondidas pelo cache.
+    """
+
+    def __init__(self, tamanho_cache: int = 65536):
+        """
+        Parameters
+        ----------
+        tamanho_cache : int
+            Quantidade máxima de CPFs mantidos no cache.
+        """
+        self.__maximo = tamanho_cache
+        self.__cache: OrderedDict[str, str] = OrderedDict()
+        self.__acertos = 0
+        self.__falhas = 0
+
+    def __guardar(self, cpf_mascarado: str, cpf: str):
+        self.__cache[cpf_mascarado] = cpf
+        if len(self.__cache) > self.__maximo:
+            self.__cache.popitem(last=False)
+
+    def desmascarar(self, cpf_mascarado: str) -> str:
+        """
+        Substitui os asteriscos em um CPF mascarado pelo cálculo correto dos
+        dígitos verificadores. Textos que não têm 14 caracteres (CNPJs, CPFs
+        sem máscara...) são devolvidos sem alteração.
+
+        Raises
+        ------
+        ValueError
+            Se o texto tiver 14 caracteres e não for um CPF mascarado.
+        """
+        if len(cpf_mascarado) != 14:
+            return cpf_mascarado
+        cpf = self.__cache.get(cpf_mascarado)
+        if cpf is not None:
+            self.__cache.move_to_end(cpf_mascarado)
+            self.__acertos += 1
+            return cpf
+        self.__falhas += 1
+        cpf = _desmascarar(cpf_mascarado)
+        self.__guardar(cpf_mascarado, cpf)
+        return cpf
+
+    def desmascarar_lote(self, cpfs) -> list[str]:
+        """
+        Desmascara uma coluna inteira de uma vez. Os textos que já estão no
+        cache vêm dele; os demais (cada texto distinto uma vez) têm os
+        dígitos verificadores calculados com aritmética vetorizada (numpy) e
+        entram no cache. Cada texto de 14 caracteres conta como uma
+        consulta; as repetições de um texto calculado no lote são acertos.
+
+        Parameters
+        ----------
+        cpfs : sequência de str
+            Textos a desmascarar.
+
+        Returns
+        -------
+        list[str]
+            Textos desmascarados, na mesma ordem.
+
+        Raises
+        ------
+        ValueError
+            Se algum texto tiver 14 caracteres e não for um CPF mascarado.
+        """
+        textos = list(cpfs)
+        novos: dict[str, list[int]] = {}
+        acertos = 0
+        for posicao, texto in enumerate(textos):
+            if len(texto) != 14:
+                continue
+            cpf = self.__cache.get(texto)
+            if cpf is not None:
+                self.__cache.move_to_end(texto)
+                textos[posicao] = cpf
+                acertos += 1
+            else:
+                novos.setdefault(texto, []).append(posicao)
+        if novos:
+            calculados = self.__calcular(list(novos))
+            for (texto, posicoes), cpf in zip(novos.items(), calculados):
+                self.__guardar(texto, cpf)
+                for posicao in posicoes:
+                    textos[posicao] = cpf
+                # As repetições no lote são respondidas pelo cache
+                acertos += len(posicoes) - 1
+        self.__acertos += acertos
+        self.__falhas += len(novos)
+        return textos
+
+    @staticmethod
+    def __calcular(textos: list[str]) -> list[str]:
+        """
+        Desmascara CPFs mascarados (todos com 14 caracteres), vetorizado.
+
+        Raises
+        ------
+        ValueError
+            Se algum texto não for um CPF mascarado.
+        """
+        try:
+            brutos = np.array(textos, dtype="S14")
+        except UnicodeEncodeError:
+            raise ValueError("Formato inválido de CPF mascarado")
+        m = brutos.view(np.uint8).reshape(len(textos), 14)
+
+        digitos = m[:, [4, 5, 6, 8, 9, 10]].astype(np.int64) - ord("0")
+        valido = (
+            (m[:, [0, 1, 2, 12, 13]] == ord("*")).all(axis=1)
+            & (m[:, 3] == ord("."))
+            & (m[:, 7] == ord("."))
+            & (m[:, 11] == ord("-"))
+            & ((digitos >= 0) & (digitos <= 9)).all(axis=1)
+        )
+        if not valido.all():
+            raise ValueError("Formato inválido de CPF mascarado")
+
+        # Base de 9 dígitos: "000" + 6 dígitos visíveis
+        base = np.zeros((len(textos), 9), dtype=np.int64)
+        base[:, 3:] = digitos
+        resto = (base @ _PESOS_DV1) % 11
+        dv1 = np.where(resto < 2, 0, 11 - resto)
+        resto = (np.column_stack((base, dv1)) @ _PESOS_DV2) % 11
+        dv2 = np.where(resto < 2, 0, 11 - resto)
+
+        saida = m.copy()
+        saida[:, 0:3] = ord("0")
+        saida[:, 12] = dv1 + ord("0")
+        saida[:, 13] = dv2 + ord("0")
+        return [cpf.decode("ascii") for cpf in saida.reshape(-1).view("S14")]
+
+    def cache_info(self) -> InfoCache:
+        """
+        Acertos, falhas, tamanho máximo e tamanho atual do cache.
+        """
+        return InfoCache(
+            self.__acertos, self.__falhas, self.__maximo, len(self.__cache)
+        )
+
+    @property
+    def acertos(self) -> int:
+        return self.cache_info().acertos
+
+    @property
+    def falhas(self) -> int:
+        return self.cache_info().falhas
+
+    @property
+    def taxa_acertos(self) -> float:
+        info = self.cache_info()
+        consultas = info.acertos + info.falhas
+        return info.acertos / consultas if consultas else 0.0
+
+    def limpar_cache(self):
+        """
+        Esvazia o cache e zera os contadores.
+        """
+        self.__cache.clear()
+        self.__acertos = 0
+        self.__falhas = 0
+
+
+# Serviço compartilhado usado por desmascarar_cpf
+desmascarador = DesmascaradorCPF()
+
+
+def desmascarar_cpf(cpf_mascarado: str) -> str:
+    """
+    Substitui os asteriscos em um CPF mascarado pelo cálculo correto dos dígitos verificadores.
+    Usa o cache do serviço compartilhado `desmascarador`.
+    """
+    return desmascarador.desmascarar(cpf_mascarado)
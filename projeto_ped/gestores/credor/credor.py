@@ -1,15 +1,23 @@
+from projeto_ped.utils.acumulador import LinhaAnual
+
+from .identificador import IdentificadorCredor
+
+
 class Credor:
     """
     Classe que representa o objeto Credor.
 
     Attributes
     ----------
-    identificador : str
-            Recebe um CPF ou CNPJ.
+    identificador : IdentificadorCredor
+            CPF ou CNPJ compactado em um inteiro.
 
     nome_credor : str
             Recebe o nome do Credor.
 
+    receitas : dict[int, int]
+            Totais recebidos por ano. Chave: ano, Valor: total em centavos
+
     Methods
     -------
     __str__ :
@@ -18,31 +26,60 @@ class Credor:
 
     """
 
-    def __init__(self, identificador: str, nome_credor: str):
+    __slots__ = ("_receitas", "identificador", "nome_credor")
+
+    def __init__(
+        self,
+        identificador: IdentificadorCredor | str,
+        nome_credor: str,
+        receitas: LinhaAnual | None = None,
+    ):
         """
         Parameters
         ----------
-        identificador : str
-            Recebe um CPF ou CNPJ.
+        identificador : IdentificadorCredor | str
+            Recebe um CPF ou CNPJ (texto com ou sem máscara é convertido).
 
         nome_credor : str
             Recebe o nome do Credor.
 
+        receitas : LinhaAnual | None
+            Linha do credor na matriz de totais por ano do gestor. Se não
+            for informada, o credor mantém seus próprios totais.
+
         Raises
         ------
         TypeError: Se o parâmetro estiver com o tipo errado.
+        ValueError: Se o texto não for um CPF/CNPJ válido.
         """
 
-        if type(identificador) is str and type(nome_credor) is str:
-            self.identificador = identificador
+        if (
+            isinstance(identificador, (str, IdentificadorCredor))
+            and type(nome_credor) is str
+        ):
+            self.identificador = IdentificadorCredor.parse(identificador)
             self.nome_credor = nome_credor
-            self.receitas: dict[int, float] = (
-                {}
-            )  # Dicionário de Receitas. Chave: ano, Valor: float
+            self._receitas = receitas if receitas is not None else LinhaAnual()
 
         else:
             raise TypeError("Objeto Credor declarado com parâmetro do tipo errado.")
 
+    @property
+    def receitas(self) -> dict[int, int]:
+        """
+        Dicionário de Receitas. Chave: ano, Valor: total em centavos
+        """
+        return self._receitas.por_ano()
+
+    def vincular(self, receitas: LinhaAnual):
+        """
+        Passa a guardar os totais na linha informada (a linha do credor na
+        matriz do gestor), transferindo os totais que o credor já tinha.
+        """
+        for ano, valor in self._receitas.por_ano().items():
+            receitas.acumular(ano, valor)
+        self._receitas = receitas
+
     def __str__(self):
         """
         Retorna uma representação em str do objeto Credor.
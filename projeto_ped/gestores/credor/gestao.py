@@ -1,23 +1,45 @@
-from datetime import datetime
+from datetime import date
+
+import numpy as np
+
+from projeto_ped.utils.acumulador import AcumuladorAnual, LinhaAnual
+from projeto_ped.utils.calendario import ano_do_dia, como_dia
+from projeto_ped.utils.dimensao import Dimensao
+from projeto_ped.utils.pool import PoolStrings
 
 from .credor import Credor
+from .identificador import IdentificadorCredor
 
 
 class GestaoCredor:
     """
     Classe que representa o objeto GestaoCredor.
 
+    Cada credor recebe um id denso da dimensão de credores; os objetos
+    Credor e os totais por ano (matriz id x ano) são endereçados
+    diretamente por esse id. A chave natural é o IdentificadorCredor (CPF/CNPJ
+    compactado em um inteiro); métodos que recebem o identificador também
+    aceitam o CPF/CNPJ em texto, com ou sem máscara.
+
     Attributes
     ----------
-    self.credores : Lista()
-        Lista que possui os credores sem repetição.
-
-    self.receitas : Lista()
-        Lista que possui as receitas anuais dos credores.
+    self.credores : dict[IdentificadorCredor, Credor]
+        Credores sem repetição. Chave: CPF/CNPJ, Valor: Credor.
 
 
     Methods
     -------
+    upsert:
+        Cadastra o credor na primeira vez em que aparece e soma o valor ao
+        total do ano.
+
+    upsert_lote:
+        Versão de upsert para colunas inteiras de lançamentos.
+
+    estado / merge_estado / merge:
+        Estado parcial serializável e combinação de gestores parciais
+        (por exemplo, produzidos por processos diferentes).
+
     adicionar_credor:
         Adiciona um credor na lista de credores.
 
@@ -52,53 +74,222 @@ class GestaoCredor:
 
     """
 
-    def __init__(self):
+    def __init__(self, dimensao: Dimensao | None = None):
         """
         Classe que representa o objeto GestaoCredor.
 
-        Attributes
+        Parameters
+        ----------
+        dimensao : Dimensao | None
+            Dimensão de credores compartilhada (IdentificadorCredor -> id denso).
+
+        """
+        self.__ids = dimensao if dimensao is not None else Dimensao("credores")
+        self.__credores: list[Credor | None] = []  # índice: id denso
+        self.__receitas = AcumuladorAnual()  # matriz id x ano
+        self.__quantidade = 0
+        self.__nomes = PoolStrings()  # nomes dos credores, sem cópias repetidas
+
+    def __indice(self, identificador: IdentificadorCredor | str) -> int | None:
+        """
+        Retorna o id denso de um credor cadastrado, ou None.
+        """
+        try:
+            identificador = IdentificadorCredor.parse(identificador)
+        except ValueError:
+            return None
+        indice = self.__ids.buscar(identificador)
+        if (
+            indice is None
+            or indice >= len(self.__credores)
+            or self.__credores[indice] is None
+        ):
+            return None
+        return indice
+
+    @property
+    def credores(self) -> dict[IdentificadorCredor, Credor]:
+        """
+        Credores sem repetição. Chave: CPF/CNPJ, Valor: Credor.
+        """
+        return {c.identificador: c for c in self.__credores if c is not None}
+
+    def totais(self, ano: int | None = None) -> tuple[list[Credor | None], np.ndarray]:
+        """
+        Retorna os credores (na ordem dos ids) e o array com o total de cada
+        um, em um ano ou em todos os anos. Posições sem credor ficam None.
+        """
+        if ano is None:
+            valores = self.__receitas.totais()
+        else:
+            valores = self.__receitas.coluna(ano)
+        credores = self.__credores[: len(valores)]
+        return credores, valores
+
+    def __cadastrar(self, indice: int, credor: Credor):
+        if indice >= len(self.__credores):
+            self.__credores.extend([None] * (indice + 1 - len(self.__credores)))
+        credor.nome_credor = self.__nomes.internar(credor.nome_credor)
+        credor.vincular(LinhaAnual(self.__receitas, indice))
+        self.__credores[indice] = credor
+        self.__quantidade += 1
+
+    def __cadastrado(self, indice: int) -> bool:
+        return indice < len(self.__credores) and self.__credores[indice] is not None
+
+    def upsert(
+        self, identificador: IdentificadorCredor, nome: str, ano: int, valor: int
+    ) -> int:
+        """
+        Soma um lançamento ao total anual do credor. O objeto Credor só é
+        criado na primeira vez em que o identificador aparece.
+
+        Parameters
         ----------
-        self.credores : Lista()
-            Lista que possui os credores sem repetição.
+        identificador : IdentificadorCredor
+            CPF/CNPJ do credor (texto também é aceito e convertido).
+
+        nome : str
+            Nome do credor, usado apenas no cadastro.
+
+        ano : int
+            Ano do lançamento.
 
-        self.receitas : Lista()
-            Lista que possui as receitas anuais dos credores.
+        valor : int
+            Valor do lançamento, em centavos.
 
+        Returns
+        ----------
+        int: id denso do credor.
+        """
+        if not isinstance(identificador, IdentificadorCredor):
+            identificador = IdentificadorCredor.parse(identificador)
+        indice = self.__ids.id_de(identificador)
+        if not self.__cadastrado(indice):
+            self.__cadastrar(indice, Credor(identificador, nome))
+        self.__receitas.acumular(indice, ano, valor)
+        return indice
+
+    def upsert_lote(self, identificadores, nomes, anos, valores) -> np.ndarray:
         """
-        self.credores: dict[str, Credor] = {}  # chave: identificador, valor: Credor
+        Versão de upsert para colunas inteiras de lançamentos: os credores
+        novos são cadastrados e os valores somados à matriz de uma só vez.
+
+        Parameters
+        ----------
+        identificadores : sequência de IdentificadorCredor
+        nomes : sequência de str
+        anos : array-like de int
+        valores : array-like de int (centavos)
+
+        Returns
+        ----------
+        np.ndarray: ids densos dos credores, na ordem das linhas.
+        """
+        identificadores = [
+            i if isinstance(i, IdentificadorCredor) else IdentificadorCredor.parse(i)
+            for i in identificadores
+        ]
+        indices = self.__ids.ids_de(identificadores)
+        for posicao, indice in enumerate(indices.tolist()):
+            if not self.__cadastrado(indice):
+                self.__cadastrar(
+                    indice, Credor(identificadores[posicao], nomes[posicao])
+                )
+        self.__receitas.acumular_muitos(indices, anos, valores)
+        return indices
+
+    def estado(self) -> dict:
+        """
+        Retorna o estado parcial compacto do gestor, para ser combinado com
+        outro gestor (merge_estado), inclusive em outro processo. Os credores
+        são identificados pela chave natural (CPF/CNPJ compactado), pois os
+        ids densos de gestores diferentes não coincidem.
+
+        Returns
+        ----------
+        dict: identificadores (np.ndarray int64), nomes (list[str]) e
+              receitas (estado do AcumuladorAnual, nas mesmas posições).
+        """
+        linhas = [i for i, c in enumerate(self.__credores) if c is not None]
+        return {
+            "identificadores": np.array(
+                [int(self.__credores[i].identificador) for i in linhas], dtype=np.int64
+            ),
+            "nomes": [self.__credores[i].nome_credor for i in linhas],
+            "receitas": self.__receitas.estado(linhas),
+        }
+
+    def merge_estado(self, estado: dict):
+        """
+        Combina um estado parcial (ver estado) com este gestor: os totais por
+        ano são somados e os credores novos são cadastrados.
+
+        A soma dos totais é associativa e comutativa. Para um credor presente
+        nos dois lados, o nome já cadastrado prevalece; combinando os estados
+        na ordem do arquivo, o resultado é o mesmo da carga sequencial.
+        """
+        indices = np.empty(len(estado["identificadores"]), dtype=np.int64)
+        for posicao, (codigo, nome) in enumerate(
+            zip(estado["identificadores"].tolist(), estado["nomes"])
+        ):
+            identificador = IdentificadorCredor.de_codigo(codigo)
+            indice = self.__ids.id_de(identificador)
+            if not self.__cadastrado(indice):
+                self.__cadastrar(indice, Credor(identificador, nome))
+            indices[posicao] = indice
+        self.__receitas.somar_estado(estado["receitas"], indices)
+
+    def merge(self, other: "GestaoCredor"):
+        """
+        Combina outro gestor com este (ver merge_estado).
+        """
+        self.merge_estado(other.estado())
+
+    @classmethod
+    def de_estado(
+        cls, estado: dict, dimensao: Dimensao | None = None
+    ) -> "GestaoCredor":
+        """
+        Reconstrói um gestor a partir de um estado parcial.
+        """
+        gestor = cls(dimensao)
+        gestor.merge_estado(estado)
+        return gestor
 
     def adicionar_credor(
-        self, credor: Credor, data_lancamento: str, valor_lancamento: float
+        self, credor: Credor, data_lancamento: str | int | date, valor_lancamento: int
     ):
         """
         Método que adiciona um Credor na lista de Credores.
 
         Método que adiciona uma Receita anual na lista de receitas.
 
+        Prefira upsert, que recebe o ano diretamente e não precisa de um
+        objeto Credor por lançamento.
+
         Parameters
         ----------
         credor : Credor
             Objeto Credor(Identificador + Nome do Credor)
 
-        data_lancamento : str
-            Data lançada pelo Credor.
+        data_lancamento : str | int | date
+            Data lançada pelo Credor: "AAAA-MM-DD", dias desde 01/01/1970
+            (ver DimensaoData) ou date.
 
-        valor_lancamento : float
-            Valor lançado pelo Credor.
+        valor_lancamento : int
+            Valor lançado pelo Credor, em centavos.
 
         """
+        if isinstance(data_lancamento, str):
+            ano = int(data_lancamento[:4])
+        else:
+            ano = ano_do_dia(como_dia(data_lancamento))
 
-        data = datetime.strptime(data_lancamento, "%Y-%m-%d")
-
-        try:
-            credor_recuperado = self.credores[credor.identificador]
-            try:
-                credor_recuperado.receitas[data.year] += valor_lancamento
-            except KeyError:
-                credor_recuperado.receitas[data.year] = valor_lancamento
-        except KeyError:
-            self.credores[credor.identificador] = credor
-            credor.receitas[data.year] = valor_lancamento
+        indice = self.__ids.id_de(credor.identificador)
+        if not self.__cadastrado(indice):
+            self.__cadastrar(indice, credor)
+        self.__receitas.acumular(indice, ano, valor_lancamento)
 
         # try:
         #     posicao = self.credores.busca(credor)
@@ -145,27 +336,23 @@ class GestaoCredor:
         #         self.alterar_receita(
         #             data.year, busca.identificador, valor_lancamento)
 
-    def buscar_credor(self, identificador: str) -> Credor | None:
+    def buscar_credor(self, identificador: IdentificadorCredor | str) -> Credor | None:
         """
         Método para buscar um credor na lista de credores.
 
         Parameters
         ----------
-        identificador : str
+        identificador : IdentificadorCredor | str
             Recebe um CPF ou CNPJ.
 
         Returns
         ----------
         Credor | None: Retorna o objeto Credor se encontrado, senão retorna None.
-
-        Raises
-        ----------
-        TypeError: Se o identificador não for do tipo str.
         """
-        try:
-            return self.credores[identificador]
-        except KeyError:
+        indice = self.__indice(identificador)
+        if indice is None:
             return None
+        return self.__credores[indice]
         # if type(identificador) == str:
         #     for credor in self.credores:
         #         if credor.identificador == identificador:
@@ -181,15 +368,15 @@ class GestaoCredor:
         ----------
         Retorna o tamanho da lista de credores.
         """
-        return self.credores.__len__()
+        return self.__quantidade
 
-    def obter_valor_total(self, identificador: str):
+    def obter_valor_total(self, identificador: IdentificadorCredor | str):
         """
         Método para consultar o valor total (de todos os anos) lançado pelo Credor.
 
         Parameters
         ----------
-        identificador : str
+        identificador : IdentificadorCredor | str
             Recebe um CPF ou CNPJ.
 
         Returns
@@ -200,10 +387,10 @@ class GestaoCredor:
         ----------
         KeyError: Se o identificador não existir
         """
-        try:
-            return sum(self.credores[identificador].receitas.values())
-        except KeyError:
+        indice = self.__indice(identificador)
+        if indice is None:
             raise KeyError(f"id {identificador} não está cadastrado")
+        return self.__receitas.total(indice)
 
         # if type(identificador) == str:
         #     valor_total = 0
@@ -228,23 +415,26 @@ class GestaoCredor:
         ----------
         Formato : Identificador - Nome do Credor
         """
-        for id in sorted(self.credores.keys()):
-            print(f"{id} - {self.credores[id].nome_credor}")
+        credores = self.credores
+        for id in sorted(credores.keys()):
+            print(f"{id} - {credores[id].nome_credor}")
 
-    def obter_receita_anual(self, identificador: str, ano: int) -> float:
+    def obter_receita_anual(
+        self, identificador: IdentificadorCredor | str, ano: int
+    ) -> int:
         """
         Retorna o total de receitas do ano passado como parâmetro.
 
         Parameters
         ----------
-        identificador : str
+        identificador : IdentificadorCredor | str
             Recebe um CPF ou CNPJ.
         ano : int
             Recebe um ano
 
         Returns
         ----------
-        o total de receitas do ano passado como parâmetro.
+        o total de receitas (em centavos) do ano passado como parâmetro.
 
         Raises
         ----------
@@ -254,7 +444,10 @@ class GestaoCredor:
         """
         try:
             assert ano > 0
-            return self.credores[identificador].receitas[ano]
+            indice = self.__indice(identificador)
+            if indice is None:
+                raise KeyError(identificador)
+            return self.__receitas.valor(indice, ano)
         except KeyError:
             raise KeyError(f"Ano {ano} não está cadastrado")
         except AssertionError:
@@ -269,22 +462,27 @@ class GestaoCredor:
         #     raise TypeError(
         #         'O valor fornecido para o ano não é do tipo necessário.')
 
-    def obter_receitas_todos_os_anos(self, identificador: str) -> dict:
+    def obter_receitas_todos_os_anos(
+        self, identificador: IdentificadorCredor | str
+    ) -> dict:
         """
         Retorna todas as receitas de um determinado credor.
 
         Parameters
         ----------
-        identificador : str
+        identificador : IdentificadorCredor | str
             Recebe um CPF ou CNPJ.
 
         Returns
         ----------
         dict: Retorna um dicionário com todas as receitas do credor, por ano.
-              chave: ano, valor: total de receitas
+              chave: ano, valor: total de receitas (em centavos)
 
               Raises
         ----------
         KeyError: Se o identificador não existir
         """
-        return self.credores[identificador].receitas.copy()
+        indice = self.__indice(identificador)
+        if indice is None:
+            raise KeyError(identificador)
+        return self.__receitas.por_ano(indice)
@@ -0,0 +1,105 @@
+import re
+
+from .cpf import desmascarar_cpf
+
+_NAO_DIGITO = re.compile(r"\D")
+
+
+class IdentificadorCredor(int):
+    """
+    Identificador de credor (CPF ou CNPJ) compactado em um inteiro de 64 bits.
+
+    Os dígitos do documento ficam nos bits altos e o bit menos significativo
+    indica o tipo (0 = CPF, 1 = CNPJ). Como é um int, o identificador pode ser
+    usado diretamente como chave de dicionário ou guardado em arrays int64;
+    hash, igualdade e ordenação são as do inteiro. A formatação com pontos,
+    barra e hífen só é feita quando o identificador é exibido.
+
+    Attributes
+    ----------
+    numero : int
+        Dígitos do documento, como inteiro.
+    eh_cnpj : bool
+        True para CNPJ, False para CPF.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, numero: int, eh_cnpj: bool = False):
+        """
+        Parameters
+        ----------
+        numero : int
+            Dígitos do documento, como inteiro.
+        eh_cnpj : bool
+            True para CNPJ, False para CPF.
+        """
+        return super().__new__(cls, (numero << 1) | int(eh_cnpj))
+
+    @classmethod
+    def de_codigo(cls, codigo: int) -> "IdentificadorCredor":
+        """
+        Reconstrói o identificador a partir do inteiro compactado
+        (por exemplo, lido de um array int64).
+        """
+        return int.__new__(cls, codigo)
+
+    @classmethod
+    def parse(cls, texto: str) -> "IdentificadorCredor":
+        """
+        Converte um CPF/CNPJ em texto, com ou sem máscara
+        ("000.123.456-78", "00012345678", "***.123.456-**",
+        "12.345.678/0001-90", "12345678000190").
+
+        Raises
+        ------
+        ValueError
+            Se o texto não contiver um CPF (11 dígitos) ou CNPJ (14 dígitos).
+        """
+        if isinstance(texto, IdentificadorCredor):
+            return texto
+        texto = texto.strip()
+        if "*" in texto:
+            texto = desmascarar_cpf(texto)
+        digitos = _NAO_DIGITO.sub("", texto)
+        if len(digitos) == 11:
+            return cls(int(digitos), False)
+        if len(digitos) == 14:
+            return cls(int(digitos), True)
+        raise ValueError(f"CPF/CNPJ inválido: {texto}")
+
+    @property
+    def numero(self) -> int:
+        return int(self) >> 1
+
+    @property
+    def eh_cnpj(self) -> bool:
+        return bool(int(self) & 1)
+
+    @property
+    def eh_cpf(self) -> bool:
+        return not int(self) & 1
+
+    @property
+    def digitos(self) -> str:
+        """
+        Dígitos do documento, sem máscara, com zeros à esquerda.
+        """
+        if self.eh_cnpj:
+            return f"{self.numero:014d}"
+        return f"{self.numero:011d}"
+
+    def __str__(self):
+        """
+        Formato: "xxx.xxx.xxx-xx" (CPF) ou "xx.xxx.xxx/xxxx-xx" (CNPJ).
+        """
+        d = self.digitos
+        if self.eh_cnpj:
+            return f"{d[:2]}.{d[2:5]}.{d[5:8]}/{d[8:12]}-{d[12:]}"
+        return f"{d[:3]}.{d[3:6]}.{d[6:9]}-{d[9:]}"
+
+    def __format__(self, spec: str) -> str:
+        return format(str(self), spec)
+
+    def __repr__(self):
+        return f"IdentificadorCredor('{self}')"
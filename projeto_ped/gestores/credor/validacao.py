@@ -0,0 +1,299 @@
+import numpy as np
+
+from .cpf import DesmascaradorCPF, desmascarador
+from .identificador import IdentificadorCredor
+
+# Códigos de motivo de rejeição
+MOTIVO_VALIDO = 0
+MOTIVO_FORMATO = 1  # não tem 11 (CPF) nem 14 (CNPJ) dígitos
+MOTIVO_DV_CPF = 2  # dígitos verificadores do CPF não conferem
+MOTIVO_DV_CNPJ = 3  # dígitos verificadores do CNPJ não conferem
+MOTIVO_REPETIDO = 4  # todos os dígitos iguais (000.000.000-00, 11.111.111/1111-11...)
+
+DESCRICAO_MOTIVOS = {
+    MOTIVO_VALIDO: "valido",
+    MOTIVO_FORMATO: "formato_invalido",
+    MOTIVO_DV_CPF: "dv_cpf_invalido",
+    MOTIVO_DV_CNPJ: "dv_cnpj_invalido",
+    MOTIVO_REPETIDO: "digitos_repetidos",
+}
+
+_POTENCIAS_CPF = 10 ** np.arange(10, -1, -1, dtype=np.int64)
+_POTENCIAS_CNPJ = 10 ** np.arange(13, -1, -1, dtype=np.int64)
+_PESOS_CPF_DV1 = np.arange(10, 1, -1, dtype=np.int64)
+_PESOS_CPF_DV2 = np.arange(11, 1, -1, dtype=np.int64)
+_PESOS_CNPJ_DV1 = np.array([5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2], dtype=np.int64)
+_PESOS_CNPJ_DV2 = np.array([6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2], dtype=np.int64)
+
+
+def _digito(soma: np.ndarray) -> np.ndarray:
+    resto = soma % 11
+    return np.where(resto < 2, 0, 11 - resto)
+
+
+def _confere(
+    digitos: np.ndarray, pesos_dv1: np.ndarray, pesos_dv2: np.ndarray
+) -> np.ndarray:
+    n = len(pesos_dv1)
+    dv1 = _digito(digitos[:, :n] @ pesos_dv1)
+    dv2 = _digito(digitos[:, : n + 1] @ pesos_dv2)
+    return (dv1 == digitos[:, n]) & (dv2 == digitos[:, n + 1])
+
+
+def _repetidos(digitos: np.ndarray) -> np.ndarray:
+    return (digitos == digitos[:, :1]).all(axis=1)
+
+
+def validar_identificadores(codigos) -> np.ndarray:
+    """
+    Confere os dígitos verificadores de um lote de identificadores
+    compactados (ver IdentificadorCredor), todos de uma vez.
+
+    Parameters
+    ----------
+    codigos : array-like de int64
+        Identificadores compactados.
+
+    Returns
+    -------
+    np.ndarray[int8]
+        Código de motivo de cada identificador (MOTIVO_VALIDO,
+        MOTIVO_DV_CPF, MOTIVO_DV_CNPJ ou MOTIVO_REPETIDO). Documentos com
+        todos os dígitos iguais têm dígitos verificadores corretos, mas não
+        identificam ninguém.
+    """
+    codigos = np.asarray(codigos, dtype=np.int64)
+    motivos = np.zeros(len(codigos), dtype=np.int8)
+    numeros = codigos >> 1
+    eh_cnpj = (codigos & 1).astype(bool)
+
+    cpfs = np.flatnonzero(~eh_cnpj)
+    if len(cpfs):
+        digitos = numeros[cpfs, None] // _POTENCIAS_CPF % 10
+        ok = _confere(digitos, _PESOS_CPF_DV1, _PESOS_CPF_DV2)
+        motivos[cpfs[~ok]] = MOTIVO_DV_CPF
+        motivos[cpfs[_repetidos(digitos)]] = MOTIVO_REPETIDO
+
+    cnpjs = np.flatnonzero(eh_cnpj)
+    if len(cnpjs):
+        digitos = numeros[cnpjs, None] // _POTENCIAS_CNPJ % 10
+        ok = _confere(digitos, _PESOS_CNPJ_DV1, _PESOS_CNPJ_DV2)
+        motivos[cnpjs[~ok]] = MOTIVO_DV_CNPJ
+        motivos[cnpjs[_repetidos(digitos)]] = MOTIVO_REPETIDO
+
+    return motivos
+
+
+def _desmascarar(textos: list, desmascarador: DesmascaradorCPF) -> list:
+    """
+    Desmascara os CPFs de uma vez (DesmascaradorCPF.desmascarar_lote). Se
+    algum não for um CPF mascarado, os textos são desmascarados um a um e o
+    inválido vira None.
+    """
+    try:
+        return desmascarador.desmascarar_lote(textos)
+    except ValueError:
+        desmascarados = []
+        for texto in textos:
+            try:
+                desmascarados.append(desmascarador.desmascarar(texto))
+            except ValueError:
+                desmascarados.append(None)
+        return desmascarados
+
+
+def _converter(
+    textos, desmascarador: DesmascaradorCPF = desmascarador
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converte textos de CPF/CNPJ para os identificadores compactados, com os
+    CPFs mascarados desmascarados juntos, em lote, pelo cache do
+    desmascarador.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        Identificadores (int64, 0 nos de formato inválido), códigos de
+        motivo (MOTIVO_VALIDO ou MOTIVO_FORMATO) e posições dos textos
+        mascarados.
+    """
+    textos = [texto.strip() if isinstance(texto, str) else texto for texto in textos]
+    mascarados = [
+        i for i, texto in enumerate(textos) if isinstance(texto, str) and "*" in texto
+    ]
+    if mascarados:
+        for posicao, texto in zip(
+            mascarados, _desmascarar([textos[i] for i in mascarados], desmascarador)
+        ):
+            textos[posicao] = texto
+
+    identificadores = np.zeros(len(textos), dtype=np.int64)
+    motivos = np.full(len(textos), MOTIVO_FORMATO, dtype=np.int8)
+    for posicao, texto in enumerate(textos):
+        try:
+            identificadores[posicao] = IdentificadorCredor.parse(texto)
+        except (ValueError, AttributeError):
+            continue
+        motivos[posicao] = MOTIVO_VALIDO
+    return identificadores, motivos, np.array(mascarados, dtype=np.int64)
+
+
+class ValidadorCredores:
+    """
+    Etapa de validação de CPF/CNPJ da carga, aplicada a lotes de linhas.
+
+    O texto de cada identificador é convertido para o inteiro compactado e os
+    dígitos verificadores do lote inteiro são conferidos com aritmética
+    vetorizada. Identificadores rejeitados não devem virar credores; as linhas
+    correspondentes vão para a quarentena com o código do motivo.
+
+    Os CPFs mascarados de cada lote são desmascarados juntos, uma vez por
+    texto distinto, pelo cache do DesmascaradorCPF: as repetições no lote e
+    os textos já vistos em lotes anteriores aproveitam o mesmo cálculo.
+
+    Attributes
+    ----------
+    validados : int
+        Quantidade de identificadores já conferidos.
+    rejeitados : int
+        Quantidade de identificadores rejeitados.
+    rejeitados_por_motivo : dict[str, int]
+        Rejeições por descrição do motivo.
+    mascarados : int
+        Identificadores com CPF mascarado.
+    desmascarados : int
+        CPFs mascarados que precisaram ser calculados (falhas do cache do
+        desmascarador).
+    taxa_acertos : float
+        Fração dos CPFs mascarados que aproveitaram um cálculo já feito, no
+        lote ou no cache do desmascarador.
+    """
+
+    def __init__(self, desmascarador: DesmascaradorCPF = desmascarador):
+        """
+        Parameters
+        ----------
+        desmascarador : DesmascaradorCPF
+            Serviço (e cache) de desmascaramento. Padrão: o compartilhado.
+        """
+        self.__desmascarador = desmascarador
+        self.__validados = 0
+        self.__mascarados = 0
+        self.__desmascarados = 0
+        self.__contagem = np.zeros(len(DESCRICAO_MOTIVOS), dtype=np.int64)
+
+    def validar_lote(self, textos) -> tuple[list, np.ndarray]:
+        """
+        Valida um lote de identificadores em texto. O lote é codificado por
+        dicionário e cada texto distinto é conferido uma única vez (ver
+        validar_codificados).
+
+        Parameters
+        ----------
+        textos : sequência de str
+            CPFs/CNPJs como aparecem no arquivo (com ou sem máscara).
+
+        Returns
+        -------
+        tuple[list, np.ndarray]
+            Lista de IdentificadorCredor (None nos de formato inválido) e os
+            códigos de motivo de cada posição (MOTIVO_VALIDO se aceito).
+        """
+        textos = list(textos)
+        distintos: dict = {}
+        codigos = np.fromiter(
+            (distintos.setdefault(texto, len(distintos)) for texto in textos),
+            dtype=np.int64,
+            count=len(textos),
+        )
+        codigos, motivos = self.validar_codificados(list(distintos), codigos)
+        identificadores = [
+            IdentificadorCredor.de_codigo(codigo) if motivo != MOTIVO_FORMATO else None
+            for codigo, motivo in zip(codigos.tolist(), motivos.tolist())
+        ]
+        return identificadores, motivos
+
+    def validar_codificados(self, textos, codigos) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Versão de validar_lote para uma coluna codificada por dicionário:
+        cada texto distinto é convertido e conferido uma única vez.
+
+        Parameters
+        ----------
+        textos : sequência de str
+            Valores distintos da coluna.
+        codigos : array-like de int
+            Posição em `textos` do valor de cada linha.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Identificadores compactados (int64, 0 nos de formato inválido) e
+            códigos de motivo de cada linha.
+        """
+        falhas = self.__desmascarador.cache_info().falhas
+        identificadores, motivos, mascarados = _converter(textos, self.__desmascarador)
+        validos = np.flatnonzero(motivos == MOTIVO_VALIDO)
+        motivos[validos] = validar_identificadores(identificadores[validos])
+
+        codigos = np.asarray(codigos, dtype=np.int64)
+        ocorrencias = np.bincount(codigos, minlength=len(textos))
+        self.__mascarados += int(ocorrencias[mascarados].sum())
+        self.__desmascarados += self.__desmascarador.cache_info().falhas - falhas
+        motivos = motivos[codigos]
+        self.__validados += len(motivos)
+        self.__contagem += np.bincount(motivos, minlength=len(self.__contagem))
+        return identificadores[codigos], motivos
+
+    def estado(self) -> dict:
+        """
+        Retorna os contadores em forma serializável entre processos.
+        """
+        return {
+            "validados": self.__validados,
+            "contagem": self.__contagem.copy(),
+            "mascarados": self.__mascarados,
+            "desmascarados": self.__desmascarados,
+        }
+
+    def merge_estado(self, estado: dict):
+        """
+        Soma os contadores de um validador parcial (ver estado).
+        """
+        self.__validados += estado["validados"]
+        self.__contagem += estado["contagem"]
+        self.__mascarados += estado["mascarados"]
+        self.__desmascarados += estado["desmascarados"]
+
+    def merge(self, other: "ValidadorCredores"):
+        self.merge_estado(other.estado())
+
+    @property
+    def validados(self) -> int:
+        return self.__validados
+
+    @property
+    def rejeitados(self) -> int:
+        return int(self.__contagem[1:].sum())
+
+    @property
+    def mascarados(self) -> int:
+        return self.__mascarados
+
+    @property
+    def desmascarados(self) -> int:
+        return self.__desmascarados
+
+    @property
+    def taxa_acertos(self) -> float:
+        if not self.__mascarados:
+            return 0.0
+        return 1 - self.__desmascarados / self.__mascarados
+
+    @property
+    def rejeitados_por_motivo(self) -> dict[str, int]:
+        return {
+            DESCRICAO_MOTIVOS[motivo]: int(quantidade)
+            for motivo, quantidade in enumerate(self.__contagem)
+            if motivo != MOTIVO_VALIDO and quantidade
+        }
@@ -1,91 +1,173 @@
-from datetime import datetime
+from datetime import date
+
+import numpy as np
+
+from projeto_ped.utils.acumulador import AcumuladorAnual
+from projeto_ped.utils.calendario import ano_do_dia, como_dia
+from projeto_ped.utils.dimensao import Dimensao
+from projeto_ped.utils.dinheiro import centavos_para_reais
+from projeto_ped.utils.pool import PoolStrings
 
-from .LinearProbingLoadFactor import HashTable
 from .organizacao_social import OrganizacaoSocial
 from .receita import Receita
 
 
 class GestorOrgs:
-    def __init__(self):
-        self.orgs = (
-            HashTable()
-        )  # de organizacao social    <id> id: <value> OrganizacoesSociais
+    """
+    Gerencia as organizações sociais e suas receitas por ano.
+
+    Cada organização recebe um id denso da dimensão de organizações; o
+    objeto OrganizacaoSocial e os totais por ano ficam em estruturas
+    endereçadas diretamente por esse id. Gestores parciais podem ser
+    combinados com merge/merge_estado.
+    """
 
-    def adicionar_org(self, org: OrganizacaoSocial, data: datetime, valor: float):
+    def __init__(self, dimensao: Dimensao | None = None):
+        # dimensão de organizacao social    <código> -> <id denso>
+        self.__ids = dimensao if dimensao is not None else Dimensao("organizacoes")
+        self.__orgs: list[OrganizacaoSocial | None] = []  # índice: id denso
+        self.__receitas = AcumuladorAnual()  # matriz id x ano
+        self.__quantidade = 0
+        self.__nomes = PoolStrings()  # nomes das organizações, sem cópias repetidas
+
+    def __indice(self, id: int) -> int:
         """
-        Adiciona uma organização à HashTable e registra sua receita.
+        Retorna o id denso de uma organização cadastrada.
         ----------
-        Recebe o objeto organização, o ano e o valor
+        Lança KeyError se a organização não existir.
         """
-        try:
-            org, receita = self.orgs.get(org.id)  # Obtendo a tupla
-        except KeyError:
-            receita = Receita()
-            self.orgs.put(org.id, (org, receita))  # Armazena a tupla
+        indice = self.__ids.buscar(id)
+        if indice is None or indice >= len(self.__orgs) or self.__orgs[indice] is None:
+            raise KeyError(f"Organização com id {id} não encontrada.")
+        return indice
 
-        receita.adicionar_receita(data.year, valor)
+    def adicionar(self, id: int, nome: str, data: int | date, valor: int):
+        """
+        Registra uma receita da organização, criando o objeto
+        OrganizacaoSocial apenas na primeira vez que o id aparece.
+        ----------
+        Recebe o id, o nome, a data (dias desde 01/01/1970 ou date) e o valor
+        (em centavos)
+        """
+        indice = self.__garantir_org(id, nome)
+        self.__receitas.acumular(indice, ano_do_dia(como_dia(data)), valor)
+
+    def __garantir_org(self, id: int, nome: str) -> int:
+        indice = self.__ids.id_de(id)
+        if indice >= len(self.__orgs):
+            self.__orgs.extend([None] * (indice + 1 - len(self.__orgs)))
+        if self.__orgs[indice] is None:
+            self.__orgs[indice] = OrganizacaoSocial(id, self.__nomes.internar(nome))
+            self.__quantidade += 1
+        return indice
+
+    def estado(self) -> dict:
+        """
+        Retorna o estado parcial compacto do gestor, serializável entre
+        processos. As organizações são identificadas pelo código (chave
+        natural), pois os ids densos de gestores diferentes não coincidem.
+        ----------
+        Retorna um dict com ids (np.ndarray int64), nomes e receitas
+        (estado do AcumuladorAnual, nas mesmas posições).
+        """
+        linhas = [i for i, org in enumerate(self.__orgs) if org is not None]
+        return {
+            "ids": np.array([self.__orgs[i].id for i in linhas], dtype=np.int64),
+            "nomes": [self.__orgs[i].nome for i in linhas],
+            "receitas": self.__receitas.estado(linhas),
+        }
+
+    def merge_estado(self, estado: dict):
+        """
+        Combina um estado parcial com este gestor, somando os totais por ano.
+        A soma é associativa e comutativa; para uma organização presente nos
+        dois lados, o nome já cadastrado prevalece.
+        """
+        indices = np.fromiter(
+            (
+                self.__garantir_org(id, nome)
+                for id, nome in zip(estado["ids"].tolist(), estado["nomes"])
+            ),
+            dtype=np.int64,
+            count=len(estado["nomes"]),
+        )
+        self.__receitas.somar_estado(estado["receitas"], indices)
+
+    def merge(self, other: "GestorOrgs"):
+        """
+        Combina outro gestor com este (ver merge_estado).
+        """
+        self.merge_estado(other.estado())
+
+    @classmethod
+    def de_estado(cls, estado: dict, dimensao: Dimensao | None = None) -> "GestorOrgs":
+        """
+        Reconstrói um gestor a partir de um estado parcial.
+        """
+        gestor = cls(dimensao)
+        gestor.merge_estado(estado)
+        return gestor
+
+    def adicionar_org(self, org: OrganizacaoSocial, data: int | date, valor: int):
+        """
+        Adiciona uma organização e registra sua receita.
+        ----------
+        Recebe o objeto organização, o ano e o valor
+        """
+        self.adicionar(org.id, org.nome, data, valor)
 
     def remover_org(self, id: int):
         """
-        Remove uma organização da hash table.
+        Remove uma organização do gestor.
         ---------
         Recebe a id como argumento.
+        Retorna a tupla (organização, receita) removida.
         """
         try:
-            # Verifica se a organização existe na hash table
-            if self.orgs.get(id):
-                # Remove a organização da hash table
-                carga = self.orgs.remove(id)
-                return carga
-            else:
-                return None
+            indice = self.__indice(id)
         except KeyError:
             # Trata erros caso a id não seja encontrada
             print(f"Erro: Organização com id {id} não encontrada.")
+            return None
+
+        org = self.__orgs[indice]
+        receita = Receita()  # cópia desvinculada da matriz do gestor
+        for ano, valor in self.__receitas.por_ano(indice).items():
+            receita.acumular(ano, valor)
+
+        self.__orgs[indice] = None
+        self.__receitas.zerar(indice)
+        self.__quantidade -= 1
+        return org, receita
 
     def get_nome_organizacao(self, id: int) -> str:
         """
         Retorna o nome da organização.
         ----------
         Recebe a id como argumento.
-        Retorna o nome da organização ou None se não for encontrada.
+        Lança KeyError se a organização não for encontrada.
         """
-        try:
-            # Tenta acessar a id da hash table
-            org, _ = self.orgs.get(id)
-            return org.nome
-        except KeyError:
-            raise KeyError(f"Organização com id {id} não encontrada.")
+        return self.__orgs[self.__indice(id)].nome
 
     def get_organizacoes(self) -> dict:
         """
-        Retorna um dicionário com o código (chave) e o nome das organizações sociais.
+        Retorna um dicionário com o código (chave) e o nome das organizações
+        sociais, em ordem crescente de código.
         """
-        orgs = {}
-        for id, (org, _) in self.orgs.items():
-            orgs[id] = org.nome
-        return orgs
+        orgs = [org for org in self.__orgs if org is not None]
+        return {org.id: org.nome for org in sorted(orgs, key=lambda org: org.id)}
 
     def get_receitas(self, id: int) -> dict:
         """
         Retorna um dicionario com as receitas por ano da organizacao passada como argumento
         """
-        receitas = {}
-        try:
-            _, receita = self.orgs.get(id)
-            receitas = receita.ano_valor
-            return receitas.copy()
-        except KeyError:
-            raise KeyError(f"Organização com id {id} não encontrada.")
+        return self.__receitas.por_ano(self.__indice(id))
 
-        # for id, (org, receita) in self.orgs.items():  # Desempacotando a tupla
-        #     print(f"id: {id} - Nome: {org.nome}")
-        #     # Verifica se há receitas registradas
-        #     if receita.ano_valor:  # Acessa o dicionário de receitas
-        #         for ano, valor in receita.ano_valor.items():
-        #             print(f"   🗓️  {ano}: R${valor:,.2f}")
-        #     else:
-        #         print("   Nenhuma receita registrada.")
+    def get_receita(self, id: int) -> Receita:
+        """
+        Retorna a receita (visão sobre a matriz do gestor) da organização.
+        """
+        return Receita(self.__receitas, self.__indice(id))
 
     def listar_receita_org(self, id: int):
         """
@@ -94,23 +176,28 @@ class GestorOrgs:
         Recebe o id como argumento.
         """
         try:
-            # Tenta acessar o id da hash table
-            org_receita = self.orgs.get(id)  # Obtém a tupla (org, receita)
-            if org_receita:
-                org, receita = org_receita  # Desempacota a tupla
-                print(f"Receitas da organização {id} ({org.nome}):")
-                if receita.ano_valor:  # Verifica se há receitas registradas
-                    for ano, valor in receita.ano_valor.items():
-                        print(f" 🗓️ {ano}: R${valor:,.2f}")
-                else:
-                    print("   Nenhuma receita registrada.")
-            else:
-                print(f"Organização com id {id} não encontrada.")
+            indice = self.__indice(id)
         except KeyError:
             print(f"Organização com id {id} não encontrada.")
+            return
+
+        org = self.__orgs[indice]
+        receitas = self.__receitas.por_ano(indice)
+        print(f"Receitas da organização {id} ({org.nome}):")
+        if receitas:  # Verifica se há receitas registradas
+            for ano, valor in receitas.items():
+                print(f" 🗓️ {ano}: R${centavos_para_reais(valor):,.2f}")
+        else:
+            print("   Nenhuma receita registrada.")
 
     def __len__(self):
-        return len(self.orgs)
+        return self.__quantidade
 
     def __str__(self):
-        return f"{str(list(self.orgs.items()))}"
+        return str(
+            [
+                (org.id, (org, self.__receitas.por_ano(indice)))
+                for indice, org in enumerate(self.__orgs)
+                if org is not None
+            ]
+        )
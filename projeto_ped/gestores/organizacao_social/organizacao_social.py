@@ -1,4 +1,6 @@
 class OrganizacaoSocial:
+    __slots__ = ("id", "nome")
+
     def __init__(self, id, nome):
         self.id = id
         self.nome = nome
@@ -1,14 +1,33 @@
-class Receita:
-    def __init__(self):
-        self.ano_valor = {}
+from datetime import date
 
-    def adicionar_receita(self, ano: int, valor: float):
-        try:
-            # self.ano_valor.get(ano)
-            self.ano_valor[ano] += valor
-        except KeyError:
-            self.ano_valor[ano] = valor
+from projeto_ped.utils.acumulador import LinhaAnual
+from projeto_ped.utils.calendario import ano_do_dia, como_dia
+
+
+class Receita(LinhaAnual):
+    """
+    Receitas anuais de uma organização social: uma visão sobre a linha da
+    organização na matriz de totais por ano do gestor.
+    """
+
+    __slots__ = ()
+
+    def adicionar_receita(self, ano: int, valor: int):
+        """
+        Soma o valor (em centavos) ao ano informado.
+        """
+        self.acumular(ano, valor)
+
+    def adicionar_receita_dia(self, data: int | date, valor: int):
+        """
+        Soma o valor (em centavos) ao ano de uma data (dias desde 01/01/1970
+        ou date).
+        """
+        self.acumular(ano_do_dia(como_dia(data)), valor)
+
+    @property
+    def ano_valor(self) -> dict:
+        return self.por_ano()
 
     def __str__(self):
         return str(self.ano_valor)
-
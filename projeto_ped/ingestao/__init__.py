@@ -0,0 +1,37 @@
+from .cache import CacheCarga, arquivo_cache
+from .carga import (
+    ERROS_FALHAR,
+    ERROS_IGNORAR,
+    ERROS_REGISTRAR,
+    POLITICAS_ERRO,
+    TAMANHO_LOTE,
+    Carga,
+)
+from .esquema import CABECALHO_PAGAMENTOS, ESQUEMA_PAGAMENTOS, Coluna, Esquema
+from .indice import IndiceRegistros, arquivo_indice
+from .ingestor import Ingestor, carregar
+from .paralelo import carregar_paralelo, dividir_em_blocos, mapear
+from .rapido import LeitorRapido
+
+__all__ = [
+    "CABECALHO_PAGAMENTOS",
+    "ERROS_FALHAR",
+    "ERROS_IGNORAR",
+    "ERROS_REGISTRAR",
+    "ESQUEMA_PAGAMENTOS",
+    "POLITICAS_ERRO",
+    "TAMANHO_LOTE",
+    "CacheCarga",
+    "Carga",
+    "Coluna",
+    "Esquema",
+    "IndiceRegistros",
+    "Ingestor",
+    "LeitorRapido",
+    "arquivo_cache",
+    "arquivo_indice",
+    "carregar",
+    "carregar_paralelo",
+    "dividir_em_blocos",
+    "mapear",
+]
@@ -0,0 +1,284 @@
+import hashlib
+import json
+import os
+from zipfile import BadZipFile
+
+import numpy as np
+
+from .carga import ERROS_REGISTRAR, Carga
+
+# Versão do formato do cache; caches de outra versão são refeitos
+_VERSAO = 5
+
+# Erros de um cache ausente, truncado, corrompido ou em outro formato
+_ERROS_LEITURA = (
+    OSError,
+    EOFError,
+    BadZipFile,
+    KeyError,
+    ValueError,
+    TypeError,
+    IndexError,
+)
+
+
+def arquivo_cache(caminho: str) -> str:
+    """
+    Caminho do cache da carga, gravado ao lado do CSV.
+    """
+    return os.fspath(caminho) + ".carga.npz"
+
+
+class _Codificador:
+    """
+    Converte um estado de carga (ver Carga.estado) em arrays numpy e um
+    manifesto JSON que descreve a estrutura, e faz o caminho inverso.
+
+    Cada nó do manifesto é um dict de uma chave:
+        - "v": valor simples (int, float, str, bool ou None);
+        - "a": nome de um array;
+        - "s": tabela de textos (nomes dos arrays com os bytes em UTF-8 e
+          com o fim de cada texto);
+        - "r": lista de listas de textos (uma tabela e o tamanho de cada lista);
+        - "t": dict texto -> array 1-D (chaves, valores concatenados e fins);
+        - "c": lista de tuplas, guardada coluna a coluna;
+        - "d": dict (pares chave, nó); "l": lista de nós.
+    """
+
+    def __init__(self, arrays: dict | None = None):
+        self.arrays = {} if arrays is None else arrays
+
+    def __novo(self, array: np.ndarray) -> str:
+        nome = f"a{len(self.arrays)}"
+        self.arrays[nome] = array
+        return nome
+
+    def __textos(self, textos) -> list[str]:
+        codificados = [texto.encode("utf-8", "surrogatepass") for texto in textos]
+        fins = np.cumsum([len(texto) for texto in codificados], dtype=np.int64)
+        dados = np.frombuffer(b"".join(codificados), dtype=np.uint8)
+        return [self.__novo(dados), self.__novo(fins)]
+
+    def __ler_textos(self, tabela: list[str]) -> list[str]:
+        dados, fins = self.arrays[tabela[0]].tobytes(), self.arrays[tabela[1]]
+        inicios = np.concatenate(([0], fins[:-1])).tolist()
+        return [
+            dados[i:f].decode("utf-8", "surrogatepass")
+            for i, f in zip(inicios, fins.tolist())
+        ]
+
+    def codificar(self, valor):
+        if isinstance(valor, np.generic):
+            valor = valor.item()
+        if valor is None or isinstance(valor, (bool, int, float, str)):
+            return {"v": valor}
+        if isinstance(valor, np.ndarray):
+            if valor.dtype == object:
+                raise ValueError("Arrays de objetos não são suportados pelo cache")
+            return {"a": self.__novo(valor)}
+        if isinstance(valor, dict):
+            arrays = list(valor.values())
+            if (
+                arrays
+                and all(isinstance(chave, str) for chave in valor)
+                and all(isinstance(a, np.ndarray) and a.ndim == 1 for a in arrays)
+                and len({a.dtype for a in arrays}) == 1
+            ):
+                chaves = self.__textos(valor)
+                fins = np.cumsum([len(a) for a in arrays], dtype=np.int64)
+                return {
+                    "t": [
+                        chaves,
+                        self.__novo(np.concatenate(arrays)),
+                        self.__novo(fins),
+                    ]
+                }
+            return {
+                "d": [[chave, self.codificar(item)] for chave, item in valor.items()]
+            }
+        if isinstance(valor, (list, tuple)):
+            if all(isinstance(item, str) for item in valor):
+                return {"s": self.__textos(valor)}
+            if all(
+                isinstance(item, (list, tuple))
+                and all(isinstance(t, str) for t in item)
+                for item in valor
+            ):
+                textos = self.__textos([texto for item in valor for texto in item])
+                tamanhos = np.array([len(item) for item in valor], dtype=np.int64)
+                return {"r": [textos, self.__novo(tamanhos)]}
+            if (
+                all(isinstance(item, tuple) for item in valor)
+                and len({len(i) for i in valor}) == 1
+            ):
+                return {"c": [self.codificar(list(coluna)) for coluna in zip(*valor)]}
+            return {"l": [self.codificar(item) for item in valor]}
+        raise ValueError(f"Tipo não suportado pelo cache: {type(valor).__name__}")
+
+    def decodificar(self, no: dict):
+        tipo, valor = next(iter(no.items()))
+        if tipo == "v":
+            return valor
+        if tipo == "a":
+            return self.arrays[valor]
+        if tipo == "s":
+            return self.__ler_textos(valor)
+        if tipo == "r":
+            textos = self.__ler_textos(valor[0])
+            fins = np.cumsum(self.arrays[valor[1]]).tolist()
+            return [textos[i:f] for i, f in zip([0] + fins[:-1], fins)]
+        if tipo == "t":
+            chaves = self.__ler_textos(valor[0])
+            valores, fins = self.arrays[valor[1]], self.arrays[valor[2]]
+            return dict(zip(chaves, np.split(valores, fins[:-1])))
+        if tipo == "c":
+            return list(zip(*(self.decodificar(coluna) for coluna in valor)))
+        if tipo == "d":
+            return {chave: self.decodificar(item) for chave, item in valor}
+        if tipo == "l":
+            return [self.decodificar(item) for item in valor]
+        raise ValueError(f"Nó desconhecido no cache: {tipo}")
+
+
+class CacheCarga:
+    """
+    Cache binário de uma carga do arquivo de pagamentos, gravado ao lado do
+    CSV (arquivo_cache).
+
+    O cache guarda o estado da carga (Carga.estado) como arrays numpy e
+    tabelas de textos em um único .npz, lido sem pickle, e um manifesto com a
+    estrutura. Restaurar o cache é combinar esse estado com uma carga nova
+    (Carga.merge_estado), com o mesmo resultado da leitura do CSV.
+
+    O cache só é usado se o CSV tiver o mesmo tamanho, a mesma data de
+    modificação e o mesmo conteúdo (hash BLAKE2b) da carga que o gravou, e
+    se o encoding e a política de erros forem os mesmos; caso contrário,
+    ele é ignorado e refeito na próxima gravação. O conteúdo só é resumido
+    na restauração quando o resto da assinatura confere; na gravação, o
+    resumo vem dos bytes lidos pela própria carga (ver novo_resumo), sem
+    uma segunda leitura do arquivo.
+
+    Atributos:
+        caminho (str): Caminho do CSV.
+        arquivo (str): Caminho do cache.
+        encoding (str): Codificação do arquivo.
+        erros (str): Política de erros da carga.
+    """
+
+    def __init__(
+        self, caminho: str, encoding: str = "latin-1", erros: str = ERROS_REGISTRAR
+    ):
+        self.caminho = os.fspath(caminho)
+        self.arquivo = arquivo_cache(self.caminho)
+        self.encoding = encoding
+        self.erros = erros
+        self.__assinatura = None
+
+    @staticmethod
+    def novo_resumo():
+        """
+        Objeto hashlib do resumo do conteúdo do CSV, para ser atualizado com
+        os bytes do arquivo durante a carga e passado a gravar.
+        """
+        return hashlib.blake2b()
+
+    def assinatura(self) -> dict:
+        """
+        Identificação do CSV (tamanho e data de modificação) e das opções da
+        carga, calculada uma vez (na primeira chamada): a gravação usa a do
+        arquivo como ele era antes da carga.
+        """
+        if self.__assinatura is None:
+            info = os.stat(self.caminho)
+            self.__assinatura = {
+                "versao": _VERSAO,
+                "tamanho": info.st_size,
+                "modificado": info.st_mtime_ns,
+                "encoding": self.encoding,
+                "erros": self.erros,
+            }
+        return self.__assinatura
+
+    def __resumir_arquivo(self) -> str:
+        with open(self.caminho, "rb") as ficheiro:
+            return hashlib.file_digest(ficheiro, self.novo_resumo).hexdigest()
+
+    def restaurar(self, logger=None) -> Carga | None:
+        """
+        Restaura a carga gravada no cache.
+
+        Args:
+            logger (Logger | None): Logger da carga restaurada.
+
+        Returns:
+            Carga | None: A carga, ou None se o cache não existir, estiver
+            desatualizado ou não puder ser lido. As linhas com CPF/CNPJ
+            inválido ficam no arquivo de quarentena gravado pela carga
+            original (ou em Carga.quarentenados, se ela não usou um).
+        """
+        try:
+            with np.load(self.arquivo, allow_pickle=False) as gravado:
+                manifesto = json.loads(gravado["manifesto"].tobytes().decode("utf-8"))
+                if manifesto.get("assinatura") != self.assinatura():
+                    return None
+                if manifesto.get("resumo") != self.__resumir_arquivo():
+                    return None
+                arrays = {
+                    nome: gravado[nome] for nome in gravado.files if nome != "manifesto"
+                }
+            carga = Carga(logger, None, self.erros, manifesto["cabecalho"])
+            carga.merge_estado(_Codificador(arrays).decodificar(manifesto["estado"]))
+        except _ERROS_LEITURA:
+            return None
+        return carga
+
+    def gravar(self, carga: Carga, resumo=None) -> bool:
+        """
+        Grava o estado da carga no cache. A gravação é feita em um arquivo
+        temporário renomeado ao final, então um cache pela metade nunca é
+        lido.
+
+        Args:
+            resumo: Objeto de novo_resumo atualizado com todos os bytes do
+                CSV lidos pela carga. Sem ele, o arquivo é lido de novo para
+                ser resumido.
+
+        Se o cache não puder ser gravado (diretório somente leitura, disco
+        cheio...), o erro vai para o logger da carga e a carga segue sem
+        cache.
+
+        Returns:
+            bool: Se o cache foi gravado.
+        """
+        codificador = _Codificador()
+        manifesto = {
+            "assinatura": self.assinatura(),
+            "resumo": (
+                self.__resumir_arquivo() if resumo is None else resumo.hexdigest()
+            ),
+            "cabecalho": list(carga.cabecalho),
+            "estado": codificador.codificar(carga.estado()),
+        }
+        texto = json.dumps(manifesto, ensure_ascii=False).encode(
+            "utf-8", "surrogatepass"
+        )
+        temporario = self.arquivo + ".tmp"
+        try:
+            with open(temporario, "wb") as ficheiro:
+                np.savez(
+                    ficheiro,
+                    manifesto=np.frombuffer(texto, dtype=np.uint8),
+                    **codificador.arrays,
+                )
+            os.replace(temporario, self.arquivo)
+        except OSError as erro:
+            if carga.logger is not None:
+                carga.logger.log_error(
+                    f"Cache da carga não gravado em {self.arquivo}: {erro}"
+                )
+            try:
+                os.remove(temporario)
+            except OSError:
+                pass
+            return False
+        return True
@@ -0,0 +1,255 @@
+from projeto_ped.despesa import GestorDespesas
+from projeto_ped.gestores import (
+    GestaoCredor,
+    GestorCategoriasDespesas,
+    GestorOrgs,
+    ValidadorCredores,
+)
+from projeto_ped.gestores.credor.validacao import DESCRICAO_MOTIVOS, MOTIVO_VALIDO
+from projeto_ped.utils import DatasetInfo, Logger, Quarentena, RegistroDimensoes, Stats
+
+from .esquema import CABECALHO_PAGAMENTOS, ESQUEMA_PAGAMENTOS
+
+# Tamanho dos lotes de linhas validados de uma vez (CPF/CNPJ)
+TAMANHO_LOTE = 4096
+
+# Políticas para linhas que não podem ser convertidas
+ERROS_REGISTRAR = "registrar"  # descarta a linha e a registra no logger
+ERROS_IGNORAR = "ignorar"  # descarta a linha sem registrá-la
+ERROS_FALHAR = "falhar"  # interrompe a carga com ValueError
+POLITICAS_ERRO = (ERROS_REGISTRAR, ERROS_IGNORAR, ERROS_FALHAR)
+
+
+class Carga:
+    """
+    Estruturas preenchidas pela carga do arquivo de pagamentos: os gestores,
+    as estatísticas e os contadores do dataset.
+
+    As linhas são processadas em lotes (processar_lote). Uma carga parcial
+    (por exemplo, de um trecho do arquivo processado em outro processo) pode
+    ser combinada com outra por estado/merge_estado; combinando as partes na
+    ordem do arquivo, o resultado é o mesmo da carga sequencial.
+
+    Linhas com erro vão para o logger (conforme a política de erros) e
+    linhas com CPF/CNPJ inválido para a quarentena. Sem logger ou sem
+    quarentena, elas ficam guardadas na carga (erros, quarentenados) e no
+    estado, para quem fizer o merge registrá-las.
+
+    Atributos:
+        dimensoes (RegistroDimensoes): Dimensões compartilhadas pelos gestores.
+        datasetinfo (DatasetInfo): Linhas processadas, carregadas e descartadas.
+        gestor_despesas (GestorDespesas)
+        gestor_credor (GestaoCredor)
+        gestor_categoria (GestorCategoriasDespesas)
+        gestor_organizacao_social (GestorOrgs)
+        stats (Stats)
+        validador (ValidadorCredores): Etapa de validação dos CPFs/CNPJs.
+        cabecalho (list[str]): Cabeçalho do arquivo carregado.
+        registros (int): Registros de dados (sem o cabeçalho) já processados;
+            os lançamentos guardam o número do seu registro de origem.
+        indice (IndiceRegistros | None): Índice dos registros do arquivo,
+            quando a carga usou um (ver Ingestor).
+    """
+
+    def __init__(
+        self,
+        logger: Logger | None = None,
+        quarentena: Quarentena | None = None,
+        erros: str = ERROS_REGISTRAR,
+        cabecalho: list[str] | None = None,
+    ):
+        """
+        Args:
+            logger (Logger | None): Destino das linhas com erro.
+            quarentena (Quarentena | None): Destino das linhas com CPF/CNPJ inválido.
+            erros (str): Política para linhas que não podem ser convertidas
+                ("registrar", "ignorar" ou "falhar").
+            cabecalho (list[str] | None): Cabeçalho do arquivo, que define a
+                posição de cada campo (ver ESQUEMA_PAGAMENTOS). Padrão: o da
+                exportação atual.
+
+        Raises:
+            ValueError: Se a política de erros for inválida ou se faltar
+                alguma coluna no cabeçalho.
+        """
+        if erros not in POLITICAS_ERRO:
+            raise ValueError(f"Política de erros inválida: {erros}")
+        self.logger = logger
+        self.quarentena = quarentena
+        self.politica_erros = erros
+        self.__erros: list[list[str]] = []
+        self.__quarentenados: list[tuple[str, list[str]]] = []
+        self.registros = 0
+        self.indice = None
+
+        # As dimensões atribuem ids densos a organizações, categorias e
+        # credores, usados pelos gestores para endereçar seus arrays de totais.
+        self.dimensoes = RegistroDimensoes()
+        self.datasetinfo = DatasetInfo()
+        self.gestor_despesas = GestorDespesas()
+        self.gestor_credor = GestaoCredor(self.dimensoes.credores)
+        self.gestor_categoria = GestorCategoriasDespesas(self.dimensoes.categorias)
+        self.gestor_organizacao_social = GestorOrgs(self.dimensoes.organizacoes)
+        self.stats = Stats()
+        self.validador = ValidadorCredores()
+
+        # Decodificador específico para a ordem de colunas deste arquivo
+        cabecalho = CABECALHO_PAGAMENTOS if cabecalho is None else cabecalho
+        self.cabecalho = list(cabecalho)
+        self.__decodificar = ESQUEMA_PAGAMENTOS.compilar(
+            cabecalho, {"dia": self.dimensoes.datas.dia}
+        )
+        self.__texto_credor = ESQUEMA_PAGAMENTOS.extrator(cabecalho, "cpf_cnpj_credor")
+
+    def descartar_cabecalho(self):
+        """
+        Conta o cabeçalho como linha processada e descartada.
+        """
+        self.datasetinfo.update_processed()
+        self.datasetinfo.update_disregard()
+
+    def __registrar_erro(self, linha: list[str]):
+        if self.logger is not None:
+            self.logger.log_error(linha)
+        else:
+            self.__erros.append(linha)
+
+    def __registrar_quarentena(self, linha: list[str], motivo: str):
+        if self.quarentena is not None:
+            self.quarentena.registrar(linha, motivo)
+        else:
+            self.__quarentenados.append((motivo, linha))
+
+    def processar_lote(self, lote: list[list[str]]):
+        """
+        Valida os CPFs/CNPJs de um lote de linhas de uma só vez e carrega as
+        linhas aceitas. Linhas com identificador inválido vão para a quarentena.
+        """
+        identificadores, motivos = self.validador.validar_lote(
+            [self.__texto_credor(linha) for linha in lote]
+        )
+        decodificar = self.__decodificar
+        datas = self.dimensoes.datas
+
+        for linha, cpf_cpnj_credor, motivo in zip(lote, identificadores, motivos):
+            registro = self.registros
+            self.registros += 1
+            try:
+                self.datasetinfo.update_processed()
+
+                if motivo != MOTIVO_VALIDO:
+                    self.__registrar_quarentena(linha, DESCRICAO_MOTIVOS[motivo])
+                    self.datasetinfo.update_quarantined()
+                    continue
+
+                (
+                    competencia,
+                    codigo_organizacao_social,
+                    nome_organizacao_social,
+                    codigo_lancamento,
+                    dia_lancamento,  # em dias desde 01/01/1970
+                    codigo_categoria_despesa,
+                    nome_categoria,
+                    _,  # CPF/CNPJ, já validado acima
+                    nome_credor,
+                    valor,  # em centavos
+                    observacao_lancamento,
+                ) = decodificar(linha)
+                ano_lancamento = datas.ano(dia_lancamento)
+
+                self.datasetinfo.update_loaded()  # Se a linha foi convertida sem problemas, incrementa quantidade de linhas que foram carregadas com sucesso
+
+                # Adiciona no armazenamento colunar, indexado pela árvore AVL
+                self.gestor_despesas.adicionar_lancamento(
+                    competencia,
+                    codigo_organizacao_social,
+                    codigo_lancamento,
+                    dia_lancamento,
+                    codigo_categoria_despesa,
+                    cpf_cpnj_credor,
+                    valor,
+                    observacao_lancamento,
+                    registro,
+                )
+
+                self.gestor_credor.upsert(
+                    cpf_cpnj_credor, nome_credor, ano_lancamento, valor
+                )
+
+                self.gestor_categoria.add(
+                    codigo_categoria_despesa, nome_categoria, dia_lancamento, valor
+                )
+
+                self.gestor_organizacao_social.adicionar(
+                    codigo_organizacao_social,
+                    nome_organizacao_social,
+                    dia_lancamento,
+                    valor,
+                )
+
+                self.stats.acumular(valor, dia_lancamento)
+
+            except Exception as erro:
+                """
+                Se entrar aqui, houve algum problema na instanciação de alguma linha do csv,
+                e então ela será descartada.
+                """
+                if self.politica_erros == ERROS_FALHAR:
+                    raise ValueError(f"Linha inválida: {linha}") from erro
+                if self.politica_erros == ERROS_REGISTRAR:
+                    self.__registrar_erro(linha)
+                self.datasetinfo.update_disregard()
+
+    def estado(self) -> dict:
+        """
+        Retorna o estado parcial da carga (estados de todos os gestores,
+        contadores e linhas rejeitadas), serializável entre processos.
+        """
+        return {
+            "datasetinfo": self.datasetinfo.estado(),
+            "despesas": self.gestor_despesas.estado(),
+            "credores": self.gestor_credor.estado(),
+            "categorias": self.gestor_categoria.estado(),
+            "organizacoes": self.gestor_organizacao_social.estado(),
+            "stats": self.stats.estado(),
+            "validador": self.validador.estado(),
+            "erros": list(self.__erros),
+            "quarentena": list(self.__quarentenados),
+            "registros": self.registros,
+        }
+
+    def merge_estado(self, estado: dict):
+        """
+        Combina uma carga parcial (ver estado) com esta. Os lançamentos são
+        anexados ao final, então as partes devem ser combinadas na ordem do
+        arquivo para reproduzir a carga sequencial.
+        """
+        self.datasetinfo.merge_estado(estado["datasetinfo"])
+        self.gestor_despesas.merge_estado(estado["despesas"], self.registros)
+        self.registros += estado["registros"]
+        self.gestor_credor.merge_estado(estado["credores"])
+        self.gestor_categoria.merge_estado(estado["categorias"])
+        self.gestor_organizacao_social.merge_estado(estado["organizacoes"])
+        self.stats.merge_estado(estado["stats"])
+        self.validador.merge_estado(estado["validador"])
+        for linha in estado["erros"]:
+            self.__registrar_erro(linha)
+        for motivo, linha in estado["quarentena"]:
+            self.__registrar_quarentena(linha, motivo)
+
+    def merge(self, other: "Carga"):
+        self.merge_estado(other.estado())
+
+    @property
+    def erros(self) -> list[list[str]]:
+        """
+        Linhas com erro guardadas na carga (quando não há logger).
+        """
+        return self.__erros
+
+    @property
+    def quarentenados(self) -> list[tuple[str, list[str]]]:
+        """
+        Pares (motivo, linha) guardados na carga (quando não há quarentena).
+        """
+        return self.__quarentenados
@@ -0,0 +1,210 @@
+from operator import itemgetter
+
+from projeto_ped.utils import DimensaoData, texto_para_centavos
+
+# Tipos dos campos e seus conversores padrão. None mantém o texto como o
+# csv.reader entregou (as aspas já foram removidas por ele). O tipo "dia"
+# não tem conversor padrão: as cargas informam na compilação a sua própria
+# dimensão de datas; sem ela, cada decodificador usa uma DimensaoData nova.
+TIPOS = {
+    "texto": None,
+    "inteiro": int,
+    "centavos": texto_para_centavos,
+    "dia": None,
+}
+
+
+def normalizar_nome(nome: str) -> str:
+    """
+    Normaliza um nome de coluna do cabeçalho para comparação: sem BOM, aspas
+    e espaços nas pontas, em maiúsculas e com "_" no lugar de espaços e hífens.
+    """
+    nome = nome.lstrip("\ufeff").strip().strip('"').strip().upper()
+    return nome.replace(" ", "_").replace("-", "_")
+
+
+class Coluna:
+    """
+    Campo tipado do esquema.
+
+    Atributos:
+        campo (str): Nome do campo no registro decodificado.
+        tipo (str): Chave de TIPOS.
+        nomes (tuple[str, ...]): Nome da coluna no cabeçalho e apelidos aceitos.
+    """
+
+    __slots__ = ("campo", "nomes", "tipo")
+
+    def __init__(self, campo: str, tipo: str, *nomes: str):
+        if tipo not in TIPOS:
+            raise ValueError(f"Tipo de coluna inválido: {tipo}")
+        self.campo = campo
+        self.tipo = tipo
+        self.nomes = tuple(normalizar_nome(nome) for nome in nomes)
+
+    def __repr__(self) -> str:
+        return (
+            f"Coluna({self.campo!r}, {self.tipo!r}, {', '.join(map(repr, self.nomes))})"
+        )
+
+
+class Esquema:
+    """
+    Esquema de um CSV: campos tipados e os nomes de coluna que os fornecem.
+
+    O cabeçalho é validado uma única vez (compilar), que localiza cada
+    campo pelo nome, e não pela posição, e monta uma função de decodificação
+    para aquele arquivo: um itemgetter com as posições das colunas e os
+    conversores apenas dos campos que precisam de conversão. Se a exportação
+    mudar a ordem das colunas, o decodificador se adapta; se faltar alguma
+    coluna, a carga falha em vez de ler o campo errado.
+    """
+
+    def __init__(self, *colunas: Coluna):
+        self.__colunas = colunas
+
+    @property
+    def colunas(self) -> tuple[Coluna, ...]:
+        return self.__colunas
+
+    @property
+    def campos(self) -> tuple[str, ...]:
+        return tuple(coluna.campo for coluna in self.__colunas)
+
+    def indices(self, cabecalho: list[str]) -> dict[str, int]:
+        """
+        Localiza a posição de cada campo no cabeçalho.
+
+        Raises:
+            ValueError: Se alguma coluna não estiver no cabeçalho.
+        """
+        posicoes = {}
+        for indice, nome in enumerate(cabecalho):
+            posicoes.setdefault(normalizar_nome(nome), indice)
+
+        indices, ausentes = {}, []
+        for coluna in self.__colunas:
+            indice = next((posicoes[n] for n in coluna.nomes if n in posicoes), None)
+            if indice is None:
+                ausentes.append(coluna.nomes[0])
+            else:
+                indices[coluna.campo] = indice
+        if ausentes:
+            raise ValueError(f"Colunas ausentes no cabeçalho: {', '.join(ausentes)}")
+        return indices
+
+    def compilar(self, cabecalho: list[str], conversores: dict | None = None):
+        """
+        Gera o decodificador de linhas do arquivo com este cabeçalho.
+
+        Args:
+            cabecalho (list[str]): Cabeçalho do arquivo.
+            conversores (dict | None): Conversores por tipo que substituem os
+                de TIPOS (por exemplo, {"dia": dimensao_datas.dia}). Sem
+                conversor para "dia", o decodificador usa uma DimensaoData
+                própria.
+
+        Returns:
+            callable: Função que recebe a linha (list[str]) e retorna a
+            tupla dos campos convertidos, na ordem de `campos`. Linhas
+            curtas ou com valores inválidos levantam IndexError/ValueError.
+
+        Raises:
+            ValueError: Se o cabeçalho não tiver todas as colunas.
+        """
+        conversores = {**TIPOS, "dia": DimensaoData().dia, **(conversores or {})}
+        indices = self.indices(cabecalho)
+        posicoes = [indices[campo] for campo in self.campos]
+
+        extrair = itemgetter(*posicoes)
+        if len(posicoes) == 1:
+            unico = extrair
+
+            def extrair(linha):
+                return (unico(linha),)
+
+        # Só os campos com conversor são tocados; os de texto seguem como estão
+        convertidos = tuple(
+            (posicao, conversores[coluna.tipo])
+            for posicao, coluna in enumerate(self.__colunas)
+            if conversores[coluna.tipo] is not None
+        )
+
+        def decodificar(linha):
+            valores = list(extrair(linha))
+            for posicao, converter in convertidos:
+                valores[posicao] = converter(valores[posicao])
+            return tuple(valores)
+
+        return decodificar
+
+    def extrator(self, cabecalho: list[str], campo: str):
+        """
+        Retorna uma função que lê um único campo (em texto) da linha, ou ""
+        se a linha for curta demais.
+        """
+        indice = self.indices(cabecalho)[campo]
+        return lambda linha: linha[indice] if len(linha) > indice else ""
+
+
+# Esquema do arquivo de pagamentos da gestão pactuada. Os campos não usados
+# pela carga (EXERCICIO, tipo de lançamento e documento) não são exigidos.
+ESQUEMA_PAGAMENTOS = Esquema(
+    Coluna("competencia", "texto", "COMPETENCIA"),
+    Coluna(
+        "codigo_organizacao_social",
+        "inteiro",
+        "CODIGO_ORGANIZACAO_SOCIAL",
+        "COD_ORGANIZACAO_SOCIAL",
+    ),
+    Coluna(
+        "nome_organizacao_social",
+        "texto",
+        "NOME_ORGANIZACAO_SOCIAL",
+        "ORGANIZACAO_SOCIAL",
+    ),
+    Coluna("codigo_lancamento", "inteiro", "CODIGO_LANCAMENTO", "COD_LANCAMENTO"),
+    Coluna("dia_lancamento", "dia", "DATA_LANCAMENTO", "DATA"),
+    Coluna(
+        "codigo_categoria_despesa",
+        "texto",
+        "CODIGO_CATEGORIA_DESPESA",
+        "COD_CATEGORIA_DESPESA",
+    ),
+    Coluna(
+        "nome_categoria",
+        "texto",
+        "NOME_CATEGORIA",
+        "NOME_CATEGORIA_DESPESA",
+        "CATEGORIA_DESPESA",
+    ),
+    Coluna(
+        "cpf_cnpj_credor",
+        "texto",
+        "CPFCNPJ_CREDOR",
+        "CPF_CNPJ_CREDOR",
+        "CNPJCPF_CREDOR",
+    ),
+    Coluna("nome_credor", "texto", "NOME_CREDOR", "CREDOR"),
+    Coluna("valor", "centavos", "VALOR_LANCAMENTO", "VALOR"),
+    Coluna("observacao_lancamento", "texto", "OBSERVACAO_LANCAMENTO", "OBSERVACAO"),
+)
+
+# Cabeçalho da exportação atual, usado quando o arquivo não informa um
+CABECALHO_PAGAMENTOS = [
+    "EXERCICIO",
+    "COMPETENCIA",
+    "CODIGO_ORGANIZACAO_SOCIAL",
+    "NOME_ORGANIZACAO_SOCIAL",
+    "CODIGO_LANCAMENTO",
+    "DATA_LANCAMENTO",
+    "CODIGO_TIPO_LANCAMENTO",
+    "TIPO_LANCAMENTO",
+    "NUMERO_DOCUMENTO",
+    "CODIGO_CATEGORIA_DESPESA",
+    "NOME_CATEGORIA",
+    "CPFCNPJ_CREDOR",
+    "NOME_CREDOR",
+    "VALOR_LANCAMENTO",
+    "OBSERVACAO_LANCAMENTO",
+]
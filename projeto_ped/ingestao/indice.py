@@ -0,0 +1,194 @@
+import os
+
+import numpy as np
+
+from .cache import _ERROS_LEITURA
+from .esquema import ESQUEMA_PAGAMENTOS
+from .paralelo import cortar_blocos, inicios_dos_registros, ler_cabecalho
+from .rapido import ler_registros
+
+# Versão do formato do arquivo de índice
+_VERSAO = 1
+
+
+def arquivo_indice(caminho: str) -> str:
+    """
+    Caminho do arquivo de índice gravado ao lado do CSV.
+    """
+    return os.fspath(caminho) + ".indice.npz"
+
+
+def _assinatura(caminho: str) -> tuple[int, int]:
+    info = os.stat(caminho)
+    return info.st_size, info.st_mtime_ns
+
+
+class IndiceRegistros:
+    """
+    Índice dos registros de dados de um CSV: a posição (em bytes) em que
+    cada registro começa, em um único array int64.
+
+    O índice é criado com uma varredura do arquivo mapeado em memória (mmap),
+    com a mesma divisão em registros do LeitorRapido e do csv.reader
+    (inclusive campos entre aspas com quebras de linha), e pode ser gravado
+    ao lado do CSV (arquivo_indice) para que as próximas execuções não
+    precisem varrê-lo de novo. Um índice gravado só é usado enquanto o
+    tamanho e a data de modificação do CSV forem os mesmos.
+
+    Com ele, qualquer faixa de registros pode ser lida direto do arquivo:
+    blocos exatos para a carga paralela (blocos) e a linha original de um
+    lançamento (registro), sem guardar todos os campos em memória.
+
+    Atributos:
+        caminho (str): Caminho do CSV.
+        cabecalho (list[str]): Cabeçalho do CSV.
+        inicios (np.ndarray): int64, início de cada registro, seguido do fim
+            do último (len(indice) + 1 posições).
+        encoding (str): Codificação do arquivo.
+    """
+
+    def __init__(
+        self,
+        caminho: str,
+        cabecalho: list[str],
+        inicios: np.ndarray,
+        assinatura: tuple[int, int],
+        encoding: str = "latin-1",
+    ):
+        self.caminho = os.fspath(caminho)
+        self.cabecalho = cabecalho
+        self.inicios = inicios
+        self.encoding = encoding
+        self.__assinatura = assinatura
+
+    @classmethod
+    def criar(cls, caminho: str, encoding: str = "latin-1") -> "IndiceRegistros":
+        """
+        Cria o índice varrendo o arquivo mapeado em memória (ver
+        inicios_dos_registros).
+        """
+        assinatura = _assinatura(caminho)
+        cabecalho, inicio = ler_cabecalho(caminho, encoding)
+        inicios = inicios_dos_registros(caminho, inicio, encoding)
+        return cls(caminho, cabecalho, inicios, assinatura, encoding)
+
+    @classmethod
+    def abrir(cls, caminho: str, encoding: str = "latin-1") -> "IndiceRegistros | None":
+        """
+        Lê o índice gravado ao lado do CSV. Retorna None se ele não existir,
+        estiver truncado, corrompido ou em outro formato, ou não corresponder
+        mais ao arquivo.
+        """
+        try:
+            with np.load(arquivo_indice(caminho)) as gravado:
+                versao, tamanho, modificado = gravado["assinatura"].tolist()
+                inicios = gravado["inicios"]
+        except _ERROS_LEITURA:
+            return None
+        if versao != _VERSAO or (tamanho, modificado) != _assinatura(caminho):
+            return None
+        cabecalho, _ = ler_cabecalho(caminho, encoding)
+        return cls(caminho, cabecalho, inicios, (tamanho, modificado), encoding)
+
+    @classmethod
+    def para_arquivo(
+        cls, caminho: str, encoding: str = "latin-1", salvar: bool = True
+    ) -> "IndiceRegistros":
+        """
+        Índice atualizado de um CSV: o gravado, se ainda valer, ou um novo
+        (gravado ao lado do CSV se `salvar`).
+        """
+        indice = cls.abrir(caminho, encoding)
+        if indice is None:
+            indice = cls.criar(caminho, encoding)
+            if salvar:
+                indice.salvar()
+        return indice
+
+    def salvar(self):
+        """
+        Grava o índice em arquivo_indice(caminho). A gravação é feita em um
+        arquivo temporário renomeado ao final, então um índice pela metade
+        nunca é lido.
+        """
+        destino = arquivo_indice(self.caminho)
+        temporario = destino + ".tmp"
+        with open(temporario, "wb") as ficheiro:
+            np.savez(
+                ficheiro,
+                assinatura=np.array((_VERSAO, *self.__assinatura), dtype=np.int64),
+                inicios=self.inicios,
+            )
+        os.replace(temporario, destino)
+
+    def atualizado(self) -> bool:
+        """
+        Se o CSV ainda tem o tamanho e a data de modificação da criação do índice.
+        """
+        try:
+            return _assinatura(self.caminho) == self.__assinatura
+        except OSError:
+            return False
+
+    def intervalo(self, registro: int) -> tuple[int, int]:
+        """
+        Intervalo de bytes [inicio, fim) de um registro (a partir de 0).
+
+        Raises:
+            KeyError: Se o registro não existir.
+        """
+        if not 0 <= registro < len(self):
+            raise KeyError(registro)
+        return int(self.inicios[registro]), int(self.inicios[registro + 1])
+
+    def blocos(self, quantidade: int) -> list[tuple[int, int]]:
+        """
+        Divide os registros em até `quantidade` intervalos de bytes [inicio,
+        fim) de tamanhos próximos, que começam e terminam exatamente em
+        limites de registro.
+        """
+        return cortar_blocos(self.inicios, quantidade)
+
+    def bruto(self, registro: int) -> bytes:
+        """
+        Bytes originais de um registro, lidos direto do arquivo.
+
+        Raises:
+            KeyError: Se o registro não existir.
+            ValueError: Se o CSV mudou desde a criação do índice.
+        """
+        inicio, fim = self.intervalo(registro)
+        if not self.atualizado():
+            raise ValueError(
+                f"O arquivo {self.caminho} mudou desde a criação do índice"
+            )
+        with open(self.caminho, "rb") as ficheiro:
+            ficheiro.seek(inicio)
+            return ficheiro.read(fim - inicio)
+
+    def registro(self, registro: int) -> list[str]:
+        """
+        Campos de um registro, lidos do arquivo pelo csv.reader.
+
+        Raises:
+            KeyError: Se o registro não existir.
+            ValueError: Se o CSV mudou desde a criação do índice.
+        """
+        registros = ler_registros(self.bruto(registro), self.encoding)
+        return registros[0] if registros else []
+
+    def campo(self, registro: int, campo: str) -> str:
+        """
+        Um campo de um registro (pelo nome em ESQUEMA_PAGAMENTOS, como
+        "observacao_lancamento"), lido do arquivo.
+
+        Raises:
+            KeyError: Se o registro não existir.
+            ValueError: Se o CSV mudou desde a criação do índice.
+        """
+        return ESQUEMA_PAGAMENTOS.extrator(self.cabecalho, campo)(
+            self.registro(registro)
+        )
+
+    def __len__(self) -> int:
+        return len(self.inicios) - 1
@@ -0,0 +1,397 @@
+import csv
+import io
+import os
+import stat
+import time
+from contextlib import contextmanager
+
+from projeto_ped.utils import Logger, Quarentena
+
+from .cache import CacheCarga
+from .carga import ERROS_REGISTRAR, POLITICAS_ERRO, TAMANHO_LOTE, Carga
+from .indice import IndiceRegistros
+from .paralelo import carregar_paralelo, ler_cabecalho, mapear
+from .rapido import TAMANHO_BLOCO, LeitorRapido
+
+
+class _LeitorContado(io.RawIOBase):
+    """
+    Repassa as leituras de um fluxo binário, contando os bytes consumidos e,
+    se houver `resumo` (objeto hashlib), resumindo-os. Fechar o leitor não
+    fecha o fluxo original.
+    """
+
+    def __init__(self, fonte, resumo=None):
+        self.__fonte = fonte
+        self.__resumo = resumo
+        self.lidos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, destino) -> int:
+        quantidade = self.__fonte.readinto(destino) or 0
+        self.lidos += quantidade
+        if self.__resumo is not None:
+            with memoryview(destino) as visao, visao[:quantidade] as lidos:
+                self.__resumo.update(lidos)
+        return quantidade
+
+
+class _LinhasContadas:
+    """
+    Repassa as linhas de um fluxo de texto, contando os caracteres consumidos.
+    """
+
+    def __init__(self, fonte):
+        self.__fonte = fonte
+        self.lidos = 0
+
+    def __iter__(self):
+        for linha in self.__fonte:
+            self.lidos += len(linha)
+            yield linha
+
+
+class _Progresso:
+    """
+    Acumula o avanço da carga (em bytes) e o repassa ao callback no máximo
+    uma vez a cada `intervalo` segundos, em vez de a cada linha.
+    """
+
+    def __init__(self, callback, intervalo: float):
+        self.__callback = callback
+        self.__intervalo = intervalo
+        self.__pendente = 0
+        self.__ultimo = time.monotonic()
+
+    def avancar(self, quantidade: int):
+        self.__pendente += quantidade
+        agora = time.monotonic()
+        if agora - self.__ultimo >= self.__intervalo:
+            self.concluir()
+            self.__ultimo = agora
+
+    def concluir(self):
+        if self.__pendente:
+            self.__callback(self.__pendente)
+            self.__pendente = 0
+
+
+def _tamanho(fonte) -> int | None:
+    """
+    Bytes a ler da fonte (os.fstat a partir da posição atual), ou None se
+    não for um arquivo regular (pipes, stdin, objetos em memória).
+    """
+    try:
+        info = os.fstat(fonte.fileno())
+    except (AttributeError, OSError, ValueError):
+        return None
+    if not stat.S_ISREG(info.st_mode):
+        return None
+    return info.st_size - (fonte.tell() if fonte.seekable() else 0)
+
+
+def _lotes(reader, tamanho: int):
+    lote = []
+    for linha in reader:
+        lote.append(linha)
+        if len(lote) == tamanho:
+            yield lote
+            lote = []
+    yield lote
+
+
+class Ingestor:
+    """
+    Carrega o arquivo de pagamentos (caminho ou objeto de arquivo) e retorna
+    uma Carga com os gestores, as estatísticas e o DatasetInfo preenchidos.
+
+    O arquivo é lido uma única vez, do início ao fim, sem seek: a fonte pode
+    ser um pipe ou a entrada padrão. O progresso é medido em bytes
+    consumidos (caracteres, para fontes em texto) contra o tamanho do
+    arquivo (os.fstat), quando conhecido.
+
+    Cada chamada de carregar produz uma carga nova, então o mesmo Ingestor
+    pode ser usado várias vezes no mesmo processo.
+
+    Atributos:
+        encoding (str): Codificação do arquivo. Padrão: "latin-1".
+        erros (str): Política para linhas que não podem ser convertidas
+            ("registrar", "ignorar" ou "falhar"). Padrão: "registrar".
+        progresso (bool | callable): True mostra a barra do alive_progress;
+            False não mostra nada (modo sem interface, para processamento em
+            lote); uma função é chamada com a quantidade de bytes de cada
+            avanço.
+        intervalo_progresso (float): Intervalo mínimo, em segundos, entre
+            duas atualizações do progresso.
+        processos (int): Processos da carga (1 = sequencial). A carga
+            paralela só está disponível para caminhos de arquivo.
+        logger (Logger | None): Destino das linhas com erro. Sem logger,
+            elas ficam em Carga.erros.
+        arquivo_quarentena (str | None): CSV das linhas com CPF/CNPJ
+            inválido, gravado no encoding do arquivo. None (padrão) as mantém
+            em Carga.quarentenados.
+        tamanho_lote (int): Linhas validadas de uma vez.
+        rapido (bool): Usa o LeitorRapido, que divide e converte os
+            registros direto dos bytes, em vez do csv.reader. Vale para
+            caminhos e fontes binárias; fontes em texto usam o csv.reader.
+        indice (bool): Usa o índice dos registros do arquivo
+            (IndiceRegistros), criado na primeira carga e gravado ao lado do
+            CSV. Com ele, a carga rápida e os processos filhos leem o arquivo
+            mapeado em memória, a carga paralela divide os blocos exatamente
+            nos limites de registro e Carga.indice permite reler a linha
+            original de um lançamento. Só para caminhos de arquivo.
+        cache (bool): Grava o estado da carga em um cache binário ao lado do
+            CSV (CacheCarga) e, nas cargas seguintes do mesmo arquivo (mesmo
+            tamanho, data de modificação e conteúdo), restaura-o em vez de
+            ler o CSV. Um cache desatualizado é refeito. Só para caminhos de
+            arquivo.
+    """
+
+    def __init__(
+        self,
+        encoding: str = "latin-1",
+        erros: str = ERROS_REGISTRAR,
+        progresso=True,
+        intervalo_progresso: float = 0.1,
+        processos: int = 1,
+        logger: Logger | None = None,
+        arquivo_quarentena: str | None = None,
+        tamanho_lote: int = TAMANHO_LOTE,
+        rapido: bool = False,
+        indice: bool = False,
+        cache: bool = False,
+    ):
+        """
+        Raises:
+            ValueError: Se a política de erros, a quantidade de processos ou o
+                tamanho do lote forem inválidos.
+        """
+        if erros not in POLITICAS_ERRO:
+            raise ValueError(f"Política de erros inválida: {erros}")
+        if processos < 1:
+            raise ValueError("A quantidade de processos deve ser positiva")
+        if tamanho_lote < 1:
+            raise ValueError("O tamanho do lote deve ser positivo")
+        self.encoding = encoding
+        self.erros = erros
+        self.progresso = progresso
+        self.intervalo_progresso = intervalo_progresso
+        self.processos = processos
+        self.logger = logger
+        self.arquivo_quarentena = arquivo_quarentena
+        self.tamanho_lote = tamanho_lote
+        self.rapido = rapido
+        self.indice = indice
+        self.cache = cache
+
+    def carregar(self, fonte) -> Carga:
+        """
+        Carrega o CSV.
+
+        Args:
+            fonte (str | os.PathLike | arquivo): Caminho do CSV ou objeto de
+                arquivo já aberto (texto ou binário, inclusive pipes e
+                sys.stdin), lido a partir da posição atual. Objetos de
+                arquivo não são fechados.
+
+        Returns:
+            Carga: Estruturas preenchidas.
+
+        Raises:
+            ValueError: Se processos > 1, indice ou cache e a fonte não for um
+                caminho, ou se a política de erros for "falhar" e alguma linha
+                for inválida.
+        """
+        caminho = os.fspath(fonte) if isinstance(fonte, (str, os.PathLike)) else None
+        if self.cache:
+            if caminho is None:
+                raise ValueError("O cache da carga precisa do caminho do arquivo")
+            return self.__carregar_cache(caminho)
+        return self.__carregar_fonte(fonte, caminho)
+
+    def __carregar_fonte(self, fonte, caminho: str | None, resumo=None) -> Carga:
+        """
+        Carrega a fonte. Se houver `resumo` (objeto hashlib), ele é
+        atualizado com todos os bytes do arquivo, lidos uma única vez.
+        """
+        if self.indice:
+            if caminho is None:
+                raise ValueError("A carga com índice precisa do caminho do arquivo")
+            return self.__carregar_indexado(caminho, resumo)
+        if self.processos > 1:
+            if caminho is None:
+                raise ValueError("A carga paralela precisa do caminho do arquivo")
+            return self.__carregar_paralelo(caminho, resumo=resumo)
+
+        if caminho is None:
+            return self.__carregar(fonte)
+        with open(caminho, "rb") as ficheiro:
+            return self.__carregar(ficheiro, resumo)
+
+    def __carregar(self, fonte, resumo=None) -> Carga:
+        total = _tamanho(fonte)
+        binaria = isinstance(fonte, (io.RawIOBase, io.BufferedIOBase))
+        if self.rapido and binaria:
+            if resumo is not None:
+                fonte = io.BufferedReader(
+                    _LeitorContado(fonte, resumo), buffer_size=1 << 20
+                )
+            return self.__carregar_rapido(fonte, total)
+        if binaria:
+            contador = _LeitorContado(fonte, resumo)
+            # Mesma tradução de quebras de linha de open(..., "r")
+            linhas = io.TextIOWrapper(
+                io.BufferedReader(contador, buffer_size=1 << 20), encoding=self.encoding
+            )
+        else:
+            contador = linhas = _LinhasContadas(fonte)
+
+        reader = csv.reader(
+            linhas, delimiter=";"
+        )  # Delimiter está substituindo o .split(";"), pois o split estava causando problemas.
+
+        with self.__progresso(total) as progresso:
+            # Cabeçalho original, gravado no arquivo de quarentena
+            cabecalho = next(reader, None)
+            with self.__nova_carga(cabecalho) as carga:
+                carga.descartar_cabecalho()
+                posicao = 0
+                for lote in _lotes(reader, self.tamanho_lote):
+                    carga.processar_lote(lote)
+                    progresso.avancar(contador.lidos - posicao)
+                    posicao = contador.lidos
+            progresso.concluir()
+        return carga
+
+    def __carregar_rapido(self, fonte, total: int | None) -> Carga:
+        with self.__progresso(total) as progresso:
+            bruto = fonte.readline()
+            linha = bruto.decode(self.encoding)
+            cabecalho = (
+                next(csv.reader([linha], delimiter=";"), None) if linha else None
+            )
+            progresso.avancar(len(bruto))
+            with self.__nova_carga(cabecalho) as carga:
+                carga.descartar_cabecalho()
+                leitor = LeitorRapido(carga.cabecalho, self.encoding)
+                leitor.ler(carga, fonte, progresso=progresso.avancar)
+            progresso.concluir()
+        return carga
+
+    def __carregar_cache(self, caminho: str) -> Carga:
+        cache = CacheCarga(caminho, self.encoding, self.erros)
+        # Assinatura do arquivo antes da carga: se ele mudar durante a
+        # leitura, o cache gravado não vale para o conteúdo novo
+        cache.assinatura()
+        carga = cache.restaurar(self.logger)
+        if carga is None:
+            # O resumo do conteúdo é feito durante a própria leitura
+            resumo = cache.novo_resumo()
+            carga = self.__carregar_fonte(caminho, caminho, resumo)
+            cache.gravar(carga, resumo)
+        elif self.indice:
+            carga.indice = IndiceRegistros.para_arquivo(caminho, self.encoding)
+        return carga
+
+    def __carregar_indexado(self, caminho: str, resumo=None) -> Carga:
+        indice = IndiceRegistros.para_arquivo(caminho, self.encoding)
+        if self.processos > 1:
+            carga = self.__carregar_paralelo(caminho, indice, resumo)
+        elif self.rapido:
+            carga = self.__carregar_mapeado(indice, resumo)
+        else:
+            with open(caminho, "rb") as ficheiro:
+                carga = self.__carregar(ficheiro, resumo)
+        carga.indice = indice
+        return carga
+
+    def __carregar_mapeado(self, indice: IndiceRegistros, resumo=None) -> Carga:
+        inicio, fim = int(indice.inicios[0]), int(indice.inicios[-1])
+        with self.__progresso(fim) as progresso:
+            progresso.avancar(inicio)
+            with self.__nova_carga(indice.cabecalho) as carga:
+                carga.descartar_cabecalho()
+                leitor = LeitorRapido(carga.cabecalho, self.encoding)
+                blocos = indice.blocos(-(-(fim - inicio) // TAMANHO_BLOCO))
+                if blocos:
+                    with mapear(indice.caminho) as visao:
+                        if resumo is not None:
+                            with visao[:inicio] as dados:
+                                resumo.update(dados)
+                        for comeco, termino in blocos:
+                            with visao[comeco:termino] as dados:
+                                leitor.processar(carga, dados)
+                                if resumo is not None:
+                                    resumo.update(dados)
+                            progresso.avancar(termino - comeco)
+                        if resumo is not None:
+                            with visao[fim:] as dados:
+                                resumo.update(dados)
+                elif resumo is not None:
+                    # Só o cabeçalho
+                    with open(indice.caminho, "rb") as ficheiro:
+                        resumo.update(ficheiro.read())
+            progresso.concluir()
+        return carga
+
+    def __carregar_paralelo(
+        self, caminho: str, indice: IndiceRegistros | None = None, resumo=None
+    ) -> Carga:
+        if indice is not None:
+            cabecalho, inicio = indice.cabecalho, int(indice.inicios[0])
+        else:
+            cabecalho, inicio = ler_cabecalho(caminho, self.encoding)
+        with self.__progresso(os.path.getsize(caminho)) as progresso:
+            with self.__nova_carga(cabecalho) as carga:
+                # Blocos do arquivo processados em paralelo e combinados em ordem
+                carregar_paralelo(
+                    caminho,
+                    carga,
+                    self.processos,
+                    self.encoding,
+                    progresso=progresso.avancar,
+                    rapido=self.rapido,
+                    indice=indice,
+                    resumo=resumo,
+                    inicio=inicio,
+                )
+            progresso.concluir()
+        return carga
+
+    @contextmanager
+    def __nova_carga(self, cabecalho: list[str] | None):
+        quarentena = (
+            Quarentena(self.arquivo_quarentena, cabecalho, self.encoding)
+            if self.arquivo_quarentena is not None
+            else None
+        )
+        try:
+            yield Carga(self.logger, quarentena, self.erros, cabecalho)
+        finally:
+            if quarentena is not None:
+                quarentena.fechar()
+
+    @contextmanager
+    def __progresso(self, total: int | None):
+        if self.progresso is True:
+            # Importado só quando a barra é usada: o modo sem interface não
+            # depende do alive_progress.
+            from alive_progress import alive_bar
+
+            with alive_bar(
+                total, bar="filling", spinner="radioactive", unit="B", scale="SI"
+            ) as bar:
+                yield _Progresso(bar, self.intervalo_progresso)
+        elif callable(self.progresso):
+            yield _Progresso(self.progresso, self.intervalo_progresso)
+        else:
+            yield _Progresso(lambda quantidade: None, self.intervalo_progresso)
+
+
+def carregar(fonte, **opcoes) -> Carga:
+    """
+    Atalho para Ingestor(**opcoes).carregar(fonte).
+    """
+    return Ingestor(**opcoes).carregar(fonte)
@@ -0,0 +1,358 @@
+import csv
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import pairwise
+
+import numpy as np
+
+from .carga import TAMANHO_LOTE, Carga
+from .rapido import TAMANHO_BLOCO, LeitorRapido, fins_dos_registros
+
+
+def ler_cabecalho(caminho: str, encoding: str = "latin-1") -> tuple[list[str], int]:
+    """
+    Lê o cabeçalho do CSV.
+
+    Returns:
+        tuple[list[str], int]: Campos do cabeçalho e posição (em bytes) do
+        primeiro registro de dados.
+    """
+    with open(caminho, "rb") as ficheiro:
+        bruta = ficheiro.readline()
+        cabecalho = next(csv.reader([bruta.decode(encoding)], delimiter=";"), [])
+        return cabecalho, ficheiro.tell()
+
+
+@contextmanager
+def mapear(caminho: str):
+    """
+    Mapeia o arquivo inteiro em memória (somente leitura) e entrega um
+    memoryview dele: fatias do memoryview são trechos do arquivo, sem cópia.
+    As fatias precisam ser liberadas (memoryview.release ou with) antes do
+    fim do bloco.
+    """
+    with open(caminho, "rb") as ficheiro, mmap.mmap(
+        ficheiro.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapa, memoryview(mapa) as visao:
+        yield visao
+
+
+def inicios_dos_registros(
+    caminho: str, inicio: int, encoding: str = "latin-1"
+) -> np.ndarray:
+    """
+    Varre o arquivo mapeado em memória, a partir da posição inicio (início
+    de um registro), em janelas de TAMANHO_BLOCO bytes, e localiza os
+    registros com a mesma divisão do csv.reader (fins_dos_registros),
+    inclusive com quebras de linha entre aspas e aspas que não fecham.
+
+    Returns:
+        np.ndarray: int64, início de cada registro, seguido do fim do último.
+    """
+    tamanho = os.path.getsize(caminho)
+    partes = [np.array([inicio], dtype=np.int64)]
+    if tamanho > inicio:
+        with mapear(caminho) as visao:
+            posicao, janela = inicio, TAMANHO_BLOCO
+            while posicao < tamanho:
+                fim = min(posicao + janela, tamanho)
+                with visao[posicao:fim] as dados:
+                    fins, consumidos = fins_dos_registros(
+                        dados, fim == tamanho, encoding
+                    )
+                if not consumidos:
+                    # Registro maior que a janela
+                    janela *= 2
+                    continue
+                partes.append(fins + posicao)
+                posicao, janela = posicao + consumidos, TAMANHO_BLOCO
+    return np.concatenate(partes)
+
+
+def cortar_blocos(inicios: np.ndarray, blocos: int) -> list[tuple[int, int]]:
+    """
+    Divide os registros (ver inicios_dos_registros) em até `blocos`
+    intervalos de bytes [inicio, fim) de tamanhos próximos, que começam e
+    terminam exatamente em limites de registro.
+    """
+    primeiro, ultimo = int(inicios[0]), int(inicios[-1])
+    if ultimo == primeiro:
+        return []
+    alvos = np.linspace(primeiro, ultimo, max(blocos, 1) + 1)[1:-1]
+    cortes = inicios[np.searchsorted(inicios, alvos)]
+    cortes = np.unique(np.concatenate(([primeiro], cortes, [ultimo]))).tolist()
+    return list(pairwise(cortes))
+
+
+def dividir_em_blocos(
+    caminho: str, blocos: int, inicio: int, encoding: str = "latin-1"
+) -> list[tuple[int, int]]:
+    """
+    Divide o arquivo, a partir da posição inicio, em até `blocos` intervalos
+    de bytes [inicio, fim) que começam e terminam em limites de registro.
+
+    Os limites vêm de uma varredura do arquivo inteiro
+    (inicios_dos_registros): um corte nunca cai dentro de um campo entre
+    aspas, mesmo que as aspas não fechem. A carga paralela não precisa dela
+    (ver carregar_paralelo).
+
+    Args:
+        caminho (str): Caminho do CSV.
+        blocos (int): Quantidade desejada de blocos.
+        inicio (int): Posição do primeiro registro de dados (após o cabeçalho).
+        encoding (str): Codificação do arquivo.
+    """
+    return cortar_blocos(inicios_dos_registros(caminho, inicio, encoding), blocos)
+
+
+def cortes_aproximados(caminho: str, blocos: int, inicio: int) -> list[int]:
+    """
+    Divide o arquivo, a partir da posição inicio, em até `blocos` trechos de
+    bytes de tamanhos próximos, sem varrê-lo: cada corte vai para o byte
+    seguinte à primeira quebra de linha (\\n) depois de uma posição
+    equidistante.
+
+    Um corte assim só é um limite de registro se a quebra de linha não
+    estiver dentro de um campo entre aspas; quem lê os trechos confere isso
+    (ver carregar_paralelo).
+
+    Returns:
+        list[int]: Cortes em ordem crescente, sem repetições, começando em
+        inicio e terminando no tamanho do arquivo.
+    """
+    tamanho = os.path.getsize(caminho)
+    if tamanho <= inicio:
+        return [inicio]
+    cortes = [inicio]
+    with open(caminho, "rb") as ficheiro, mmap.mmap(
+        ficheiro.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapa:
+        for alvo in np.linspace(inicio, tamanho, max(blocos, 1) + 1)[1:-1].tolist():
+            quebra = mapa.find(b"\n", max(int(alvo), cortes[-1]))
+            if quebra < 0:
+                break
+            if quebra + 1 > cortes[-1]:
+                cortes.append(quebra + 1)
+    if cortes[-1] < tamanho:
+        cortes.append(tamanho)
+    return cortes
+
+
+def fim_do_trecho(visao, inicio: int, previsto: int, encoding: str = "latin-1") -> int:
+    """
+    Lendo os registros a partir de inicio (início de um registro), retorna
+    o primeiro limite de registro em previsto ou depois dele: o próprio
+    previsto, se ele for um limite nessa leitura, ou o fim do registro que
+    passa por ele.
+
+    Args:
+        visao (memoryview): Arquivo inteiro mapeado em memória (ver mapear).
+    """
+    tamanho = len(visao)
+    if previsto >= tamanho:
+        return tamanho
+    with visao[inicio:previsto] as dados:
+        _, consumidos = fins_dos_registros(dados, False, encoding)
+    if inicio + consumidos == previsto:
+        return previsto
+    return _fim_do_registro(visao, inicio + consumidos, encoding)
+
+
+def _fim_do_registro(visao, inicio: int, encoding: str) -> int:
+    """
+    Fim do registro que começa em inicio, lido em janelas crescentes.
+    """
+    tamanho = len(visao)
+    janela = 1 << 16
+    while True:
+        fim = min(inicio + janela, tamanho)
+        with visao[inicio:fim] as dados:
+            fins, _ = fins_dos_registros(dados, fim == tamanho, encoding)
+        if len(fins):
+            return inicio + int(fins[0])
+        if fim == tamanho:
+            return tamanho
+        janela *= 2
+
+
+def _processar_bloco(
+    caminho: str,
+    inicio: int,
+    fim: int,
+    encoding: str,
+    erros: str,
+    cabecalho: list[str],
+    rapido: bool = False,
+) -> dict:
+    """
+    Processa um bloco de bytes do arquivo (que começa e termina em limites
+    de registro) em uma carga nova e retorna o seu estado parcial. Executado
+    nos processos filhos, sobre o arquivo mapeado em memória, sem cópia.
+    """
+    carga = Carga(erros=erros, cabecalho=cabecalho)
+    with mapear(caminho) as visao, visao[inicio:fim] as dados:
+        _carregar_bloco(carga, dados, encoding, rapido)
+    return carga.estado()
+
+
+def _processar_trecho(
+    caminho: str,
+    inicio: int,
+    previsto: int,
+    encoding: str,
+    erros: str,
+    cabecalho: list[str],
+    rapido: bool = False,
+) -> tuple[int, dict]:
+    """
+    Processa, em uma carga nova, os registros lidos a partir de inicio até
+    o primeiro limite de registro em previsto ou depois dele (ver
+    fim_do_trecho). Executado nos processos filhos.
+
+    Returns:
+        tuple[int, dict]: Onde o trecho terminou e o estado parcial da carga.
+    """
+    carga = Carga(erros=erros, cabecalho=cabecalho)
+    with mapear(caminho) as visao:
+        if rapido:
+            # O LeitorRapido já localiza os registros: o que vai até
+            # previsto é processado numa passada, e o que passa dele, à parte
+            leitor = LeitorRapido(cabecalho, encoding)
+            final = previsto >= len(visao)
+            with visao[inicio : min(previsto, len(visao))] as dados:
+                posicao = inicio + leitor.processar(carga, dados, final=final)
+            if final or posicao == previsto:
+                fim = posicao
+            else:
+                fim = _fim_do_registro(visao, posicao, encoding)
+            if fim > posicao:
+                with visao[posicao:fim] as dados:
+                    leitor.processar(carga, dados)
+        else:
+            fim = fim_do_trecho(visao, inicio, previsto, encoding)
+            with visao[inicio:fim] as dados:
+                _carregar_bloco(carga, dados, encoding, rapido)
+    return fim, carga.estado()
+
+
+def _carregar_bloco(carga: Carga, dados, encoding: str, rapido: bool):
+    if rapido:
+        LeitorRapido(carga.cabecalho, encoding).processar(carga, dados)
+        return
+    # Mesma tradução de quebras de linha da leitura sequencial (modo texto)
+    reader = csv.reader(
+        io.TextIOWrapper(io.BytesIO(dados), encoding=encoding), delimiter=";"
+    )
+    lote = []
+    for linha in reader:
+        lote.append(linha)
+        if len(lote) == TAMANHO_LOTE:
+            carga.processar_lote(lote)
+            lote = []
+    carga.processar_lote(lote)
+
+
+def carregar_paralelo(
+    caminho: str,
+    carga: Carga,
+    processos: int | None = None,
+    encoding: str = "latin-1",
+    blocos_por_processo: int = 4,
+    progresso=None,
+    rapido: bool = False,
+    indice=None,
+    resumo=None,
+    inicio: int | None = None,
+) -> Carga:
+    """
+    Carrega o CSV dividindo-o em blocos processados em paralelo.
+
+    Cada processo filho lê e processa um bloco do arquivo (conversão,
+    validação e pré-agregação) e devolve o estado parcial; o processo
+    principal combina os estados em `carga` na ordem do arquivo, de modo
+    que o resultado é idêntico ao da carga sequencial.
+
+    Sem índice, o arquivo não é varrido antes da carga: ele é cortado em
+    posições de bytes (cortes_aproximados) e cada processo filho lê os
+    registros a partir do seu corte até o primeiro limite de registro no
+    corte seguinte ou depois dele (fim_do_trecho), sem saber se o seu
+    próprio corte caiu dentro de um campo entre aspas. O processo principal
+    confere, em ordem, que cada trecho começa onde o anterior terminou: o
+    primeiro começa no primeiro registro, e um trecho que começa num limite
+    verdadeiro termina em outro. Se um registro passar do corte seguinte
+    (quebra de linha entre aspas, aspas que não fecham), o trecho seguinte
+    é descartado e relido pelo processo principal a partir do fim real do
+    anterior; os trechos inteiramente cobertos por esse registro são
+    ignorados.
+
+    Args:
+        caminho (str): Caminho do CSV.
+        carga (Carga): Carga que recebe os dados. O cabeçalho é contado nela
+            e a sua política de erros e o seu cabeçalho valem para os
+            processos filhos.
+        processos (int | None): Quantidade de processos. Padrão: os.cpu_count().
+        encoding (str): Codificação do arquivo.
+        blocos_por_processo (int): Blocos por processo, para equilibrar a carga.
+        progresso (callable | None): Chamado com a quantidade de bytes do
+            cabeçalho e de cada bloco combinado.
+        rapido (bool): Processa os blocos com o LeitorRapido.
+        indice (IndiceRegistros | None): Índice dos registros do arquivo.
+            Com ele, os blocos vêm do índice, já nos limites de registro, e
+            não precisam ser conferidos.
+        resumo: Objeto hashlib atualizado com o arquivo inteiro pelo processo
+            principal, enquanto os processos filhos leem os blocos.
+        inicio (int | None): Posição do primeiro registro de dados, se o
+            cabeçalho já foi lido (ver ler_cabecalho).
+
+    Returns:
+        Carga: A própria `carga`.
+    """
+    processos = processos or os.cpu_count() or 1
+    if indice is not None:
+        inicio = int(indice.inicios[0])
+    elif inicio is None:
+        _, inicio = ler_cabecalho(caminho, encoding)
+    carga.descartar_cabecalho()
+    if progresso is not None:
+        progresso(inicio)
+
+    blocos = processos * blocos_por_processo
+    if indice is not None:
+        trechos = indice.blocos(blocos)
+        tarefa = _processar_bloco
+    else:
+        trechos = list(pairwise(cortes_aproximados(caminho, blocos, inicio)))
+        tarefa = _processar_trecho
+    opcoes = (encoding, carga.politica_erros, carga.cabecalho, rapido)
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        resultados = executor.map(
+            tarefa,
+            [caminho] * len(trechos),
+            [t[0] for t in trechos],
+            [t[1] for t in trechos],
+            *([opcao] * len(trechos) for opcao in opcoes),
+        )
+        if resumo is not None and os.path.getsize(caminho):
+            # Os blocos já foram enviados: o resumo não atrasa os filhos
+            with mapear(caminho) as visao:
+                resumo.update(visao)
+        # map devolve os resultados na ordem dos blocos
+        posicao = inicio
+        for (comeco, previsto), resultado in zip(trechos, resultados):
+            if indice is not None:
+                fim, estado = previsto, resultado
+            elif comeco == posicao:
+                fim, estado = resultado
+            elif previsto > posicao:
+                # O trecho anterior passou do corte: relê a partir do fim dele
+                fim, estado = _processar_trecho(caminho, posicao, previsto, *opcoes)
+            else:
+                continue
+            carga.merge_estado(estado)
+            if progresso is not None:
+                progresso(fim - posicao)
+            posicao = fim
+    return carga
@@ -0,0 +1,758 @@
+import csv
+import io
+import re
+from itertools import pairwise
+
+import numpy as np
+
+from projeto_ped.despesa.indice_texto import tokenizar
+from projeto_ped.gestores.credor.validacao import (
+    DESCRICAO_MOTIVOS,
+    MOTIVO_VALIDO,
+    ValidadorCredores,
+)
+from projeto_ped.utils.calendario import anos_dos_dias, dias_suportados, meses_dos_dias
+
+from .esquema import ESQUEMA_PAGAMENTOS
+
+# Bytes com significado para o tokenizador
+_ASPAS = ord('"')
+_SEPARADOR = ord(";")
+_LF = ord("\n")
+_CR = ord("\r")
+_HIFEN = ord("-")
+_PONTO = ord(".")
+_ZERO = ord("0")
+
+# Tamanho padrão dos blocos lidos da fonte
+TAMANHO_BLOCO = 8 << 20
+
+# Potências de 10 usadas na conversão de dígitos (até 10**18, cabe em int64)
+_POTENCIAS = 10 ** np.arange(19, dtype=np.int64)
+
+# Textos até esta largura (em bytes) são codificados sobre uma matriz de
+# bytes (ver LeitorRapido.__codificar); colunas com textos maiores, por dict
+_LARGURA_TEXTO = 256
+
+# Tipos de trecho entregues por _Trechos
+_BLOCO = "bloco"
+_REGISTRO = "registro"
+
+# Uma linha com o seu terminador (\r\n, \r ou \n), como no modo texto
+_LINHA = re.compile(rb"[^\r\n]*(?:\r\n?|\n)?")
+
+
+def ler_registros(dados: bytes, encoding: str) -> list[list[str]]:
+    """
+    Lê registros com o csv.reader, com a mesma tradução de quebras de linha
+    da leitura em modo texto. É o caminho lento, para registros irregulares.
+    """
+    texto = io.TextIOWrapper(io.BytesIO(dados), encoding=encoding)
+    return list(csv.reader(texto, delimiter=";"))
+
+
+class _Linhas:
+    """
+    Linhas de texto de dados[inicio:], com as quebras de linha traduzidas
+    como no modo texto, para o csv.reader. `posicao` é o byte seguinte à
+    última linha entregue.
+
+    Se o trecho não for o final do arquivo, a linha que chega ao fim dos
+    dados não é entregue (pode continuar no bloco seguinte) e `incompleto`
+    passa a ser True.
+    """
+
+    def __init__(self, dados, inicio: int, final: bool, encoding: str):
+        self.__dados = dados
+        self.__final = final
+        self.__encoding = encoding
+        self.posicao = inicio
+        self.incompleto = False
+
+    def __iter__(self):
+        dados = self.__dados
+        while self.posicao < len(dados):
+            fim = _LINHA.match(dados, self.posicao).end()
+            if fim == len(dados) and not self.__final:
+                self.incompleto = True
+                return
+            linha = bytes(dados[self.posicao : fim])
+            corpo = linha.rstrip(b"\r\n")
+            self.posicao = fim
+            yield corpo.decode(self.__encoding) + (
+                "\n" if len(corpo) < len(linha) else ""
+            )
+
+
+class _Posicoes:
+    """
+    Posições dos bytes especiais de um bloco (aspas, fins de linha, \r,
+    separadores e bytes nulos) e a paridade das aspas em cada uma delas.
+    """
+
+    def __init__(self, a: np.ndarray):
+        self.a = a
+        self.aspas = np.flatnonzero(a == _ASPAS)
+        self.lf = np.flatnonzero(a == _LF)
+        self.cr = np.flatnonzero(a == _CR)
+        self.separadores = np.flatnonzero((a == _SEPARADOR) | (a == _LF))
+        self.nulos = np.flatnonzero(a == 0)
+        # A n-ésima aspa (a partir de 0) deixa a contagem ímpar se n for par
+        self.aspas_impar = (np.arange(len(self.aspas)) & 1) == 0
+        self.lf_impar = self.impar(self.lf)
+        self.cr_impar = self.impar(self.cr)
+        self.separadores_impar = self.impar(self.separadores)
+
+    def impar(self, posicoes) -> np.ndarray:
+        """
+        Se a quantidade de aspas até cada posição (inclusive) é ímpar.
+        """
+        return (np.searchsorted(self.aspas, posicoes, side="right") & 1).astype(bool)
+
+    def marcas(self, paridade: bool):
+        """
+        Posições que delimitam os registros de um trecho que começa com a
+        paridade de aspas informada.
+
+        Returns:
+            tuple: Fins de linha e separadores (;) fora de aspas, quebras (aspas
+            fora do padrão e \r isolado, em que a paridade deixa de coincidir
+            com a leitura do csv.reader) e suspeitos (quebras de linha dentro
+            de campos e bytes nulos, lidos pelo caminho comum).
+        """
+        a, ultimo = self.a, len(self.a) - 1
+
+        # Aspas de abertura só no início do campo (ou como "" dentro dele) e
+        # de fechamento só no fim do campo (ou como "")
+        abre = self.aspas[self.aspas_impar != paridade]
+        anterior = np.where(abre > 0, a[np.maximum(abre - 1, 0)], _LF)
+        abre = abre[(anterior != _SEPARADOR) & (anterior != _LF) & (anterior != _ASPAS)]
+        fecha = self.aspas[self.aspas_impar == paridade]
+        seguinte = np.where(fecha < ultimo, a[np.minimum(fecha + 1, ultimo)], _LF)
+        fecha = fecha[
+            (seguinte != _SEPARADOR)
+            & (seguinte != _LF)
+            & (seguinte != _CR)
+            & (seguinte != _ASPAS)
+        ]
+        cr_fora = self.cr[self.cr_impar == paridade]
+        seguinte = np.where(cr_fora < ultimo, a[np.minimum(cr_fora + 1, ultimo)], _LF)
+        quebras = np.concatenate((abre, fecha, cr_fora[seguinte != _LF]))
+
+        suspeitos = np.concatenate(
+            (
+                self.lf[self.lf_impar != paridade],
+                self.cr[self.cr_impar != paridade],
+                self.nulos,
+            )
+        )
+        return (
+            self.lf[self.lf_impar == paridade],
+            self.separadores[self.separadores_impar == paridade],
+            np.sort(quebras),
+            np.sort(suspeitos),
+        )
+
+
+class _Trechos:
+    """
+    Divide dados[0:] (a partir do início de um registro) em trechos, na
+    ordem do arquivo:
+        - (_BLOCO, inicio, fins, separadores, suspeitos): registros de
+          `inicio` até fins[-1] (inclusive), sem quebras de paridade; cada
+          fim de linha em `fins` termina um registro;
+        - (_REGISTRO, inicio, fim, registro): um registro lido pelo
+          csv.reader (ver _Posicoes.marcas), que termina antes de `fim`.
+    `posicao` é o byte seguinte ao último trecho entregue e `a` é o array
+    dos bytes. Se os dados não forem o final do arquivo, o registro que
+    chega ao fim deles não é entregue.
+    """
+
+    def __init__(self, dados, final: bool, encoding: str):
+        self.__dados = dados
+        self.__final = final
+        self.__encoding = encoding
+        self.a = np.frombuffer(dados, dtype=np.uint8)
+        self.posicao = 0
+
+    def __iter__(self):
+        a = self.a
+        posicoes = _Posicoes(a)
+        marcas = {}
+        while self.posicao < len(a):
+            inicio = self.posicao
+            # Paridade das aspas antes do início do trecho
+            paridade = bool(posicoes.impar(inicio - 1)) if inicio else False
+            if paridade not in marcas:
+                marcas[paridade] = posicoes.marcas(paridade)
+            fins, separadores, quebras, suspeitos = marcas[paridade]
+
+            # Registros completos até o que contém a primeira quebra
+            fins = fins[np.searchsorted(fins, inicio) :]
+            quebra = np.searchsorted(quebras, inicio)
+            if quebra < len(quebras):
+                fins = fins[: np.searchsorted(fins, quebras[quebra])]
+            if len(fins):
+                yield _BLOCO, inicio, fins, separadores, suspeitos
+                self.posicao = inicio = int(fins[-1]) + 1
+            if quebra == len(quebras) and (not self.__final or inicio == len(a)):
+                return
+
+            linhas = _Linhas(self.__dados, inicio, self.__final, self.__encoding)
+            registro = next(csv.reader(linhas, delimiter=";"), None)
+            if linhas.incompleto:
+                return
+            if registro is not None:
+                yield _REGISTRO, inicio, linhas.posicao, registro
+            self.posicao = linhas.posicao
+
+
+def fins_dos_registros(dados, final: bool = True, encoding: str = "latin-1"):
+    """
+    Localiza os registros de `dados` (a partir do início de um registro) com
+    a mesma divisão do LeitorRapido e do csv.reader.
+
+    Returns:
+        tuple[np.ndarray, int]: Posição seguinte ao fim de cada registro
+        (int64) e bytes consumidos (registros completos).
+    """
+    fins = []
+    trechos = _Trechos(dados, final, encoding)
+    for tipo, _, *resto in trechos:
+        fins.append(resto[0] + 1 if tipo == _BLOCO else np.array([resto[0]]))
+    if not fins:
+        return np.empty(0, dtype=np.int64), trechos.posicao
+    return np.concatenate(fins).astype(np.int64), trechos.posicao
+
+
+def _matriz(a: np.ndarray, inicios: np.ndarray, fins: np.ndarray, limite: int):
+    """
+    Copia os campos [inicio, fim) para uma matriz de bytes (uma linha por
+    campo, completada com zeros) de no máximo `limite` colunas: campos
+    maiores são truncados, e quem converte deve rejeitá-los pelo tamanho.
+    Retorna a matriz, a máscara dos bytes válidos e os tamanhos.
+    """
+    tamanhos = fins - inicios
+    largura = max(min(int(tamanhos.max()) if len(tamanhos) else 0, limite), 1)
+    matriz = np.zeros((len(inicios), largura), dtype=np.uint8)
+    # Janelas de `largura` bytes a partir de cada posição; as que passariam
+    # do fim dos dados vêm de uma cópia do final completada com zeros
+    base = max(len(a) - largura, 0)
+    internos = inicios < base
+    if internos.any():
+        janelas = np.lib.stride_tricks.sliding_window_view(a, largura)
+        matriz[internos] = janelas[inicios[internos]]
+    if not internos.all():
+        cauda = np.concatenate((a[base:], np.zeros(largura, dtype=np.uint8)))
+        janelas = np.lib.stride_tricks.sliding_window_view(cauda, largura)
+        matriz[~internos] = janelas[inicios[~internos] - base]
+    validos = np.arange(largura) < tamanhos[:, None]
+    matriz[~validos] = 0
+    return matriz, validos, tamanhos
+
+
+def _digitos(matriz: np.ndarray, validos: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    digitos = matriz.astype(np.int64) - _ZERO
+    return digitos, (digitos >= 0) & (digitos <= 9) & validos
+
+
+def _inteiros(matriz, validos, tamanhos) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Converte campos só com dígitos (como int() aceitaria). Retorna os valores
+    e a máscara dos campos convertidos; os demais vão para o caminho lento.
+    """
+    digitos, eh_digito = _digitos(matriz, validos)
+    ok = (tamanhos > 0) & (tamanhos <= 18) & (eh_digito.sum(axis=1) == tamanhos)
+    expoentes = np.clip(tamanhos[:, None] - 1 - np.arange(matriz.shape[1]), 0, 18)
+    valores = np.where(eh_digito, digitos * _POTENCIAS[expoentes], 0).sum(axis=1)
+    return valores, ok
+
+
+def _centavos(matriz, validos, tamanhos) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Converte valores em reais no formato -?\\d+(\\.\\d{1,2})? para centavos.
+    Outros formatos vão para o caminho lento (texto_para_centavos).
+    """
+    digitos, eh_digito = _digitos(matriz, validos)
+    colunas = np.arange(matriz.shape[1])
+    negativo = matriz[:, 0] == _HIFEN
+    eh_ponto = (matriz == _PONTO) & validos
+    pontos = eh_ponto.sum(axis=1)
+    ponto = np.where(pontos == 1, eh_ponto.argmax(axis=1), tamanhos)
+    casas = np.where(pontos == 1, tamanhos - ponto - 1, 0)
+    inteiros = ponto - negativo
+
+    ok = (
+        (pontos <= 1)
+        & (inteiros >= 1)
+        & ((pontos == 0) | ((casas >= 1) & (casas <= 2)))
+        & (tamanhos <= 16)
+        & (eh_digito.sum(axis=1) == tamanhos - pontos - negativo)
+    )
+    # Peso de cada dígito em centavos: 10**(ponto + 1 - j) na parte inteira
+    # e 10**(ponto + 2 - j) nas casas decimais
+    expoentes = ponto[:, None] + 1 - colunas + (colunas > ponto[:, None])
+    pesos = _POTENCIAS[np.clip(expoentes, 0, 18)]
+    valores = np.where(eh_digito, digitos * pesos, 0).sum(axis=1)
+    return np.where(negativo, -valores, valores), ok
+
+
+def _dias(matriz, validos, tamanhos) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Converte datas AAAA-MM-DD para dias desde 01/01/1970. Datas inexistentes,
+    fora de 1900 a 2099 ou em outro formato vão para o caminho lento.
+    """
+    if matriz.shape[1] < 10:
+        return np.zeros(len(matriz), np.int32), np.zeros(len(matriz), bool)
+    digitos, eh_digito = _digitos(matriz[:, :10], validos[:, :10])
+    posicoes_digitos = [0, 1, 2, 3, 5, 6, 8, 9]
+    ok = (
+        (tamanhos == 10)
+        & (matriz[:, 4] == _HIFEN)
+        & (matriz[:, 7] == _HIFEN)
+        & eh_digito[:, posicoes_digitos].all(axis=1)
+    )
+    ano = (
+        digitos[:, 0] * 1000 + digitos[:, 1] * 100 + digitos[:, 2] * 10 + digitos[:, 3]
+    )
+    mes = digitos[:, 5] * 10 + digitos[:, 6]
+    dia = digitos[:, 8] * 10 + digitos[:, 9]
+    ok &= (mes >= 1) & (mes <= 12) & (dia >= 1)
+
+    meses = np.where(ok, (ano - 1970) * 12 + mes - 1, 0).astype("datetime64[M]")
+    inicio = meses.astype("datetime64[D]").astype(np.int64)
+    dias_no_mes = (meses + 1).astype("datetime64[D]").astype(np.int64) - inicio
+    ok &= dia <= dias_no_mes
+    dias = np.where(ok, inicio + dia - 1, 0)
+    ok &= dias_suportados(dias)
+    return dias.astype(np.int32), ok
+
+
+# Conversor de cada tipo de coluna e largura máxima da matriz de bytes (os
+# formatos aceitos não passam de 18 dígitos, 16 caracteres e AAAA-MM-DD)
+_CONVERSORES = {
+    "inteiro": (_inteiros, 18),
+    "centavos": (_centavos, 16),
+    "dia": (_dias, 10),
+}
+
+
+def _selecionar(colunas: dict, linhas) -> dict:
+    """
+    Seleciona linhas das colunas: arrays de valores convertidos ou pares
+    (inícios, fins) dos campos de texto.
+    """
+    return {
+        campo: (
+            (valor[0][linhas], valor[1][linhas])
+            if isinstance(valor, tuple)
+            else valor[linhas]
+        )
+        for campo, valor in colunas.items()
+    }
+
+
+def _primeiros(chaves: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Agrupa as chaves na ordem da primeira ocorrência. Retorna a posição da
+    primeira ocorrência de cada grupo e o grupo de cada posição.
+    """
+    _, primeiro, inverso = np.unique(chaves, return_index=True, return_inverse=True)
+    ordem = np.argsort(primeiro, kind="stable")
+    grupo = np.empty(len(ordem), dtype=np.int64)
+    grupo[ordem] = np.arange(len(ordem))
+    return primeiro[ordem], grupo[inverso.ravel()]
+
+
+def _por_ano(
+    grupos: np.ndarray, quantidade: int, anos: np.ndarray, valores: np.ndarray
+) -> dict:
+    """
+    Estado de um AcumuladorAnual (ver AcumuladorAnual.estado) com os totais
+    por (grupo, ano).
+    """
+    if len(anos) == 0:
+        return {
+            "ano_inicial": None,
+            "valores": np.zeros((quantidade, 0), np.int64),
+            "presenca": np.zeros((quantidade, 0), bool),
+        }
+    inicial = int(anos.min())
+    formato = (quantidade, int(anos.max()) - inicial + 1)
+    totais = np.zeros(formato, dtype=np.int64)
+    presenca = np.zeros(formato, dtype=bool)
+    np.add.at(totais, (grupos, anos - inicial), valores)
+    presenca[grupos, anos - inicial] = True
+    return {"ano_inicial": inicial, "valores": totais, "presenca": presenca}
+
+
+class LeitorRapido:
+    """
+    Leitor do arquivo de pagamentos que trabalha direto sobre os bytes.
+
+    Um bloco de registros é dividido em campos com operações vetorizadas do
+    numpy (separadores e quebras de linha fora de aspas, pela paridade
+    acumulada das aspas). Códigos, valores e datas são convertidos a partir
+    dos bytes, sem passar por str, e as colunas de texto são agrupadas por
+    valor antes de decodificar: cada texto distinto é decodificado uma vez.
+    As linhas válidas entram na carga de uma só vez, como um estado parcial
+    (ver Carga.merge_estado).
+
+    Registros irregulares seguem pelo caminho comum, com o csv.reader e a
+    Carga.processar_lote, na sua posição no arquivo:
+        - quantidade de campos diferente do cabeçalho, quebras de linha
+          dentro de campos e valores fora do formato simples;
+        - aspas fora do padrão e \\r isolado. Nesses a paridade das aspas
+          deixa de valer, então o registro é lido pelo csv.reader até o seu
+          fim e a paridade recomeça dali.
+    O resultado é o mesmo da leitura com o csv.reader.
+
+    O encoding precisa representar ';', '"' e as quebras de linha como em
+    ASCII (latin-1, cp1252, utf-8).
+    """
+
+    def __init__(self, cabecalho: list[str], encoding: str = "latin-1"):
+        """
+        Raises:
+            ValueError: Se faltar alguma coluna no cabeçalho ou se o encoding
+                não for compatível com ASCII.
+        """
+        if ';"\r\n'.encode(encoding) != b';"\r\n':
+            raise ValueError(f"Encoding não suportado pelo leitor rápido: {encoding}")
+        self.__encoding = encoding
+        self.__campos = len(cabecalho)
+        self.__indices = ESQUEMA_PAGAMENTOS.indices(cabecalho)
+        self.__tipos = {
+            coluna.campo: coluna.tipo for coluna in ESQUEMA_PAGAMENTOS.colunas
+        }
+        # Decodificação do caminho comum, para classificar registros irregulares
+        self.__decodificar = ESQUEMA_PAGAMENTOS.compilar(cabecalho)
+        self.__texto_credor = ESQUEMA_PAGAMENTOS.extrator(cabecalho, "cpf_cnpj_credor")
+        # Validação usada só para classificar registros irregulares; as
+        # contagens da carga ficam no validador dela
+        self.__validador = ValidadorCredores()
+
+    def ler(self, carga, fonte, tamanho: int = TAMANHO_BLOCO, progresso=None):
+        """
+        Carrega na carga os registros de uma fonte binária, lida em blocos de
+        `tamanho` bytes a partir da posição atual (início de um registro).
+
+        Args:
+            progresso (callable | None): Chamado com a quantidade de bytes de
+                cada bloco lido.
+        """
+        resto = b""
+        while True:
+            lido = fonte.read(tamanho)
+            if not lido:
+                break
+            dados = resto + lido if resto else lido
+            resto = dados[self.processar(carga, dados, final=False) :]
+            if progresso is not None:
+                progresso(len(lido))
+        if resto:
+            self.processar(carga, resto)
+
+    def processar(self, carga, dados, final: bool = True) -> int:
+        """
+        Carrega na carga os registros de `dados` (bytes, ou memoryview de um
+        arquivo mapeado em memória), que começa no início de um registro.
+
+        Args:
+            final (bool): Se `dados` vai até o fim do arquivo. Se não for,
+                o registro que chega ao fim dos dados fica para a próxima
+                chamada.
+
+        Returns:
+            int: Bytes consumidos (registros completos carregados).
+        """
+        trechos = _Trechos(dados, final, self.__encoding)
+        for tipo, inicio, *resto in trechos:
+            if tipo == _BLOCO:
+                self.__registros(carga, dados, trechos.a, inicio, *resto)
+            else:
+                carga.processar_lote([resto[1]])
+        return trechos.posicao
+
+    def __registros(self, carga, dados, a, inicio, fins, separadores, suspeitos):
+        """
+        Carrega os registros [inicio, fins[-1]], sem quebras de paridade:
+        os regulares em bloco e os demais pelo caminho comum, em ordem.
+        """
+        inicios = np.concatenate(([inicio], fins[:-1] + 1))
+        regular = np.ones(len(fins), dtype=bool)
+        suspeitos = suspeitos[np.searchsorted(suspeitos, inicio) :]
+        registros = np.searchsorted(fins, suspeitos)
+        regular[registros[registros < len(fins)]] = False
+
+        # Campos dos registros com a quantidade certa de separadores
+        posicao_fim = np.searchsorted(separadores, fins)
+        anterior = np.searchsorted(separadores, inicio) - 1
+        regular &= np.diff(np.concatenate(([anterior], posicao_fim))) == self.__campos
+        candidatos = np.flatnonzero(regular)
+        terminos = separadores[
+            posicao_fim[candidatos, None] - self.__campos + 1 + np.arange(self.__campos)
+        ]
+        comecos = np.concatenate(
+            (inicios[candidatos, None], terminos[:, :-1] + 1), axis=1
+        )
+        # \r do fim de linha
+        terminos[:, -1] -= a[terminos[:, -1] - 1] == _CR
+
+        colunas, convertidos = {}, np.ones(len(candidatos), dtype=bool)
+        for campo, indice in self.__indices.items():
+            inicio_campo, fim_campo = comecos[:, indice], terminos[:, indice]
+            entre_aspas = (fim_campo > inicio_campo) & (a[inicio_campo] == _ASPAS)
+            inicio_campo, fim_campo = (
+                inicio_campo + entre_aspas,
+                fim_campo - entre_aspas,
+            )
+            tipo = self.__tipos[campo]
+            if tipo == "texto":
+                colunas[campo] = (inicio_campo, fim_campo)
+                continue
+            conversor, limite = _CONVERSORES[tipo]
+            colunas[campo], ok = conversor(*_matriz(a, inicio_campo, fim_campo, limite))
+            convertidos &= ok
+        regular[candidatos[~convertidos]] = False
+        limites = (inicios[candidatos], fins[candidatos] + 1)
+
+        # Os regulares entram em bloco. Trechos irregulares que só geram
+        # erros de conversão não alteram as estruturas (além do registro do
+        # erro) e não precisam interromper o bloco; os demais entram na sua
+        # posição.
+        selecao = np.flatnonzero(convertidos)
+        antes = np.concatenate(([0], np.cumsum(regular))).tolist()
+        mudancas = np.flatnonzero(np.diff(regular.astype(np.int8))) + 1
+        trechos = np.concatenate(([0], mudancas, [len(fins)])).tolist()
+        irregulares = []
+        for primeiro, ultimo in pairwise(trechos):
+            if not regular[primeiro]:
+                trecho = dados[inicios[primeiro] : fins[ultimo - 1] + 1]
+                irregulares.append(
+                    (primeiro, ultimo, ler_registros(trecho, self.__encoding))
+                )
+        sem_efeito = self.__descartaveis(
+            [r for *_, registros in irregulares for r in registros]
+        )
+
+        # Os números de registro do estado são relativos ao primeiro registro
+        # após o último trecho que entrou pelo caminho comum (`depois`)
+        desde, depois, descartaveis, linha = 0, 0, [], 0
+        for primeiro, ultimo, registros in irregulares:
+            linha += len(registros)
+            if sem_efeito[linha - len(registros) : linha].all():
+                descartaveis.extend(registros)
+                continue
+            linhas = selecao[desde : antes[primeiro]]
+            if len(linhas):
+                numeros = candidatos[linhas] - depois
+                carga.merge_estado(
+                    self.__estado(dados, a, colunas, limites, linhas, numeros, carga)
+                )
+            carga.processar_lote(descartaveis + registros)
+            desde, depois, descartaveis = antes[primeiro], ultimo, []
+        linhas = selecao[desde:]
+        if len(linhas):
+            numeros = candidatos[linhas] - depois
+            carga.merge_estado(
+                self.__estado(dados, a, colunas, limites, linhas, numeros, carga)
+            )
+        if descartaveis:
+            carga.processar_lote(descartaveis)
+
+    def __descartaveis(self, registros: list[list[str]]) -> np.ndarray:
+        """
+        Marca as linhas que a carga descartaria por erro de conversão
+        (CPF/CNPJ válido e decodificação com erro).
+        """
+        _, motivos = self.__validador.validar_lote(
+            [self.__texto_credor(registro) for registro in registros]
+        )
+        descartaveis = motivos == MOTIVO_VALIDO
+        for posicao in np.flatnonzero(descartaveis).tolist():
+            try:
+                self.__decodificar(registros[posicao])
+            except (ValueError, IndexError):
+                # Campo inválido (número, data, valor) ou faltando
+                continue
+            descartaveis[posicao] = False
+        return descartaveis
+
+    def __textos(
+        self, dados: bytes, intervalos: tuple, linhas: np.ndarray
+    ) -> list[str]:
+        """
+        Decodifica o texto das linhas informadas de uma coluna de texto.
+        """
+        encoding = self.__encoding
+        textos = []
+        for i, f in zip(intervalos[0][linhas].tolist(), intervalos[1][linhas].tolist()):
+            texto = str(dados[i:f], encoding)
+            textos.append(texto.replace('""', '"') if '"' in texto else texto)
+        return textos
+
+    def __codificar(self, dados, a: np.ndarray, inicio: np.ndarray, fim: np.ndarray):
+        """
+        Codifica uma coluna de texto por dicionário, na ordem de primeira
+        ocorrência. Retorna os textos distintos e o código de cada linha.
+
+        Colunas com textos de até _LARGURA_TEXTO bytes são agrupadas sobre
+        uma matriz de bytes; as demais, por um dict das fatias de bytes, sem
+        matriz (um texto longo não faz a matriz crescer com o bloco todo).
+        """
+        if len(inicio) and int((fim - inicio).max()) > _LARGURA_TEXTO:
+            distintos: dict[bytes, int] = {}
+            codigos = np.fromiter(
+                (
+                    distintos.setdefault(bytes(dados[i:f]), len(distintos))
+                    for i, f in zip(inicio.tolist(), fim.tolist())
+                ),
+                dtype=np.int64,
+                count=len(inicio),
+            )
+            valores = list(distintos)
+        else:
+            matriz, _, _ = _matriz(a, inicio, fim, _LARGURA_TEXTO)
+            chaves = matriz.view(f"S{matriz.shape[1]}").ravel()
+            primeiros, codigos = _primeiros(chaves)
+            valores = chaves[primeiros].tolist()
+        textos = [valor.decode(self.__encoding) for valor in valores]
+        textos = [t.replace('""', '"') if '"' in t else t for t in textos]
+        return textos, codigos.astype(np.int32)
+
+    def __estado(self, dados, a, colunas, limites, linhas, numeros, carga) -> dict:
+        """
+        Monta o estado parcial de carga (ver Carga.estado) de um trecho de
+        registros regulares. `limites` tem o intervalo de bytes de cada
+        registro, para as linhas que vão para a quarentena, e `numeros` o
+        número de cada linha entre os registros do trecho.
+        """
+        recorte = _selecionar(colunas, linhas)
+        textos_cpf, codigos_cpf = self.__codificar(
+            dados, a, *recorte["cpf_cnpj_credor"]
+        )
+        identificadores, motivos = carga.validador.validar_codificados(
+            textos_cpf, codigos_cpf
+        )
+
+        aceitas = motivos == MOTIVO_VALIDO
+        rejeitadas = np.flatnonzero(~aceitas)
+        quarentena = []
+        for posicao in rejeitadas.tolist():
+            # Linha original completa, lida pelo caminho comum
+            registro = linhas[posicao]
+            bruta = dados[limites[0][registro] : limites[1][registro]]
+            linha = ler_registros(bruta, self.__encoding)[0]
+            quarentena.append((DESCRICAO_MOTIVOS[int(motivos[posicao])], linha))
+
+        v = _selecionar(recorte, aceitas)
+        identificadores = identificadores[aceitas]
+        dias, valores = v["dia_lancamento"], v["valor"]
+        anos = anos_dos_dias(dias).astype(np.int64)
+        codigos_lancamento = v["codigo_lancamento"]
+
+        competencias, codigos_competencia = self.__codificar(
+            dados, a, *v["competencia"]
+        )
+        categorias, codigos_categoria = self.__codificar(
+            dados, a, *v["codigo_categoria_despesa"]
+        )
+        observacoes, codigos_observacao = self.__codificar(
+            dados, a, *v["observacao_lancamento"]
+        )
+
+        # Índice de texto: termo -> linhas dos lançamentos com a observação
+        ordem = np.argsort(codigos_observacao, kind="stable")
+        fatias = np.searchsorted(
+            codigos_observacao[ordem], np.arange(len(observacoes) + 1)
+        )
+        termos: dict[str, list] = {}
+        for codigo, texto in enumerate(observacoes):
+            lancamentos = ordem[fatias[codigo] : fatias[codigo + 1]]
+            for termo in set(tokenizar(texto)):
+                termos.setdefault(termo, []).append(lancamentos)
+        indice_texto = {
+            termo: np.concatenate(listas) for termo, listas in termos.items()
+        }
+
+        # Credores, categorias e organizações na ordem da primeira ocorrência
+        primeiros_credor, grupos_credor = _primeiros(identificadores)
+        primeiros_categoria, grupos_categoria = _primeiros(codigos_categoria)
+        organizacoes = v["codigo_organizacao_social"]
+        primeiros_org, grupos_org = _primeiros(organizacoes)
+
+        meses = meses_dos_dias(dias).astype(np.int64) - 1
+        stats = _por_ano(meses, 12, anos, valores)
+        if stats["ano_inicial"] is not None:
+            # Stats guarda anos x meses
+            stats = {
+                "ano_inicial": stats["ano_inicial"],
+                "valores": stats["valores"].T.copy(),
+                "presenca": stats["presenca"].any(axis=0),
+            }
+
+        quantidade, aceitas_total = len(linhas), int(aceitas.sum())
+        return {
+            "datasetinfo": {
+                "processed": quantidade,
+                "loaded": aceitas_total,
+                "disregard": quantidade - aceitas_total,
+                "quarantined": quantidade - aceitas_total,
+            },
+            "despesas": {
+                "armazem": {
+                    "codigo_lancamento": codigos_lancamento,
+                    "codigo_organizacao_social": organizacoes,
+                    "dia_lancamento": dias,
+                    "valor": valores,
+                    "competencia": {
+                        "codigos": codigos_competencia,
+                        "valores": competencias,
+                    },
+                    "codigo_categoria_despesa": {
+                        "codigos": codigos_categoria,
+                        "valores": categorias,
+                    },
+                    "cpf_cpnj_credor": identificadores,
+                    "observacao_lancamento": {
+                        "codigos": codigos_observacao,
+                        "valores": observacoes,
+                    },
+                    "registro": numeros[aceitas],
+                },
+                "indice_texto": indice_texto,
+            },
+            "credores": {
+                "identificadores": identificadores[primeiros_credor],
+                "nomes": self.__textos(dados, v["nome_credor"], primeiros_credor),
+                "receitas": _por_ano(
+                    grupos_credor, len(primeiros_credor), anos, valores
+                ),
+            },
+            "categorias": {
+                "codigos": categorias,
+                "nomes": self.__textos(dados, v["nome_categoria"], primeiros_categoria),
+                "receitas": _por_ano(
+                    grupos_categoria, len(primeiros_categoria), anos, valores
+                ),
+            },
+            "organizacoes": {
+                "ids": organizacoes[primeiros_org],
+                "nomes": self.__textos(
+                    dados, v["nome_organizacao_social"], primeiros_org
+                ),
+                "receitas": _por_ano(grupos_org, len(primeiros_org), anos, valores),
+            },
+            "stats": stats,
+            # Já contados por validar_codificados
+            "validador": {
+                "validados": 0,
+                "contagem": np.zeros(len(DESCRICAO_MOTIVOS), dtype=np.int64),
+                "mascarados": 0,
+                "desmascarados": 0,
+            },
+            "erros": [],
+            "quarentena": quarentena,
+            "registros": quantidade,
+        }
@@ -1,11 +1,20 @@
 import locale
 import os
-from datetime import datetime
 
-from projeto_ped.despesa import Despesa, GestorDespesas
-from projeto_ped.gestores import (GestaoCredor, GestorCategoriasDespesas,
-                                  GestorOrgs, desmascarar_cpf)
-from projeto_ped.utils import DatasetInfo, Stats, topn_cnpj, topn_cpf
+from projeto_ped.despesa import GestorDespesas
+from projeto_ped.gestores import (
+    GestaoCredor,
+    GestorCategoriasDespesas,
+    GestorOrgs,
+    IdentificadorCredor,
+)
+from projeto_ped.utils import (
+    DatasetInfo,
+    Stats,
+    centavos_para_reais,
+    topn_cnpj,
+    topn_cpf,
+)
 
 locale.setlocale(locale.LC_ALL, "pt_BR.UTF-8")
 
@@ -19,6 +28,7 @@ class Menu:
         gestor_categoria: GestorCategoriasDespesas,
         gestor_organizacao_social: GestorOrgs,
         stats: Stats,
+        indice=None,
     ):
         self._running = True
         self.__datasetinfo = datasetinfo
@@ -27,9 +37,15 @@ class Menu:
         self.__gestor_categoria = gestor_categoria
         self.__gestor_organizacao_social = gestor_organizacao_social
         self.__stats = stats
-
-    def _show_value_with_locale(self, value: float, decimals: int = 2) -> str:
-        return locale.format_string(f"%5.{decimals}f", value, True)
+        # Índice dos registros do arquivo carregado (IndiceRegistros), ou None
+        self.__indice = indice
+
+    def _show_value_with_locale(self, centavos: int, decimals: int = 2) -> str:
+        # Os valores são guardados em centavos; a conversão para reais só é
+        # feita aqui, na exibição.
+        return locale.format_string(
+            f"%5.{decimals}f", centavos_para_reais(centavos), True
+        )
 
     def _limpa_tela(self):
         os.system("cls" if os.name == "nt" else "clear")
@@ -41,6 +57,7 @@ class Menu:
         print("(o) Pesquisar Organização Social")
         print("(g) Consultar gasto por ano de lançamento")
         print("(d) Consultar despesa")
+        print("(b) Buscar na observação das despesas")
         print("(l) Listar")
         print("\tOrganização Social")
         print("\tCredores")
@@ -66,6 +83,8 @@ class Menu:
                 self._handle_query_gasto_ano()
             case "d":
                 self._handle_query_despesa()
+            case "b":
+                self._handle_busca_observacao()
             case "l":
                 self._handle_listar()
             case "t":
@@ -79,9 +98,13 @@ class Menu:
                 print("\nOpção Inválida! Por favor tente novamente.")
 
     def _handle_query_credor(self):
-        cpf_cnpj = input("Digite o CPF/CNPJ do credor: ").strip()
-        if '*' in cpf_cnpj:
-            cpf_cnpj = desmascarar_cpf(cpf_cnpj)
+        try:
+            cpf_cnpj = IdentificadorCredor.parse(
+                input("Digite o CPF/CNPJ do credor: ").strip()
+            )
+        except ValueError:
+            print("\nCPF/CNPJ inválido!")
+            return
         credor = self.__gestor_credor.buscar_credor(cpf_cnpj)
 
         if credor is None:
@@ -94,6 +117,8 @@ class Menu:
         for ano, valor in credor.receitas.items():
             print(f"{ano:<18} R$ {self._show_value_with_locale(valor):>12}")
 
+        self._detalhar_lancamentos(credor=credor.identificador)
+
     def _handle_query_categorias(self):
         cod_cat = input("Digite o código da categoria: ").strip()
         try:
@@ -108,6 +133,8 @@ class Menu:
         for ano, valor in categoria.ocorrencias.items():
             print(f"{ano:<18} R$ {self._show_value_with_locale(valor):>12}")
 
+        self._detalhar_lancamentos(categoria=cod_cat)
+
     def _handle_query_organizacao(self):
         cod_org = int(input("Digite o código da organização: ").strip())
 
@@ -124,6 +151,20 @@ class Menu:
         for ano, valor in receitas.items():
             print(f"{ano:<18} R$ {self._show_value_with_locale(valor):>12}")
 
+        self._detalhar_lancamentos(organizacao=cod_org)
+
+    def _detalhar_lancamentos(self, limite: int = 20, **filtro):
+        resposta = input("\nListar lançamentos? [s/N]: ").strip().lower()
+        if resposta != "s":
+            return
+
+        despesas = self.__gestor_despesas.despesas_filtradas(**filtro)
+        print(f"\n{len(despesas)} lançamento(s) encontrado(s)")
+        for despesa in despesas[:limite]:
+            print(f"\t{despesa}")
+        if len(despesas) > limite:
+            print(f"\t... e mais {len(despesas) - limite}")
+
     def _handle_query_gasto_ano(self):
         ano = int(input("Digite o ano: ").strip())
 
@@ -141,9 +182,7 @@ class Menu:
 
     def _handle_query_despesa(self):
         cod_despesa = int(input("Digite o codigo do lançamento: ").strip())
-        res = self.__gestor_despesas.busca(
-            Despesa("", 0, cod_despesa, datetime(1999, 1, 1), "", "", 0, "")
-        )
+        res = self.__gestor_despesas.busca(cod_despesa)
 
         if res is None:
             print("\nDespesa não existe!")
@@ -170,6 +209,34 @@ class Menu:
             nome_credor = credor.nome_credor
             print(f"Credor: [{res.cpf_cpnj_credor}] {nome_credor}")
         print(f"Valor: R$ {self._show_value_with_locale(res.valor)}")
+        print(f"Observação: {self._observacao_original(res)}")
+
+    def _observacao_original(self, despesa) -> str:
+        # Com o índice, a observação vem da linha original do arquivo, lida
+        # pela posição do registro; sem ele (ou se o arquivo mudou), da carga.
+        registro = self.__gestor_despesas.registro(despesa)
+        if self.__indice is not None and registro is not None:
+            try:
+                return self.__indice.campo(registro, "observacao_lancamento")
+            except (KeyError, ValueError):
+                pass
+        return despesa.observacao_lancamento
+
+    def _handle_busca_observacao(self, limite: int = 20):
+        consulta = input("Digite os termos da busca: ").strip()
+        modo = input("Modo [e/ou/frase] (padrão e): ").strip().lower() or "e"
+
+        try:
+            despesas = self.__gestor_despesas.pesquisar_observacao(consulta, modo)
+        except ValueError:
+            print("\nModo inválido!")
+            return
+
+        print(f"\n{len(despesas)} lançamento(s) encontrado(s)")
+        for despesa in despesas[:limite]:
+            print(f"\t{despesa} - {despesa.observacao_lancamento}")
+        if len(despesas) > limite:
+            print(f"\t... e mais {len(despesas) - limite}")
 
     def _handle_listar(self):
         print("(c) Credor")
@@ -283,18 +350,18 @@ class Menu:
             print(f"{chave:<18} R$ {self._show_value_with_locale(valor):>12}")
 
     def _handle_estatisticas(self):
-        anos: list[tuple[int, float]] = self.__stats.get_total_por_ano()
+        anos: list[tuple[int, int]] = self.__stats.get_total_por_ano()
         total = self.__stats.total
 
         maior_cpf = None
-        maior_cpf_valor = 0.0
+        maior_cpf_valor = 0
 
         maior_cnpj = None
-        maior_cnpj_valor = 0.0
+        maior_cnpj_valor = 0
 
         for credor in self.__gestor_credor.credores.values():
             valor = sum(credor.receitas.values())
-            if len(credor.identificador) == 14:
+            if credor.identificador.eh_cpf:
                 if valor > maior_cpf_valor:
                     maior_cpf = credor
                     maior_cpf_valor = valor
@@ -312,6 +379,11 @@ class Menu:
         print(
             f"\nQuantidade de lançamentos de despesas processadas: {self.__datasetinfo.loaded}"
         )
+        if self.__datasetinfo.quarantined:
+            print(
+                "Lançamentos em quarentena (CPF/CNPJ inválido): "
+                f"{self.__datasetinfo.quarantined}"
+            )
 
         print("Despesas por ano encontrados:")
         for ano, valor in anos:
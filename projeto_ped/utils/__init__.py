@@ -1,6 +1,29 @@
+from .acumulador import AcumuladorAnual, LinhaAnual
+from .calendario import DimensaoData
 from .dataset_info import DatasetInfo
+from .dimensao import Dimensao, RegistroDimensoes
+from .dinheiro import centavos_para_reais, texto_para_centavos
 from .logger import Logger
+from .pool import PoolStrings
+from .quarentena import Quarentena
 from .stats import Stats
 from .top import topn_cnpj, topn_cpf
+from .vetor import VetorNumpy
 
-__all__ = ["Logger", "DatasetInfo", "Stats", "topn_cnpj", "topn_cpf"]
+__all__ = [
+    "AcumuladorAnual",
+    "DatasetInfo",
+    "Dimensao",
+    "DimensaoData",
+    "LinhaAnual",
+    "Logger",
+    "PoolStrings",
+    "Quarentena",
+    "RegistroDimensoes",
+    "Stats",
+    "VetorNumpy",
+    "centavos_para_reais",
+    "texto_para_centavos",
+    "topn_cnpj",
+    "topn_cpf",
+]
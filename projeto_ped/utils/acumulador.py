@@ -0,0 +1,222 @@
+import numpy as np
+
+
+class AcumuladorAnual:
+    """
+    Matriz de totais por (id, ano), endereçada diretamente.
+
+    As linhas são os ids densos de uma dimensão e as colunas são os anos, a
+    partir do menor ano visto (deslocamento). A matriz cresce conforme
+    surgem novos ids ou anos. Uma segunda matriz marca quais pares (id, ano)
+    receberam algum lançamento, para distinguir "sem lançamentos" de
+    "total zero".
+
+    Os valores monetários são somados como inteiros de centavos (int64).
+    """
+
+    def __init__(self, dtype=np.int64):
+        self.__valores = np.zeros((16, 1), dtype=dtype)
+        self.__presenca = np.zeros((16, 1), dtype=bool)
+        self.__ano_inicial: int | None = None
+        self.__linhas = 0
+
+    def __garantir(self, linha_max: int, ano_min: int, ano_max: int):
+        """
+        Redimensiona as matrizes para comportar a linha e os anos informados.
+        """
+        linhas, colunas = self.__valores.shape
+        if self.__ano_inicial is None:
+            self.__ano_inicial = ano_min
+        antes = max(0, self.__ano_inicial - ano_min)
+        depois = max(0, ano_max - (self.__ano_inicial + colunas - 1))
+        novas_linhas = linhas
+        while novas_linhas <= linha_max:
+            novas_linhas *= 2
+
+        if antes or depois or novas_linhas != linhas:
+            formato = (novas_linhas, colunas + antes + depois)
+            valores = np.zeros(formato, dtype=self.__valores.dtype)
+            presenca = np.zeros(formato, dtype=bool)
+            valores[:linhas, antes : antes + colunas] = self.__valores
+            presenca[:linhas, antes : antes + colunas] = self.__presenca
+            self.__valores = valores
+            self.__presenca = presenca
+            self.__ano_inicial -= antes
+
+        if linha_max >= self.__linhas:
+            self.__linhas = linha_max + 1
+
+    def acumular(self, linha: int, ano: int, valor):
+        """
+        Soma o valor ao total da linha no ano informado.
+        """
+        coluna = ano - self.__ano_inicial if self.__ano_inicial is not None else -1
+        if linha >= self.__linhas or coluna < 0 or coluna >= self.__valores.shape[1]:
+            self.__garantir(linha, ano, ano)
+            coluna = ano - self.__ano_inicial
+        self.__valores[linha, coluna] += valor
+        self.__presenca[linha, coluna] = True
+
+    def acumular_muitos(
+        self, linhas: np.ndarray, anos: np.ndarray, valores: np.ndarray
+    ):
+        """
+        Versão vetorizada de acumular, para colunas inteiras de lançamentos.
+        """
+        linhas = np.asarray(linhas, dtype=np.int64)
+        anos = np.asarray(anos, dtype=np.int64)
+        if len(linhas) == 0:
+            return
+        self.__garantir(int(linhas.max()), int(anos.min()), int(anos.max()))
+        colunas = anos - self.__ano_inicial
+        np.add.at(self.__valores, (linhas, colunas), valores)
+        self.__presenca[linhas, colunas] = True
+
+    def estado(self, linhas=None) -> dict:
+        """
+        Retorna o estado parcial compacto do acumulador: apenas arrays numpy e
+        inteiros, baratos de serializar (pickle) entre processos.
+
+        Parameters
+        ----------
+        linhas : array-like de int, opcional
+            Linhas a incluir, nesta ordem. Todas, se não for informado.
+        """
+        if linhas is None:
+            linhas = np.arange(self.__linhas)
+        linhas = np.asarray(linhas, dtype=np.int64)
+        return {
+            "ano_inicial": self.__ano_inicial,
+            "valores": self.__valores[linhas],
+            "presenca": self.__presenca[linhas],
+        }
+
+    def somar_estado(self, estado: dict, linhas_destino):
+        """
+        Soma um estado parcial (ver estado) a este acumulador. A linha i do
+        estado é somada à linha linhas_destino[i]; os ids de quem produziu o
+        estado não precisam coincidir com os deste acumulador.
+        """
+        linhas_destino = np.asarray(linhas_destino, dtype=np.int64)
+        ano_inicial = estado["ano_inicial"]
+        if ano_inicial is None or len(linhas_destino) == 0:
+            return
+        colunas = estado["valores"].shape[1]
+        self.__garantir(
+            int(linhas_destino.max()), ano_inicial, ano_inicial + colunas - 1
+        )
+        inicio = ano_inicial - self.__ano_inicial
+        bloco = np.ix_(linhas_destino, np.arange(inicio, inicio + colunas))
+        self.__valores[bloco] += estado["valores"]
+        self.__presenca[bloco] |= estado["presenca"]
+
+    def merge(self, other: "AcumuladorAnual"):
+        """
+        Soma os totais de outro acumulador, linha a linha (mesmos ids).
+        """
+        self.somar_estado(other.estado(), np.arange(len(other)))
+
+    def por_ano(self, linha: int) -> dict:
+        """
+        Retorna os totais da linha no formato {ano: total}, apenas para os
+        anos com lançamentos, em ordem crescente de ano.
+        """
+        if linha >= self.__linhas:
+            return {}
+        colunas = np.flatnonzero(self.__presenca[linha])
+        return {
+            self.__ano_inicial + int(c): self.__valores[linha, c].item()
+            for c in colunas
+        }
+
+    def valor(self, linha: int, ano: int):
+        """
+        Retorna o total da linha em um ano.
+
+        Raises
+        ------
+        KeyError
+            Se a linha não tiver lançamentos no ano.
+        """
+        coluna = ano - self.__ano_inicial if self.__ano_inicial is not None else -1
+        if (
+            linha >= self.__linhas
+            or coluna < 0
+            or coluna >= self.__valores.shape[1]
+            or not self.__presenca[linha, coluna]
+        ):
+            raise KeyError(ano)
+        return self.__valores[linha, coluna].item()
+
+    def total(self, linha: int):
+        """
+        Retorna o total da linha somando todos os anos.
+        """
+        if linha >= self.__linhas:
+            return 0
+        return self.__valores[linha].sum().item()
+
+    def totais(self) -> np.ndarray:
+        """
+        Retorna o total de todos os anos para cada linha.
+        """
+        return self.__valores[: self.__linhas].sum(axis=1)
+
+    def coluna(self, ano: int) -> np.ndarray:
+        """
+        Retorna os totais de todas as linhas em um ano (zeros se o ano não existir).
+        """
+        if self.__ano_inicial is None:
+            return np.zeros(self.__linhas, dtype=self.__valores.dtype)
+        coluna = ano - self.__ano_inicial
+        if coluna < 0 or coluna >= self.__valores.shape[1]:
+            return np.zeros(self.__linhas, dtype=self.__valores.dtype)
+        return self.__valores[: self.__linhas, coluna]
+
+    def zerar(self, linha: int):
+        """
+        Remove todos os totais de uma linha.
+        """
+        if linha < self.__linhas:
+            self.__valores[linha] = 0
+            self.__presenca[linha] = False
+
+    @property
+    def anos(self) -> list[int]:
+        """
+        Anos que possuem algum lançamento, em ordem crescente.
+        """
+        if self.__ano_inicial is None:
+            return []
+        colunas = np.flatnonzero(self.__presenca[: self.__linhas].any(axis=0))
+        return [self.__ano_inicial + int(c) for c in colunas]
+
+    def __len__(self) -> int:
+        return self.__linhas
+
+
+class LinhaAnual:
+    """
+    Visão sobre uma linha de um AcumuladorAnual: os totais por ano de uma
+    única entidade (credor, categoria, organização...).
+
+    Criada sem acumulador, a visão usa um acumulador próprio de uma linha.
+    """
+
+    __slots__ = ("_acumulador", "_linha")
+
+    def __init__(self, acumulador: AcumuladorAnual | None = None, linha: int = 0):
+        self._acumulador = acumulador if acumulador is not None else AcumuladorAnual()
+        self._linha = linha
+
+    def acumular(self, ano: int, valor):
+        self._acumulador.acumular(self._linha, ano, valor)
+
+    def por_ano(self) -> dict:
+        return self._acumulador.por_ano(self._linha)
+
+    def valor(self, ano: int):
+        return self._acumulador.valor(self._linha, ano)
+
+    def total(self):
+        return self._acumulador.total(self._linha)
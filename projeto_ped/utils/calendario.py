@@ -0,0 +1,162 @@
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+# As datas são representadas como número de dias desde 01/01/1970, o mesmo
+# referencial do tipo datetime64[D] do numpy.
+_EPOCA = datetime(1970, 1, 1)
+_ORDINAL_EPOCA = _EPOCA.toordinal()
+
+# Tabelas de consulta de ano, mês e trimestre, indexadas por
+# (dia - _DIA_INICIAL), cobrindo de 01/01/1900 a 31/12/2099.
+_DIA_INICIAL = date(1900, 1, 1).toordinal() - _ORDINAL_EPOCA
+_DIA_FINAL = date(2099, 12, 31).toordinal() - _ORDINAL_EPOCA
+
+_DIAS = np.arange(_DIA_INICIAL, _DIA_FINAL + 1).astype("datetime64[D]")
+_ANOS = (_DIAS.astype("datetime64[Y]").astype(np.int64) + 1970).astype(np.int16)
+_MESES = (_DIAS.astype("datetime64[M]").astype(np.int64) % 12 + 1).astype(np.int8)
+_TRIMESTRES = ((_MESES - 1) // 3 + 1).astype(np.int8)
+del _DIAS
+
+
+def data_para_dia(data: date) -> int:
+    """
+    Converte uma data (date ou datetime) para o número de dias desde 01/01/1970.
+    """
+    return data.toordinal() - _ORDINAL_EPOCA
+
+
+def dia_para_data(dia: int) -> datetime:
+    """
+    Converte um número de dias desde 01/01/1970 para datetime.
+    """
+    return _EPOCA + timedelta(days=int(dia))
+
+
+def como_dia(data: int | date) -> int:
+    """
+    Aceita um número de dias ou uma data (date/datetime) e retorna o número
+    de dias desde 01/01/1970.
+    """
+    if isinstance(data, date):
+        return data_para_dia(data)
+    return int(data)
+
+
+def _posicao(dia: int) -> int:
+    if not _DIA_INICIAL <= dia <= _DIA_FINAL:
+        raise ValueError(f"Data fora do intervalo suportado: {dia_para_data(dia)}")
+    return dia - _DIA_INICIAL
+
+
+def ano_do_dia(dia: int) -> int:
+    """
+    Retorna o ano do dia informado (dias desde 01/01/1970).
+    """
+    return int(_ANOS[_posicao(dia)])
+
+
+def mes_do_dia(dia: int) -> int:
+    """
+    Retorna o mês (1 a 12) do dia informado.
+    """
+    return int(_MESES[_posicao(dia)])
+
+
+def trimestre_do_dia(dia: int) -> int:
+    """
+    Retorna o trimestre (1 a 4) do dia informado.
+    """
+    return int(_TRIMESTRES[_posicao(dia)])
+
+
+def dias_suportados(dias) -> np.ndarray:
+    """
+    Máscara dos dias dentro do intervalo das tabelas (1900 a 2099).
+    """
+    dias = np.asarray(dias, dtype=np.int64)
+    return (dias >= _DIA_INICIAL) & (dias <= _DIA_FINAL)
+
+
+def _posicoes(dias) -> np.ndarray:
+    dias = np.asarray(dias, dtype=np.int64)
+    if len(dias) and (dias.min() < _DIA_INICIAL or dias.max() > _DIA_FINAL):
+        raise ValueError("Há datas fora do intervalo suportado")
+    return dias - _DIA_INICIAL
+
+
+def anos_dos_dias(dias) -> np.ndarray:
+    """
+    Versão vetorizada de ano_do_dia.
+    """
+    return _ANOS[_posicoes(dias)]
+
+
+def meses_dos_dias(dias) -> np.ndarray:
+    """
+    Versão vetorizada de mes_do_dia.
+    """
+    return _MESES[_posicoes(dias)]
+
+
+def trimestres_dos_dias(dias) -> np.ndarray:
+    """
+    Versão vetorizada de trimestre_do_dia.
+    """
+    return _TRIMESTRES[_posicoes(dias)]
+
+
+class DimensaoData:
+    """
+    Dimensão de datas: converte cada texto de data distinto ("AAAA-MM-DD")
+    uma única vez para o número de dias desde 01/01/1970.
+
+    O arquivo de pagamentos tem poucos milhares de datas distintas para
+    milhões de linhas; as demais ocorrências são uma consulta de dicionário.
+    Ano, mês e trimestre de um dia são obtidos por indexação em tabelas
+    pré-calculadas.
+    """
+
+    def __init__(self, formato: str = "%Y-%m-%d"):
+        """
+        Parameters
+        ----------
+        formato : str
+            Formato das datas em texto, como em datetime.strptime.
+        """
+        self.__formato = formato
+        self.__dias: dict[str, int] = {}
+
+    def dia(self, texto: str) -> int:
+        """
+        Retorna o número de dias desde 01/01/1970 da data em texto.
+
+        Raises
+        ------
+        ValueError
+            Se o texto não estiver no formato ou a data estiver fora do
+            intervalo suportado (1900 a 2099).
+        """
+        dia = self.__dias.get(texto)
+        if dia is None:
+            dia = data_para_dia(datetime.strptime(texto, self.__formato))
+            _posicao(dia)
+            self.__dias[texto] = dia
+        return dia
+
+    def dias(self, textos) -> np.ndarray:
+        """
+        Versão em lote de dia: retorna um array int32.
+        """
+        return np.fromiter((self.dia(t) for t in textos), dtype=np.int32)
+
+    ano = staticmethod(ano_do_dia)
+    mes = staticmethod(mes_do_dia)
+    trimestre = staticmethod(trimestre_do_dia)
+    data = staticmethod(dia_para_data)
+
+    def __len__(self) -> int:
+        """
+        Quantidade de datas distintas já convertidas.
+        """
+        return len(self.__dias)
@@ -1,33 +1,29 @@
 class DatasetInfo:
-    '''
+    """
     Classe para armazenar informações sobre o processamento do dataset.
     Informações contidas:
     - Linhas processadas
     - Linhas carregadas
-    - Linhas descartadas        
-    '''
-    _instance = None  # Atributo estático para armazenar a única instância
-
-    def __new__(cls, *args, **kwargs):
-        """
-        Método especial para controlar a criação de instâncias.
-        Garante que apenas uma instância da classe seja criada.
-        """
-        if cls._instance is None:
-            cls._instance = super(DatasetInfo, cls).__new__(cls)
-            cls._instance._initialized = False  # Flag para evitar re-inicialização
-        return cls._instance
+    - Linhas descartadas
+    """
 
     def __init__(self):
         """
-        Inicializa a instância única.
-        """
-        if not self._initialized:
-            self._initialized = True  # Marca como inicializado
-            self.__processed = 0  # Linhas que estão em processamento
-            self.__loaded = 0  # Linhas que não possuem erro e foram adicionadas às estruturas de dados
-            self.__disregard = 0  # Linhas que apresentaram algum problema e foram descartadas (cabeçalho também conta)
-            
+        Inicializa os contadores zerados.
+
+        Cada carga (ou cada parte de uma carga paralela) tem o seu próprio
+        objeto; objetos parciais são combinados com merge.
+        """
+        # Linhas que estão em processamento
+        self.__processed = 0
+        # Linhas que não possuem erro e foram adicionadas às estruturas de dados
+        self.__loaded = 0
+        # Linhas que apresentaram algum problema e foram descartadas
+        # (cabeçalho também conta)
+        self.__disregard = 0
+        # Linhas descartadas por CPF/CNPJ inválido e enviadas para a quarentena
+        self.__quarantined = 0
+
     # Métodos para processar, carregar ou descartar linhas
     def update_processed(self):
         """
@@ -55,7 +51,16 @@ class DatasetInfo:
         ou por ser o cabeçalho do dataset.
         """
         self.__disregard += 1
-    
+
+    def update_quarantined(self, quantidade=1):
+        """
+        Incrementa o contador de linhas enviadas para a quarentena.
+
+        As linhas em quarentena também são contadas como descartadas.
+        """
+        self.__quarantined += quantidade
+        self.__disregard += quantidade
+
     # Métodos para retornar valores e exibir o progresso de leitura do .csv
 
     @property
@@ -67,21 +72,64 @@ class DatasetInfo:
             int: Número de linhas processadas.
         """
         return self.__processed
-    
+
     @property
     def loaded(self):
         """
         Retorna o número total de linhas carregadas
         """
         return self.__loaded
-    
+
     @property
     def disregard(self):
         """
         Retorna o número total de linhas descartadas
         """
         return self.__disregard
-    
+
+    @property
+    def quarantined(self):
+        """
+        Retorna o número total de linhas enviadas para a quarentena
+        """
+        return self.__quarantined
+
+    # Métodos para combinar contadores parciais (cargas paralelas)
+
+    def estado(self):
+        """
+        Retorna os contadores em um dict, serializável entre processos.
+        """
+        return {
+            "processed": self.__processed,
+            "loaded": self.__loaded,
+            "disregard": self.__disregard,
+            "quarantined": self.__quarantined,
+        }
+
+    def merge_estado(self, estado):
+        """
+        Soma os contadores de um estado parcial (ver estado) a estes.
+        """
+        self.__processed += estado["processed"]
+        self.__loaded += estado["loaded"]
+        self.__disregard += estado["disregard"]
+        self.__quarantined += estado["quarantined"]
+
+    def merge(self, other):
+        """
+        Soma os contadores de outro DatasetInfo a estes.
+        """
+        self.merge_estado(other.estado())
+
+    @classmethod
+    def de_estado(cls, estado):
+        """
+        Reconstrói um DatasetInfo a partir de um estado parcial.
+        """
+        info = cls()
+        info.merge_estado(estado)
+        return info
 
     def show_progress(self):
         """
@@ -91,4 +139,4 @@ class DatasetInfo:
         e, se for, exibe uma mensagem de progresso no console.
         """
         if self.__processed % 1000 == 0:
-            print('Progresso:', self.__processed)
+            print("Progresso:", self.__processed)
@@ -0,0 +1,97 @@
+import numpy as np
+
+from .calendario import DimensaoData
+
+
+class Dimensao:
+    """
+    Dimensão com chaves substitutas (surrogate keys) densas.
+
+    Cada chave natural (código da organização, código da categoria,
+    CPF/CNPJ do credor...) recebe, na ordem em que aparece, um id inteiro
+    sequencial (0, 1, 2, ...). Os gestores usam esse id para endereçar
+    diretamente as linhas dos seus arrays de agregados.
+
+    Attributes
+    ----------
+    nome : str
+        Nome da dimensão.
+    """
+
+    def __init__(self, nome: str = ""):
+        self.nome = nome
+        self.__ids: dict = {}
+        self.__chaves: list = []
+
+    def id_de(self, chave) -> int:
+        """
+        Retorna o id da chave natural, registrando-a se for nova.
+        """
+        id = self.__ids.get(chave)
+        if id is None:
+            id = len(self.__chaves)
+            self.__ids[chave] = id
+            self.__chaves.append(chave)
+        return id
+
+    def ids_de(self, chaves) -> np.ndarray:
+        """
+        Versão em lote de id_de: retorna um array int32 com os ids.
+        """
+        return np.fromiter((self.id_de(c) for c in chaves), dtype=np.int32)
+
+    def buscar(self, chave) -> int | None:
+        """
+        Retorna o id de uma chave natural, ou None se ela não estiver registrada.
+        """
+        return self.__ids.get(chave)
+
+    def chave(self, id: int):
+        """
+        Retorna a chave natural de um id.
+
+        Raises
+        ------
+        IndexError
+            Se o id não existir.
+        """
+        return self.__chaves[id]
+
+    @property
+    def chaves(self) -> list:
+        """
+        Chaves naturais, na ordem dos ids.
+        """
+        return self.__chaves
+
+    def __contains__(self, chave) -> bool:
+        return chave in self.__ids
+
+    def __iter__(self):
+        return iter(self.__chaves)
+
+    def __len__(self) -> int:
+        return len(self.__chaves)
+
+
+class RegistroDimensoes:
+    """
+    Registro das dimensões compartilhadas pelos gestores durante a carga.
+
+    Attributes
+    ----------
+    organizacoes : Dimensao
+        Códigos das organizações sociais.
+    categorias : Dimensao
+        Códigos das categorias de despesa.
+    credores : Dimensao
+        CPF/CNPJ dos credores.
+    datas : DimensaoData
+        Datas de lançamento (texto -> dias desde 01/01/1970).
+    """
+
+    def __init__(self):
+        self.organizacoes = Dimensao("organizacoes")
+        self.categorias = Dimensao("categorias")
+        self.credores = Dimensao("credores")
+        self.datas = DimensaoData()
@@ -0,0 +1,42 @@
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+# Os valores monetários são guardados e somados como inteiros de centavos
+# (int64 nos arrays), para que os totais sejam exatos e não dependam da
+# ordem das linhas. A conversão para reais só é feita na exibição.
+
+_CENTAVO = Decimal("0.01")
+
+
+def texto_para_centavos(texto: str) -> int:
+    """
+    Converte um valor em reais escrito com ponto decimal ("1234.56",
+    "-12.5", "300") para centavos, sem passar por float. Valores com mais
+    de duas casas decimais são arredondados (meio centavo para cima).
+
+    Raises
+    ------
+    ValueError
+        Se o texto não for um número finito.
+    """
+    inteiro, ponto, fracao = texto.strip().partition(".")
+    if len(fracao) <= 2 and (fracao.isdigit() or not fracao):
+        # No máximo um sinal: "--5" e "+-5" vão para o Decimal, que os rejeita
+        digitos = inteiro[1:] if inteiro[:1] in ("+", "-") else inteiro
+        if digitos.isdigit() or (ponto and not digitos and fracao):
+            centavos = int(digitos or "0") * 100 + int(fracao.ljust(2, "0"))
+            return -centavos if inteiro.startswith("-") else centavos
+
+    try:
+        valor = Decimal(texto.strip())
+    except InvalidOperation:
+        raise ValueError(f"Valor inválido: {texto}")
+    if not valor.is_finite():
+        raise ValueError(f"Valor inválido: {texto}")
+    return int(valor.quantize(_CENTAVO, rounding=ROUND_HALF_UP) * 100)
+
+
+def centavos_para_reais(centavos: int) -> float:
+    """
+    Converte centavos para reais, para exibição.
+    """
+    return centavos / 100
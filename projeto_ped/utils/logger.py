@@ -1,5 +1,6 @@
 import logging
 
+
 class Logger:
     """
     Classe responsável por configurar e gerenciar o registro de logs em um arquivo.
@@ -9,8 +10,9 @@ class Logger:
         log_level (int): Nível mínimo de mensagens a serem registradas. Padrão: logging.ERROR.
     """
 
-    def __init__(self, log_file="erros_processamento_despesa.log", 
-                       log_level = logging.ERROR):
+    def __init__(
+        self, log_file="erros_processamento_despesa.log", log_level=logging.ERROR
+    ):
         """
         Inicializa uma instância da classe Logger.
 
@@ -23,10 +25,10 @@ class Logger:
 
         # Configuração do logging
         logging.basicConfig(
-            filename = self.log_file,
-            level = self.log_level,
-            format = "%(asctime)s \t %(levelname)s \t %(message)s",
-            datefmt = "%Y-%m-%d"
+            filename=self.log_file,
+            level=self.log_level,
+            format="%(asctime)s \t %(levelname)s \t %(message)s",
+            datefmt="%Y-%m-%d",
         )
 
     def log_error(self, message):
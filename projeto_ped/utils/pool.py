@@ -0,0 +1,55 @@
+class PoolStrings:
+    """
+    Dicionário de strings (string pool) para codificação de colunas de texto.
+
+    Cada texto distinto é guardado uma única vez e recebe um código inteiro
+    pequeno e sequencial (0, 1, 2, ...). Quem guarda o código no lugar do
+    texto economiza memória e compara valores com uma comparação de inteiros.
+    """
+
+    def __init__(self):
+        self.__valores: list[str] = []
+        self.__codigos: dict[str, int] = {}
+
+    def codificar(self, texto: str) -> int:
+        """
+        Retorna o código do texto, registrando-o se ainda não existir.
+        """
+        codigo = self.__codigos.get(texto)
+        if codigo is None:
+            codigo = len(self.__valores)
+            self.__codigos[texto] = codigo
+            self.__valores.append(texto)
+        return codigo
+
+    def internar(self, texto: str) -> str:
+        """
+        Retorna a instância única guardada no pool para o texto informado,
+        permitindo descartar a cópia recebida.
+        """
+        return self.__valores[self.codificar(texto)]
+
+    def codigo_de(self, texto: str) -> int | None:
+        """
+        Retorna o código de um texto já registrado, ou None se ele não existir.
+        """
+        return self.__codigos.get(texto)
+
+    @property
+    def valores(self) -> list[str]:
+        """
+        Textos registrados, na ordem dos códigos.
+        """
+        return self.__valores
+
+    def __getitem__(self, codigo: int) -> str:
+        return self.__valores[codigo]
+
+    def __contains__(self, texto: str) -> bool:
+        return texto in self.__codigos
+
+    def __iter__(self):
+        return iter(self.__valores)
+
+    def __len__(self) -> int:
+        return len(self.__valores)
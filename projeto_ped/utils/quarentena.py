@@ -0,0 +1,79 @@
+import csv
+
+# Linhas acumuladas antes de cada gravação no CSV de quarentena
+TAMANHO_BUFFER = 4096
+
+
+class Quarentena:
+    """
+    Saída de quarentena da carga: linhas rejeitadas pela validação são
+    gravadas em um CSV à parte, com o código do motivo na primeira coluna,
+    para que possam ser conferidas e corrigidas na fonte.
+
+    O arquivo só é criado quando a primeira linha é rejeitada. As linhas são
+    acumuladas e gravadas a cada TAMANHO_BUFFER linhas e ao fechar (ou no
+    fim do bloco with), sem manter o arquivo aberto entre as gravações.
+
+    Atributos:
+        arquivo (str): Caminho do CSV de quarentena. Padrão: "quarentena_despesas.csv".
+        encoding (str): Codificação do CSV de quarentena, a mesma do arquivo
+            de despesas. Padrão: "latin-1".
+        quantidade (int): Linhas já enviadas para a quarentena.
+    """
+
+    def __init__(
+        self, arquivo="quarentena_despesas.csv", cabecalho=None, encoding="latin-1"
+    ):
+        """
+        Args:
+            arquivo (str): Caminho do CSV de quarentena.
+            cabecalho (list[str] | None): Cabeçalho original do arquivo de
+                despesas, gravado após a coluna MOTIVO.
+            encoding (str): Codificação do CSV de quarentena.
+        """
+        self.arquivo = arquivo
+        self.encoding = encoding
+        self.__cabecalho = cabecalho
+        self.__criado = False
+        self.__pendentes = []
+        self.__quantidade = 0
+
+    def registrar(self, linha, motivo):
+        """
+        Envia uma linha para a quarentena.
+
+        Args:
+            linha (list[str]): Campos originais da linha.
+            motivo (str): Código do motivo da rejeição.
+        """
+        self.__pendentes.append([motivo, *linha])
+        self.__quantidade += 1
+        if len(self.__pendentes) >= TAMANHO_BUFFER:
+            self.__gravar()
+
+    def __gravar(self):
+        modo = "a" if self.__criado else "w"
+        with open(self.arquivo, modo, encoding=self.encoding, newline="") as ficheiro:
+            writer = csv.writer(ficheiro, delimiter=";")
+            if not self.__criado and self.__cabecalho is not None:
+                writer.writerow(["MOTIVO", *self.__cabecalho])
+            writer.writerows(self.__pendentes)
+        self.__criado = True
+        self.__pendentes = []
+
+    def fechar(self):
+        """
+        Grava as linhas pendentes no CSV de quarentena.
+        """
+        if self.__pendentes:
+            self.__gravar()
+
+    @property
+    def quantidade(self):
+        return self.__quantidade
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
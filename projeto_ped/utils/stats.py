@@ -1,5 +1,10 @@
 import locale
-from datetime import datetime
+from datetime import date
+
+import numpy as np
+
+from .calendario import ano_do_dia, anos_dos_dias, como_dia, mes_do_dia, meses_dos_dias
+from .dinheiro import centavos_para_reais
 
 locale.setlocale(locale.LC_ALL, "pt_BR.UTF-8")
 
@@ -12,11 +17,11 @@ class Mes:
     ----------
     __mes : int
         Número do mês.
-    __total : float
+    __total : int
         Total acumulado das despesas do mês.
     """
 
-    def __init__(self, mes: int):
+    def __init__(self, mes: int, total: int = 0):
         """
         Inicializa um objeto Mes.
 
@@ -24,18 +29,20 @@ class Mes:
         ----------
         mes : int
             Número do mês.
+        total : int
+            Total inicial do mês.
         """
         self.__mes = mes
-        self.__total = 0
+        self.__total = total
 
     @property
-    def total(self) -> float:
+    def total(self) -> int:
         """
         Retorna o total acumulado das despesas do mês.
 
         Returns
         -------
-        float
+        int
             Total acumulado das despesas do mês.
         """
         return self.__total
@@ -68,13 +75,13 @@ class Mes:
         except IndexError:
             raise ValueError("Mês inválido.")
 
-    def acumular(self, valor: float):
+    def acumular(self, valor: int):
         """
         Adiciona um valor ao total acumulado das despesas do mês.
 
         Parameters
         ----------
-        valor : float
+        valor : int
             Valor a ser adicionado ao total acumulado.
         """
         self.__total += valor
@@ -99,11 +106,11 @@ class Ano:
         Número do ano.
     __meses : list
         Lista de objetos Mes representando os meses do ano.
-    __total : float
+    __total : int
         Total acumulado das despesas do ano.
     """
 
-    def __init__(self, ano: int):
+    def __init__(self, ano: int, totais_mes=None):
         """
         Inicializa um objeto Ano.
 
@@ -111,10 +118,14 @@ class Ano:
         ----------
         ano : int
             Número do ano.
+        totais_mes : sequência de 12 int, opcional
+            Totais iniciais de cada mês.
         """
         self.__ano = ano
-        self.__meses = [Mes(i) for i in range(1, 13)]
-        self.__total = 0
+        if totais_mes is None:
+            totais_mes = [0] * 12
+        self.__meses = [Mes(i, total) for i, total in enumerate(totais_mes, start=1)]
+        self.__total = sum(totais_mes)
 
     @property
     def ano(self):
@@ -147,34 +158,31 @@ class Ano:
 
         Returns
         -------
-        float
+        int
             Total acumulado das despesas do ano.
         """
         return self.__total
 
-    def acumular(self, valor: float, data: datetime):
+    def acumular(self, valor: int, mes: int):
         """
         Adiciona um valor ao total acumulado das despesas do ano e do mês correspondente.
 
         Parameters
         ----------
-        valor : float
+        valor : int
             Valor a ser adicionado ao total acumulado.
-        data : datetime
-            Data da despesa, usada para determinar o mês correspondente.
+        mes : int
+            Mês da despesa (1 a 12).
 
         Raises
         ------
         ValueError
             Se o mês da data for inválido.
         """
-        # self.__meses.index(data.month).acumular(valor)
-        # self.__total += valor
-
-        for m in self.__meses:
-            if m.mes == data.month:
-                m.acumular(valor)
-                self.__total += valor
+        if not 1 <= mes <= 12:
+            raise ValueError("Mês inválido.")
+        self.__meses[mes - 1].acumular(valor)
+        self.__total += valor
 
     def __lt__(self, other):
         return self.__ano < other
@@ -190,20 +198,56 @@ class Stats:
     """
     Classe responsável por armazenar e gerenciar as estatísticas de todos os anos.
 
+    Os totais ficam em uma matriz densa ano x mês: a linha é o ano menos o
+    primeiro ano visto (deslocamento) e a coluna é o mês - 1. Acumular um
+    lançamento é uma indexação direta na matriz. Os valores são inteiros de
+    centavos, como nos gestores.
+
     Attributes
     ----------
-    __anos : list
-        Lista de objetos Ano representando os anos.
-    __total : float
-        Total acumulado de todas as despesas.
+    __valores : np.ndarray
+        Matriz (anos x 12) com o total de cada mês.
+    __presenca : np.ndarray
+        Marca os anos (linhas) que receberam algum lançamento.
+    __ano_inicial : int | None
+        Ano correspondente à primeira linha da matriz.
     """
 
     def __init__(self):
         """
         Inicializa um objeto Stats.
         """
-        self.__anos = []  # Lista de objetos Ano
-        self.__total = 0
+        self.__valores = np.zeros((0, 12), dtype=np.int64)
+        self.__presenca = np.zeros(0, dtype=bool)
+        self.__ano_inicial: int | None = None
+
+    def __garantir(self, ano_min: int, ano_max: int):
+        """
+        Redimensiona a matriz para comportar os anos informados.
+        """
+        if self.__ano_inicial is None:
+            self.__ano_inicial = ano_min
+        linhas = len(self.__valores)
+        antes = max(0, self.__ano_inicial - ano_min)
+        depois = max(0, ano_max - (self.__ano_inicial + linhas - 1))
+        if antes or depois:
+            valores = np.zeros(
+                (antes + linhas + depois, 12), dtype=self.__valores.dtype
+            )
+            presenca = np.zeros(antes + linhas + depois, dtype=bool)
+            valores[antes : antes + linhas] = self.__valores
+            presenca[antes : antes + linhas] = self.__presenca
+            self.__valores = valores
+            self.__presenca = presenca
+            self.__ano_inicial -= antes
+
+    def __linha(self, ano: int) -> int | None:
+        if self.__ano_inicial is None:
+            return None
+        linha = ano - self.__ano_inicial
+        if linha < 0 or linha >= len(self.__valores) or not self.__presenca[linha]:
+            return None
+        return linha
 
     @property
     def total(self):
@@ -212,33 +256,102 @@ class Stats:
 
         Returns
         -------
-        float
+        int
             Total acumulado de todas as despesas.
         """
-        return self.__total
+        return self.__valores.sum().item()
 
-    def acumular(self, valor: float, data: datetime):
+    def acumular(self, valor: int, data: int | date):
         """
         Adiciona um valor ao total acumulado das despesas, conforme
         mês e ano do lançamento.
 
         Parameters
         ----------
-        valor : float
+        valor : int
             Valor a ser acumulado.
-        data : datetime
-            Data da despesa.
+        data : int | date
+            Data da despesa, em dias desde 01/01/1970 (ver DimensaoData) ou
+            date/datetime.
+        """
+        dia = como_dia(data)
+        ano = ano_do_dia(dia)
+        linha = ano - self.__ano_inicial if self.__ano_inicial is not None else -1
+        if linha < 0 or linha >= len(self.__valores):
+            self.__garantir(ano, ano)
+            linha = ano - self.__ano_inicial
+        self.__valores[linha, mes_do_dia(dia) - 1] += valor
+        self.__presenca[linha] = True
+
+    def acumular_muitos(self, valores, datas):
         """
+        Versão vetorizada de acumular, para colunas inteiras de lançamentos.
 
-        if data.year not in self.__anos:
-            self.__anos.append(Ano(data.year))
-            self.__anos.sort()
+        Parameters
+        ----------
+        valores : array-like de int
+            Valores a serem acumulados.
+        datas : array-like de int
+            Datas das despesas, em dias desde 01/01/1970.
+        """
+        datas = np.asarray(datas, dtype=np.int64)
+        if len(datas) == 0:
+            return
+        anos = anos_dos_dias(datas).astype(np.int64)
+        self.__garantir(int(anos.min()), int(anos.max()))
+        linhas = anos - self.__ano_inicial
+        np.add.at(self.__valores, (linhas, meses_dos_dias(datas) - 1), valores)
+        self.__presenca[linhas] = True
 
-        for ano in self.__anos:
-            if ano.ano == data.year:
-                ano.acumular(valor, data)
-                self.__total += valor
-                break
+    def estado(self) -> dict:
+        """
+        Retorna o estado parcial compacto das estatísticas (arrays numpy e
+        inteiros), serializável entre processos.
+
+        Returns
+        -------
+        dict
+            ano_inicial, valores (matriz anos x 12) e presenca.
+        """
+        return {
+            "ano_inicial": self.__ano_inicial,
+            "valores": self.__valores.copy(),
+            "presenca": self.__presenca.copy(),
+        }
+
+    def merge_estado(self, estado: dict):
+        """
+        Soma um estado parcial (ver estado) a estas estatísticas. A operação é
+        associativa e comutativa: os totais são inteiros de centavos.
+
+        Parameters
+        ----------
+        estado : dict
+            Estado produzido por Stats.estado.
+        """
+        ano_inicial = estado["ano_inicial"]
+        if ano_inicial is None:
+            return
+        linhas = len(estado["valores"])
+        self.__garantir(ano_inicial, ano_inicial + linhas - 1)
+        inicio = ano_inicial - self.__ano_inicial
+        self.__valores[inicio : inicio + linhas] += estado["valores"]
+        self.__presenca[inicio : inicio + linhas] |= estado["presenca"]
+
+    def merge(self, other: "Stats"):
+        """
+        Soma as estatísticas de outro objeto Stats a este.
+        """
+        self.merge_estado(other.estado())
+
+    @classmethod
+    def de_estado(cls, estado: dict) -> "Stats":
+        """
+        Reconstrói um objeto Stats a partir de um estado parcial.
+        """
+        stats = cls()
+        stats.merge_estado(estado)
+        return stats
 
     def get_ano(self, ano_informado: int) -> Ano | None:
         """
@@ -252,14 +365,13 @@ class Stats:
         Returns
         -------
         Ano
-            Objeto Ano correspondente ao ano especificado. None se não encontrado.
+            Objeto Ano (cópia dos totais) correspondente ao ano especificado.
+            None se não encontrado.
         """
-        # ano_desejado = next((ano for ano in self.__anos if ano.valor == ano_informado), None)
-        # return ano_desejado
-        for a in self.__anos:
-            if a == ano_informado:
-                return a
-        return None
+        linha = self.__linha(ano_informado)
+        if linha is None:
+            return None
+        return Ano(ano_informado, self.__valores[linha].tolist())
 
     def get_total_por_ano(self) -> list:
         """
@@ -270,7 +382,11 @@ class Stats:
         list
             Lista de tuplas no formato (ano, total).
         """
-        return [(t.ano, t.total) for t in self.__anos]
+        totais = self.__valores.sum(axis=1)
+        return [
+            (self.__ano_inicial + int(linha), totais[linha].item())
+            for linha in np.flatnonzero(self.__presenca)
+        ]
 
     def get_total_por_mes(self, ano: int) -> list:
         """
@@ -291,9 +407,12 @@ class Stats:
         AssertionError
             Se o ano especificado não possuir dados.
         """
-        res = self.get_ano(ano)
-        assert res is not None, "Este ano não possui dados."
-        return [(t.sigla, t.total) for t in res.meses]
+        linha = self.__linha(ano)
+        assert linha is not None, "Este ano não possui dados."
+        return [
+            (Mes(mes).sigla, total)
+            for mes, total in enumerate(self.__valores[linha].tolist(), start=1)
+        ]
 
     def __str__(self):
         """
@@ -305,11 +424,9 @@ class Stats:
             String formatada com o total acumulado e a porcentagem de cada ano.
         """
         r = "Estatísticas computadas:\n"
-        lista_anos = [t for t in self.__anos]
+        total = self.total
 
-        for t in lista_anos:
-            r += f"{t.ano}: {locale.currency(t.total, grouping=True, symbol=True)} ({(t.total/self.__total)*100:.2f}%)\n"
-        r += (
-            f"Total Geral : {locale.currency(self.__total, grouping=True, symbol=True)}"
-        )
+        for ano, total_ano in self.get_total_por_ano():
+            r += f"{ano}: {locale.currency(centavos_para_reais(total_ano), grouping=True, symbol=True)} ({(total_ano/total)*100:.2f}%)\n"
+        r += f"Total Geral : {locale.currency(centavos_para_reais(total), grouping=True, symbol=True)}"
         return r
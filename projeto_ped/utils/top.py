@@ -1,11 +1,14 @@
 # Função para calcular os "top n" credores (CPFs e CNPJs) para um determinado ano
 from collections import defaultdict
 
+from .dinheiro import centavos_para_reais
+
 
 def topn_cpf(credores_dict: defaultdict, n: int, ano: int) -> defaultdict:
     """
     Função para calcular os "top n" credores (CPFs) para um determinado ano.
-    O CPF deve estar formatado, totalizando 14 caracteres (xxx.xxx.xxx-xx)
+    As chaves devem ser IdentificadorCredor: CPF e CNPJ são separados pelo
+    bit de tipo do identificador, sem comparar strings.
 
     Parâmetros:
     credores_dict (defaultdict) - Dicionário com as despesas agrupadas por
@@ -22,9 +25,7 @@ def topn_cpf(credores_dict: defaultdict, n: int, ano: int) -> defaultdict:
 
     if ano in credores_dict:
         credores = credores_dict[ano]
-        cpfs = {
-            c: v for c, v in credores.items() if len(c) == 14
-        }  # Vai pegar o codigo de felipe para desmascarar o CPF/CNPJ e alterar o codigo depois.
+        cpfs = {c: v for c, v in credores.items() if c.eh_cpf}
 
         top_n_cpfs = sorted(cpfs.items(), key=lambda x: x[1], reverse=True)[:n]
 
@@ -36,7 +37,8 @@ def topn_cpf(credores_dict: defaultdict, n: int, ano: int) -> defaultdict:
 def topn_cnpj(credores_dict: defaultdict, n: int, ano: int) -> defaultdict:
     """
     Função para calcular os "top n" credores (CNPJs) para um determinado ano.
-    O CNPJ deve estar formatado, totalizando 18 caracteres (xx.xxx.xxx/xxxx-xx")
+    As chaves devem ser IdentificadorCredor: CPF e CNPJ são separados pelo
+    bit de tipo do identificador, sem comparar strings.
 
     Parâmetros:
     credores_dict (defaultdict) - Dicionário com as despesas agrupadas por
@@ -53,7 +55,7 @@ def topn_cnpj(credores_dict: defaultdict, n: int, ano: int) -> defaultdict:
 
     if ano in credores_dict:
         credores = credores_dict[ano]
-        cnpjs = {c: v for c, v in credores.items() if len(c) > 14}
+        cnpjs = {c: v for c, v in credores.items() if c.eh_cnpj}
 
         top_n_cnpjs = sorted(cnpjs.items(), key=lambda x: x[1], reverse=True)[:n]
 
@@ -77,7 +79,7 @@ def prints(topn: defaultdict, chave: str, ano):
         return
 
     for chave, valor in topn[ano][chave]:
-        print(f"{chave}: R$ {valor:14,.2f}")
+        print(f"{chave}: R$ {centavos_para_reais(valor):14,.2f}")
 
     # print(f"Top {n} CNPJs:")
     # for cnpj, valor in topns[ano]['CNPJs']:
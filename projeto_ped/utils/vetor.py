@@ -0,0 +1,82 @@
+import numpy as np
+
+
+class VetorNumpy:
+    """
+    Vetor dinâmico apoiado em um array numpy de tipo fixo.
+
+    Os elementos ficam contíguos na memória, sem um objeto Python por
+    elemento. A capacidade dobra quando o array enche, então anexar
+    custa O(1) amortizado.
+
+    Attributes
+    ----------
+    dtype : np.dtype
+        Tipo dos elementos armazenados.
+    """
+
+    def __init__(self, dtype, capacidade: int = 1024):
+        """
+        Parameters
+        ----------
+        dtype : np.dtype
+            Tipo dos elementos armazenados.
+        capacidade : int
+            Capacidade inicial do vetor.
+        """
+        self.__dados = np.zeros(max(capacidade, 1), dtype=dtype)
+        self.__tamanho = 0
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.__dados.dtype
+
+    def __reservar(self, necessario: int):
+        if necessario <= len(self.__dados):
+            return
+        capacidade = len(self.__dados)
+        while capacidade < necessario:
+            capacidade *= 2
+        novo = np.zeros(capacidade, dtype=self.__dados.dtype)
+        novo[: self.__tamanho] = self.__dados[: self.__tamanho]
+        self.__dados = novo
+
+    def anexar(self, valor) -> int:
+        """
+        Anexa um valor ao final do vetor.
+
+        Returns
+        -------
+        int
+            Posição (a partir de 0) do valor anexado.
+        """
+        if self.__tamanho == len(self.__dados):
+            self.__reservar(self.__tamanho + 1)
+        self.__dados[self.__tamanho] = valor
+        self.__tamanho += 1
+        return self.__tamanho - 1
+
+    def estender(self, valores):
+        """
+        Anexa vários valores ao final do vetor de uma só vez.
+        """
+        valores = np.asarray(valores, dtype=self.__dados.dtype)
+        self.__reservar(self.__tamanho + len(valores))
+        self.__dados[self.__tamanho : self.__tamanho + len(valores)] = valores
+        self.__tamanho += len(valores)
+
+    @property
+    def valores(self) -> np.ndarray:
+        """
+        Retorna uma visão (sem cópia) dos elementos armazenados.
+        """
+        return self.__dados[: self.__tamanho]
+
+    def __getitem__(self, posicao):
+        return self.valores[posicao]
+
+    def __setitem__(self, posicao, valor):
+        self.valores[posicao] = valor
+
+    def __len__(self) -> int:
+        return self.__tamanho
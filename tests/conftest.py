@@ -0,0 +1,21 @@
+import pytest
+
+from .dados import gerar_csv
+
+
+@pytest.fixture
+def csv_valido(tmp_path):
+    return str(gerar_csv(tmp_path / "pagamentos.csv", 3000, semente=1))
+
+
+@pytest.fixture(params=["\r\n", "\n"], ids=["crlf", "lf"])
+def csv_malformado(request, tmp_path):
+    return str(
+        gerar_csv(
+            tmp_path / "malformado.csv",
+            3000,
+            semente=2,
+            malformados=0.05,
+            terminador=request.param,
+        )
+    )
@@ -0,0 +1,194 @@
+"""
+Geração de arquivos de pagamentos sintéticos para os testes e comparação
+de estados de carga.
+"""
+
+import random
+
+import numpy as np
+
+from projeto_ped.ingestao import Ingestor
+from projeto_ped.ingestao.esquema import CABECALHO_PAGAMENTOS
+
+
+def digitos_cpf(base: str) -> str:
+    """
+    Dígitos verificadores de um CPF com 9 dígitos.
+    """
+    for pesos in (range(10, 1, -1), range(11, 1, -1)):
+        resto = sum(int(d) * p for d, p in zip(base, pesos)) % 11
+        base += str(0 if resto < 2 else 11 - resto)
+    return base[-2:]
+
+
+def digitos_cnpj(base: str) -> str:
+    """
+    Dígitos verificadores de um CNPJ com 12 dígitos.
+    """
+    for pesos in (
+        [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2],
+        [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2],
+    ):
+        resto = sum(int(d) * p for d, p in zip(base, pesos)) % 11
+        base += str(0 if resto < 2 else 11 - resto)
+    return base[-2:]
+
+
+def cpf(base: str) -> str:
+    numero = base + digitos_cpf(base)
+    return f"{numero[:3]}.{numero[3:6]}.{numero[6:9]}-{numero[9:]}"
+
+
+def cnpj(base: str) -> str:
+    numero = base + digitos_cnpj(base)
+    return f"{numero[:2]}.{numero[2:5]}.{numero[5:8]}/{numero[8:12]}-{numero[12:]}"
+
+
+def _credor(aleatorio: random.Random) -> str:
+    sorteio = aleatorio.random()
+    if sorteio < 0.4:
+        return cnpj(f"{aleatorio.randrange(10**8):08d}0001")
+    if sorteio < 0.7:
+        return f"***.{aleatorio.randrange(1000):03d}.{aleatorio.randrange(1000):03d}-**"
+    if sorteio < 0.9:
+        return cpf(f"{aleatorio.randrange(1, 10**9):09d}")
+    return aleatorio.choice(["123.456.789-00", "11.111.111/1111-11", "", "abc"])
+
+
+def registro(aleatorio: random.Random) -> list[str]:
+    """
+    Um registro válido do arquivo de pagamentos (os campos, sem aspas).
+    """
+    ano = aleatorio.randrange(2019, 2025)
+    mes = aleatorio.randrange(1, 13)
+    organizacao = aleatorio.randrange(1, 20)
+    categoria = aleatorio.choice(
+        [("339039", "OUTROS SERVIÇOS"), ("339030", "MATERIAL")]
+    )
+    return [
+        str(ano),
+        f"{mes:02d}/{ano}",
+        str(organizacao),
+        f"ORGANIZAÇÃO {organizacao}",
+        str(aleatorio.randrange(1000, 9999)),
+        f"{ano}-{mes:02d}-{aleatorio.randrange(1, 29):02d}",
+        "1",
+        "PAG",
+        "X1",
+        categoria[0],
+        categoria[1],
+        _credor(aleatorio),
+        f"CREDOR {aleatorio.randrange(200)}",
+        f"{aleatorio.randrange(1, 10**6)}.{aleatorio.randrange(100):02d}",
+        aleatorio.choice(
+            ["SERVIÇO DE LIMPEZA", "folha de pagamento", "pagamento de a"]
+        ),
+    ]
+
+
+def _aspas(campo: str) -> str:
+    return '"' + campo.replace('"', '""') + '"'
+
+
+def _malformado(aleatorio: random.Random, campos: list[str]) -> str:
+    """
+    Um registro com algum defeito: quebras de linha entre aspas, aspas que
+    não fecham, campos faltando ou sobrando, valores e datas inválidos.
+    """
+    linha = [_aspas(campo) for campo in campos]
+    defeito = aleatorio.randrange(8)
+    if defeito == 0:
+        linha[14] = _aspas('linha 1\nlinha 2 "citada"\r\nfim')
+    elif defeito == 1:
+        linha[14] = '"sem fim'
+    elif defeito == 2:
+        linha[3] = '"a"b;c"'
+    elif defeito == 3:
+        linha = linha[:-1]
+    elif defeito == 4:
+        linha.append('"extra"')
+    elif defeito == 5:
+        linha[13] = aleatorio.choice(['"1,5"', '"-"', '""', '"1e3"'])
+    elif defeito == 6:
+        linha[5] = aleatorio.choice(['"2023-02-29"', '"2024-1-5"', '""'])
+    else:
+        linha[14] = '"abc"x'
+    return ";".join(linha)
+
+
+def gerar_csv(
+    caminho,
+    linhas: int,
+    semente: int = 0,
+    malformados: float = 0.0,
+    terminador: str = "\r\n",
+):
+    """
+    Grava um arquivo de pagamentos sintético em latin-1, com todos os campos
+    entre aspas, como a exportação original. Uma fração `malformados` dos
+    registros tem algum defeito (ver _malformado), às vezes seguido de um
+    trecho de registros sem aspas.
+    """
+    aleatorio = random.Random(semente)
+    saida = [";".join(_aspas(campo) for campo in CABECALHO_PAGAMENTOS)]
+    sem_aspas = 0
+    for _ in range(linhas):
+        campos = registro(aleatorio)
+        if sem_aspas:
+            # Trecho sem aspas: uma aspa que não fecha antes dele engole
+            # vários registros, que parecem válidos quando lidos isolados
+            saida.append(";".join(campos))
+            sem_aspas -= 1
+        elif aleatorio.random() < malformados:
+            saida.append(_malformado(aleatorio, campos))
+            sem_aspas = aleatorio.choice([0, 0, 50])
+        else:
+            saida.append(";".join(_aspas(campo) for campo in campos))
+    with open(caminho, "wb") as ficheiro:
+        ficheiro.write((terminador.join(saida) + terminador).encode("latin-1"))
+    return caminho
+
+
+def iguais(a, b) -> bool:
+    """
+    Compara dois estados de carga (dicts, listas, tuplas e arrays numpy).
+    """
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return (
+            isinstance(a, np.ndarray)
+            and isinstance(b, np.ndarray)
+            and a.dtype == b.dtype
+            and np.array_equal(a, b)
+        )
+    if isinstance(a, dict):
+        return (
+            isinstance(b, dict)
+            and a.keys() == b.keys()
+            and all(iguais(a[k], b[k]) for k in a)
+        )
+    if isinstance(a, (list, tuple)):
+        return (
+            isinstance(b, (list, tuple))
+            and len(a) == len(b)
+            and all(iguais(x, y) for x, y in zip(a, b))
+        )
+    return a == b
+
+
+def carregar(caminho, **opcoes):
+    """
+    Carrega o arquivo sem barra de progresso e sem arquivo de quarentena.
+    """
+    opcoes = {"progresso": False, "arquivo_quarentena": None, **opcoes}
+    return Ingestor(**opcoes).carregar(caminho)
+
+
+def estado(carga) -> dict:
+    """
+    Estado da carga para comparar caminhos de leitura diferentes.
+    """
+    estado = carga.estado()
+    # CPFs calculados dependem de como o arquivo foi dividido em lotes e
+    # do que já estava no cache do desmascarador
+    estado["validador"].pop("desmascarados")
+    return estado
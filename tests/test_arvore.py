@@ -0,0 +1,290 @@
+import math
+import random
+
+import pytest
+
+from projeto_ped.despesa.ArvoreAVL import ArvoreAVL, ArvoreAVLError
+
+
+def _balanceada(arvore) -> bool:
+    # Altura máxima de uma AVL com n nós
+    return arvore.altura <= 1.45 * math.log2(len(arvore) + 2)
+
+
+def _referencia(pares):
+    # Ordenação estável: chaves iguais na ordem de inserção
+    return sorted(pares, key=lambda par: par[0])
+
+
+@pytest.mark.parametrize("semente", range(20))
+def test_inserir_equivale_a_lista_ordenada(semente):
+    aleatorio = random.Random(semente)
+    arvore, pares = ArvoreAVL(), []
+    for carga in range(aleatorio.randrange(1, 500)):
+        chave = aleatorio.randrange(100)
+        arvore.inserir(chave, carga)
+        pares.append((chave, carga))
+
+    ordenados = _referencia(pares)
+    assert list(arvore.intervalo()) == ordenados
+    assert list(arvore) == [carga for _, carga in ordenados]
+    assert list(reversed(arvore)) == [carga for _, carga in ordenados][::-1]
+    assert len(arvore) == len(pares)
+    assert _balanceada(arvore)
+
+
+@pytest.mark.parametrize("semente", range(20))
+def test_inserir_lote_equivale_a_inserir(semente):
+    aleatorio = random.Random(semente)
+    um_a_um, em_lote = ArvoreAVL(), ArvoreAVL()
+    for lote in range(aleatorio.randrange(1, 6)):
+        quantidade = aleatorio.choice([0, 1, 5, 50, 300])
+        chaves = [aleatorio.randrange(60) for _ in range(quantidade)]
+        if aleatorio.random() < 0.5:
+            chaves.sort()
+        cargas = [(lote, i) for i in range(quantidade)]
+        for chave, carga in zip(chaves, cargas):
+            um_a_um.inserir(chave, carga)
+        em_lote.inserir_lote(chaves, cargas)
+        assert list(em_lote.intervalo()) == list(um_a_um.intervalo())
+        assert len(em_lote) == len(um_a_um)
+        assert _balanceada(em_lote)
+
+
+def test_lote_ordenado_usa_o_caminho_rapido():
+    arvore = ArvoreAVL()
+    arvore.inserir_lote(list(range(100)), list(range(100)))
+    arvore.inserir_lote(list(range(99, 300)), list(range(201)))
+    assert (arvore.rapidas, arvore.lentas) == (301, 0)
+    arvore.inserir_lote([500, 5] * 100, [0, 0] * 100)
+    assert arvore.lentas == 200
+    assert [chave for chave, _ in arvore.intervalo()] == sorted(
+        list(range(100)) + list(range(99, 300)) + [500, 5] * 100
+    )
+
+
+def _espinha_correta(arvore) -> bool:
+    espinha, cursor = [], _raiz(arvore)
+    while cursor is not None:
+        espinha.append(cursor)
+        cursor = cursor.dir
+    guardada = arvore._ArvoreAVL__espinha
+    return guardada is None or all(
+        a is b for a, b in zip(guardada, espinha, strict=True)
+    )
+
+
+@pytest.mark.parametrize("semente", range(20))
+def test_caminhos_rapidos_equivalem_a_inserir(semente):
+    aleatorio = random.Random(semente)
+    arvore, pares, proxima = ArvoreAVL(), [], 0
+    for rodada in range(400):
+        sorteio = aleatorio.random()
+        if sorteio < 0.1:
+            quantidade = aleatorio.choice([1, 20, 300])
+            chaves = sorted(proxima + aleatorio.randrange(3) for _ in range(quantidade))
+            cargas = [(rodada, i) for i in range(quantidade)]
+            arvore.inserir_lote(chaves, cargas)
+            pares.extend(zip(chaves, cargas))
+            proxima = chaves[-1]
+        elif sorteio < 0.15 and pares:
+            posicao = aleatorio.randrange(len(pares))
+            assert arvore.remover(posicao) == _referencia(pares)[posicao][1]
+            pares.remove(_referencia(pares)[posicao])
+        else:
+            # Quase em ordem: a maioria depois da maior chave, algumas um
+            # pouco antes e poucas em qualquer lugar
+            if sorteio < 0.7:
+                chave = proxima + aleatorio.randrange(3)
+                proxima = chave
+            elif sorteio < 0.95:
+                chave = proxima - aleatorio.randrange(1, 10)
+            else:
+                chave = aleatorio.randrange(-5, proxima + 1)
+            arvore.inserir(chave, rodada)
+            pares.append((chave, rodada))
+        assert _espinha_correta(arvore)
+
+    assert list(arvore.intervalo()) == _referencia(pares)
+    assert _tamanhos_corretos(_raiz(arvore))
+    assert _balanceada(arvore)
+    assert arvore.rapidas > arvore.dedo > arvore.lentas
+
+
+def test_contadores_de_insercao():
+    arvore = ArvoreAVL()
+    for chave in range(1000):
+        arvore.inserir(chave, chave)
+    assert (arvore.rapidas, arvore.dedo, arvore.lentas) == (1000, 0, 0)
+    arvore.inserir(995, "dedo")
+    arvore.inserir(-1, "raiz")
+    assert (arvore.rapidas, arvore.dedo, arvore.lentas) == (1000, 1, 1)
+    arvore.inserir_lote(list(range(999, 3000)), list(range(2001)))
+    arvore.inserir_lote([3000, 3001], [0, 0])
+    assert (arvore.rapidas, arvore.dedo, arvore.lentas) == (3003, 1, 1)
+    arvore.inserir_lote([5, 4], [0, 0])
+    assert (arvore.rapidas, arvore.dedo, arvore.lentas) == (3003, 1, 3)
+    assert len(arvore) == 3007
+    assert _tamanhos_corretos(_raiz(arvore))
+    assert _balanceada(arvore)
+
+
+def test_lote_ordenado_nao_remonta_a_arvore():
+    def primeiro_no(arvore):
+        cursor = _raiz(arvore)
+        while cursor.esq is not None:
+            cursor = cursor.esq
+        return cursor
+
+    arvore = ArvoreAVL()
+    arvore.inserir_lote(list(range(10000)), list(range(10000)))
+    primeiro = primeiro_no(arvore)
+    for inicio in range(10000, 20000, 100):
+        arvore.inserir_lote(list(range(inicio, inicio + 100)), list(range(100)))
+    # Os nós já existentes continuam os mesmos: o lote é ligado, não remontado
+    assert primeiro_no(arvore) is primeiro
+    assert (arvore.rapidas, arvore.lentas) == (20000, 0)
+    assert list(arvore.intervalo(9998, 10001)) == [
+        (9998, 9998),
+        (9999, 9999),
+        (10000, 0),
+        (10001, 1),
+    ]
+    assert _tamanhos_corretos(_raiz(arvore))
+    assert _balanceada(arvore)
+
+
+def test_lote_com_tamanhos_diferentes():
+    with pytest.raises(ArvoreAVLError):
+        ArvoreAVL().inserir_lote([1, 2], [1])
+
+
+@pytest.mark.parametrize("semente", range(10))
+def test_busca_e_intervalo(semente):
+    aleatorio = random.Random(semente)
+    arvore, pares = ArvoreAVL(), []
+    for carga in range(300):
+        chave = aleatorio.randrange(80)
+        arvore.inserir(chave, carga)
+        pares.append((chave, carga))
+
+    for chave in range(-1, 82):
+        existentes = [carga for c, carga in pares if c == chave]
+        assert (chave in arvore) == bool(existentes)
+        if existentes:
+            # A primeira carga inserida com a chave
+            assert arvore.busca(chave) == existentes[0]
+        else:
+            with pytest.raises(KeyError):
+                arvore.busca(chave)
+
+    inicio = aleatorio.randrange(80)
+    fim = inicio + aleatorio.randrange(20)
+    esperado = [par for par in _referencia(pares) if inicio <= par[0] <= fim]
+    assert list(arvore.intervalo(inicio, fim)) == esperado
+    assert list(arvore.intervalo(None, fim)) == [
+        par for par in _referencia(pares) if par[0] <= fim
+    ]
+    with pytest.raises(ArvoreAVLError):
+        list(arvore.intervalo(fim + 1, inicio))
+
+
+def _tamanhos_corretos(no) -> bool:
+    if no is None:
+        return True
+    esquerda = no.esq.tamanho if no.esq is not None else 0
+    direita = no.dir.tamanho if no.dir is not None else 0
+    return (
+        no.tamanho == 1 + esquerda + direita
+        and _tamanhos_corretos(no.esq)
+        and _tamanhos_corretos(no.dir)
+    )
+
+
+def _raiz(arvore):
+    return arvore._ArvoreAVL__raiz
+
+
+@pytest.mark.parametrize("semente", range(10))
+def test_acesso_e_remocao_por_posicao(semente):
+    aleatorio = random.Random(semente)
+    pares = [(aleatorio.randrange(50), carga) for carga in range(400)]
+    arvore = ArvoreAVL()
+    for chave, carga in pares[:200]:
+        arvore.inserir(chave, carga)
+    arvore.extend(pares[200:])
+    referencia = _referencia(pares)
+    assert _tamanhos_corretos(_raiz(arvore))
+
+    for posicao in [0, 1, 57, len(referencia) - 1, -1, -len(referencia)]:
+        assert arvore[posicao] == referencia[posicao][1]
+        assert arvore.get(posicao) == referencia[posicao][1]
+    for fatia in [slice(10, 30), slice(None, 5), slice(390, None), slice(5, 60, 7)]:
+        assert arvore[fatia] == [carga for _, carga in referencia[fatia]]
+    assert arvore[300:100:-3] == [carga for _, carga in referencia[300:100:-3]]
+    for chave in range(50):
+        posicoes = [i for i, par in enumerate(referencia) if par[0] == chave]
+        if posicoes:
+            assert arvore.posicao(chave) == posicoes[0]
+        else:
+            with pytest.raises(KeyError):
+                arvore.posicao(chave)
+
+    while referencia:
+        posicao = aleatorio.randrange(-len(referencia), len(referencia))
+        if aleatorio.random() < 0.5:
+            assert arvore.remover(posicao) == referencia.pop(posicao)[1]
+        else:
+            del arvore[posicao]
+            referencia.pop(posicao)
+        assert len(arvore) == len(referencia)
+        if len(referencia) % 50 == 0:
+            assert list(arvore.intervalo()) == referencia
+            assert _tamanhos_corretos(_raiz(arvore))
+            assert _balanceada(arvore)
+    assert arvore.estaVazia()
+
+
+def test_posicao_invalida():
+    arvore = ArvoreAVL.from_iterable([(3, "c"), (1, "a"), (2, "b")])
+    assert list(arvore) == ["a", "b", "c"]
+    for posicao in [3, -4]:
+        with pytest.raises(IndexError):
+            arvore[posicao]
+        with pytest.raises(IndexError):
+            del arvore[posicao]
+    assert len(arvore) == 3
+    with pytest.raises(IndexError):
+        ArvoreAVL().get(0)
+
+
+@pytest.mark.parametrize("semente", range(10))
+def test_iter_from_e_iter_between(semente):
+    aleatorio = random.Random(semente)
+    pares = [(aleatorio.randrange(100), carga) for carga in range(500)]
+    arvore = ArvoreAVL.from_iterable(pares)
+    referencia = _referencia(pares)
+
+    for chave in [-1, 0, 37, 99, 100]:
+        assert list(arvore.iter_from(chave)) == [c for k, c in referencia if k >= chave]
+    inicio = aleatorio.randrange(100)
+    fim = inicio + aleatorio.randrange(10)
+    assert list(arvore.iter_between(inicio, fim)) == [
+        c for k, c in referencia if inicio <= k <= fim
+    ]
+    assert list(arvore.iter_between(200, 300)) == []
+    with pytest.raises(ArvoreAVLError):
+        next(arvore.iter_between(fim + 1, inicio))
+
+    # Cursores independentes: laços aninhados não interferem entre si
+    externo = arvore.iter_from(50)
+    primeiro = next(externo)
+    assert list(arvore.iter_from(50)) == [primeiro, *externo]
+
+
+def test_arvore_vazia():
+    arvore = ArvoreAVL()
+    assert arvore.estaVazia()
+    assert arvore.altura == 0
+    assert list(arvore) == []
+    assert 1 not in arvore
@@ -0,0 +1,113 @@
+import hashlib
+import os
+
+import pytest
+
+from projeto_ped.ingestao import ERROS_IGNORAR, CacheCarga, Ingestor, arquivo_cache
+
+from .dados import carregar, iguais
+
+
+class _Logger:
+    def __init__(self):
+        self.mensagens = []
+
+    def log_error(self, mensagem):
+        self.mensagens.append(mensagem)
+
+
+def test_gravacao_sem_permissao_nao_interrompe_a_carga(csv_valido, tmp_path):
+    logger = _Logger()
+    carga = Ingestor(progresso=False, arquivo_quarentena=None, logger=logger).carregar(
+        csv_valido
+    )
+    cache = CacheCarga(csv_valido)
+    cache.arquivo = str(tmp_path / "inexistente" / "carga.npz")
+    assert not cache.gravar(carga)
+    assert len(logger.mensagens) == 1
+    assert os.listdir(tmp_path) == [os.path.basename(csv_valido)]
+
+
+def test_arquivo_alterado_durante_a_carga(csv_valido):
+    def alterar(_):
+        os.utime(csv_valido, ns=(0, 0))
+
+    Ingestor(progresso=alterar, arquivo_quarentena=None, cache=True).carregar(
+        csv_valido
+    )
+    # O cache gravado tem a assinatura de antes da alteração
+    assert CacheCarga(csv_valido).restaurar() is None
+
+
+def test_restaurar_igual_a_carga(csv_malformado):
+    primeira = carregar(csv_malformado, cache=True)
+    assert os.path.exists(arquivo_cache(csv_malformado))
+    restaurada = carregar(csv_malformado, cache=True)
+    assert iguais(restaurada.estado(), primeira.estado())
+    assert list(restaurada.gestor_despesas) == list(primeira.gestor_despesas)
+
+
+def test_sem_cache_gravado(csv_valido):
+    assert CacheCarga(csv_valido).restaurar() is None
+
+
+def test_conteudo_alterado_com_mesma_data(csv_valido):
+    carregar(csv_valido, cache=True)
+    info = os.stat(csv_valido)
+    with open(csv_valido, "r+b") as ficheiro:
+        ficheiro.seek(-5, os.SEEK_END)
+        ficheiro.write(b"X")
+    os.utime(csv_valido, ns=(info.st_atime_ns, info.st_mtime_ns))
+    assert CacheCarga(csv_valido).restaurar() is None
+
+
+def test_opcoes_diferentes(csv_valido):
+    carregar(csv_valido, cache=True)
+    assert CacheCarga(csv_valido, erros=ERROS_IGNORAR).restaurar() is None
+    assert CacheCarga(csv_valido, encoding="cp1252").restaurar() is None
+
+
+@pytest.mark.parametrize("conteudo", [b"", b"lixo", b"PK\x03\x04lixo"])
+def test_cache_corrompido(csv_valido, conteudo):
+    carregar(csv_valido, cache=True)
+    with open(arquivo_cache(csv_valido), "wb") as ficheiro:
+        ficheiro.write(conteudo)
+    assert CacheCarga(csv_valido).restaurar() is None
+    # A carga seguinte lê o CSV e refaz o cache
+    carregar(csv_valido, cache=True)
+    assert CacheCarga(csv_valido).restaurar() is not None
+
+
+@pytest.mark.parametrize(
+    "opcoes",
+    [
+        {},
+        {"rapido": True},
+        {"indice": True},
+        {"indice": True, "rapido": True},
+        {"processos": 3},
+        {"processos": 3, "indice": True},
+    ],
+)
+def test_carga_sem_cache_le_o_arquivo_uma_vez(csv_malformado, monkeypatch, opcoes):
+    def ler_de_novo(*args, **kwargs):
+        raise AssertionError("O CSV foi lido de novo para o resumo")
+
+    with monkeypatch.context() as m:
+        m.setattr(hashlib, "file_digest", ler_de_novo)
+        primeira = carregar(csv_malformado, cache=True, **opcoes)
+    # O resumo feito durante a carga é o do arquivo: a próxima carga o restaura
+    restaurada = CacheCarga(csv_malformado).restaurar()
+    assert restaurada is not None
+    assert iguais(restaurada.estado(), primeira.estado())
+
+
+def test_assinatura_diferente_nao_resume_o_arquivo(csv_valido, monkeypatch):
+    carregar(csv_valido, cache=True)
+    os.utime(csv_valido, ns=(0, 0))
+
+    def ler_de_novo(*args, **kwargs):
+        raise AssertionError("O CSV foi resumido com a assinatura diferente")
+
+    monkeypatch.setattr(hashlib, "file_digest", ler_de_novo)
+    assert CacheCarga(csv_valido).restaurar() is None
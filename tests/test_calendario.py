@@ -0,0 +1,87 @@
+import random
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from projeto_ped.utils import DimensaoData
+from projeto_ped.utils.calendario import (
+    ano_do_dia,
+    anos_dos_dias,
+    como_dia,
+    data_para_dia,
+    dia_para_data,
+    dias_suportados,
+    mes_do_dia,
+    meses_dos_dias,
+    trimestre_do_dia,
+    trimestres_dos_dias,
+)
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_tabelas_iguais_a_datetime(semente):
+    aleatorio = random.Random(semente)
+    datas = [
+        date(1900, 1, 1) + timedelta(days=aleatorio.randrange(73_000))
+        for _ in range(300)
+    ] + [date(1900, 1, 1), date(1970, 1, 1), date(2024, 2, 29), date(2099, 12, 31)]
+    dias = np.array([data_para_dia(d) for d in datas])
+
+    assert [ano_do_dia(d) for d in dias] == [d.year for d in datas]
+    assert [mes_do_dia(d) for d in dias] == [d.month for d in datas]
+    assert [trimestre_do_dia(d) for d in dias] == [
+        (d.month - 1) // 3 + 1 for d in datas
+    ]
+    assert anos_dos_dias(dias).tolist() == [d.year for d in datas]
+    assert meses_dos_dias(dias).tolist() == [d.month for d in datas]
+    assert trimestres_dos_dias(dias).tolist() == [(d.month - 1) // 3 + 1 for d in datas]
+    assert [dia_para_data(d).date() for d in dias] == datas
+
+
+def test_conversoes_de_dia():
+    assert data_para_dia(date(1970, 1, 2)) == 1
+    assert data_para_dia(datetime(1969, 12, 31, 23, 59)) == -1
+    assert como_dia(date(1970, 1, 11)) == 10
+    assert como_dia(np.int32(10)) == 10
+    assert dia_para_data(0) == datetime(1970, 1, 1)
+
+
+def test_datas_fora_do_intervalo():
+    fora = [data_para_dia(date(1899, 12, 31)), data_para_dia(date(2100, 1, 1))]
+    assert dias_suportados([0, *fora]).tolist() == [True, False, False]
+    for dia in fora:
+        with pytest.raises(ValueError):
+            ano_do_dia(dia)
+    with pytest.raises(ValueError):
+        anos_dos_dias(np.array([0, fora[1]]))
+
+
+def test_dimensao_data_converte_cada_texto_uma_vez():
+    dimensao = DimensaoData()
+    textos = ["2024-02-29", "2019-12-31", "2024-02-29", "2019-12-31"]
+    assert (
+        dimensao.dias(textos).tolist()
+        == [
+            data_para_dia(date(2024, 2, 29)),
+            data_para_dia(date(2019, 12, 31)),
+        ]
+        * 2
+    )
+    assert dimensao.dias(textos).dtype == np.int32
+    assert len(dimensao) == 2
+    dia = dimensao.dia("2019-12-31")
+    assert (dimensao.ano(dia), dimensao.mes(dia), dimensao.trimestre(dia)) == (
+        2019,
+        12,
+        4,
+    )
+    assert dimensao.data(dia) == datetime(2019, 12, 31)
+
+    for invalido in ["2023-02-29", "2024-1-5x", "", "1850-01-01"]:
+        with pytest.raises(ValueError):
+            dimensao.dia(invalido)
+    assert len(dimensao) == 2
+
+    barras = DimensaoData("%d/%m/%Y")
+    assert barras.dia("05/01/1970") == 4
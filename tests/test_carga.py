@@ -0,0 +1,93 @@
+import csv
+import random
+from itertools import pairwise
+
+import pytest
+
+from projeto_ped.gestores import GestaoCredor, GestorCategoriasDespesas, GestorOrgs
+from projeto_ped.ingestao import Carga
+from projeto_ped.utils import DatasetInfo
+
+from .dados import estado, gerar_csv, iguais
+
+
+def _linhas(caminho) -> tuple[list[str], list[list[str]]]:
+    with open(caminho, encoding="latin-1", newline="") as arquivo:
+        leitor = csv.reader(arquivo, delimiter=";")
+        cabecalho = next(leitor)
+        return cabecalho, list(leitor)
+
+
+def _carga(cabecalho, linhas) -> Carga:
+    carga = Carga(cabecalho=cabecalho)
+    for inicio in range(0, len(linhas), 500):
+        carga.processar_lote(linhas[inicio : inicio + 500])
+    return carga
+
+
+@pytest.mark.parametrize("semente", range(3))
+def test_cargas_parciais_combinadas_na_ordem_igual_a_sequencial(tmp_path, semente):
+    caminho = gerar_csv(tmp_path / "p.csv", 2000, semente=semente, malformados=0.03)
+    cabecalho, linhas = _linhas(caminho)
+    sequencial = _carga(cabecalho, linhas)
+
+    aleatorio = random.Random(semente)
+    cortes = [0, *sorted(aleatorio.sample(range(1, len(linhas)), 3)), len(linhas)]
+    combinada = Carga(cabecalho=cabecalho)
+    for inicio, fim in pairwise(cortes):
+        parcial = _carga(cabecalho, linhas[inicio:fim])
+        if inicio % 2:
+            combinada.merge(parcial)
+        else:
+            combinada.merge_estado(parcial.estado())
+
+    assert iguais(estado(combinada), estado(sequencial))
+    assert combinada.registros == len(linhas)
+    assert combinada.erros == sequencial.erros
+    assert combinada.quarentenados == sequencial.quarentenados
+    assert [d.codigo_lancamento for d in combinada.gestor_despesas] == [
+        d.codigo_lancamento for d in sequencial.gestor_despesas
+    ]
+    combinadas = combinada.gestor_despesas
+    for despesa in list(sequencial.gestor_despesas)[::97]:
+        codigo = despesa.codigo_lancamento
+        assert combinadas.registro(codigo) == sequencial.gestor_despesas.registro(
+            codigo
+        )
+
+
+def test_gestores_combinados_em_qualquer_ordem(tmp_path):
+    caminho = gerar_csv(tmp_path / "p.csv", 1500, semente=5)
+    cabecalho, linhas = _linhas(caminho)
+    sequencial = _carga(cabecalho, linhas)
+    partes = [_carga(cabecalho, linhas[i::3]) for i in range(3)]
+
+    credores, categorias, orgs, info = (
+        GestaoCredor(),
+        GestorCategoriasDespesas(),
+        GestorOrgs(),
+        DatasetInfo(),
+    )
+    for parte in reversed(partes):
+        credores.merge(parte.gestor_credor)
+        categorias.merge_estado(parte.gestor_categoria.estado())
+        orgs.merge(parte.gestor_organizacao_social)
+        info.merge(parte.datasetinfo)
+
+    esperados = sequencial.gestor_credor.credores
+    assert credores.credores.keys() == esperados.keys()
+    for identificador, credor in esperados.items():
+        assert credores.obter_receitas_todos_os_anos(identificador) == credor.receitas
+    categorias_esperadas = sequencial.gestor_categoria
+    assert sorted(categorias.categorias) == sorted(categorias_esperadas.categorias)
+    for codigo, _ in categorias.categorias:
+        assert categorias.receitas(codigo) == categorias_esperadas.receitas(codigo)
+    orgs_esperadas = sequencial.gestor_organizacao_social
+    assert orgs.get_organizacoes() == orgs_esperadas.get_organizacoes()
+    for id in orgs.get_organizacoes():
+        assert orgs.get_receitas(id) == orgs_esperadas.get_receitas(id)
+    assert iguais(info.estado(), sequencial.datasetinfo.estado())
+
+    recriado = GestaoCredor.de_estado(credores.estado())
+    assert recriado.credores.keys() == esperados.keys()
+    assert len(GestorOrgs.de_estado(orgs.estado())) == len(orgs)
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from projeto_ped.gestores import DesmascaradorCPF, desmascarar_cpf
+from projeto_ped.gestores.credor.cpf import desmascarador
+
+
+@pytest.mark.parametrize("semente", range(3))
+def test_desmascarar_lote_igual_ao_individual(semente):
+    aleatorio = random.Random(semente)
+    textos = [
+        f"***.{aleatorio.randrange(1000):03d}.{aleatorio.randrange(1000):03d}-**"
+        for _ in range(300)
+    ] + ["12.345.678/0001-90", "123"]
+    assert desmascarador.desmascarar_lote(textos) == [
+        desmascarar_cpf(t) for t in textos
+    ]
+
+
+def test_desmascarar_lote_invalido():
+    with pytest.raises(ValueError):
+        desmascarador.desmascarar_lote(["***.742.041-**", "***.7a2.041-**"])
+
+
+def test_contadores_do_cache():
+    desmascarador = DesmascaradorCPF(tamanho_cache=2)
+    desmascarador.desmascarar("***.111.222-**")
+    desmascarador.desmascarar("***.111.222-**")
+    desmascarador.desmascarar("12.345.678/0001-90")  # não consulta o cache
+    assert desmascarador.cache_info() == (1, 1, 2, 1)
+    assert (desmascarador.acertos, desmascarador.falhas) == (1, 1)
+    assert desmascarador.taxa_acertos == 0.5
+    desmascarador.limpar_cache()
+    assert desmascarador.cache_info() == (0, 0, 2, 0)
+    assert desmascarador.taxa_acertos == 0.0
+
+
+def test_cache_limitado():
+    desmascarador = DesmascaradorCPF(tamanho_cache=2)
+    for texto in ["***.000.001-**", "***.000.002-**", "***.000.001-**"]:
+        desmascarador.desmascarar(texto)
+    # O terceiro texto descarta o menos usado recentemente (000.002)
+    desmascarador.desmascarar("***.000.003-**")
+    assert desmascarador.cache_info() == (1, 3, 2, 2)
+    desmascarador.desmascarar("***.000.001-**")
+    desmascarador.desmascarar("***.000.002-**")
+    assert desmascarador.cache_info() == (2, 4, 2, 2)
+
+
+@pytest.mark.parametrize("semente", range(3))
+def test_lote_conta_como_o_individual(semente):
+    aleatorio = random.Random(semente)
+    textos = [f"***.{aleatorio.randrange(30):03d}.000-**" for _ in range(200)] + ["123"]
+    lote, individual = DesmascaradorCPF(), DesmascaradorCPF()
+    for inicio in range(0, len(textos), 50):
+        parte = textos[inicio : inicio + 50]
+        assert lote.desmascarar_lote(parte) == [
+            individual.desmascarar(t) for t in parte
+        ]
+    assert lote.cache_info() == individual.cache_info()
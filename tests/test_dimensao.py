@@ -0,0 +1,130 @@
+import random
+from collections import defaultdict
+from datetime import date
+
+import numpy as np
+import pytest
+
+from projeto_ped.gestores import GestaoCredor, GestorCategoriasDespesas, GestorOrgs
+from projeto_ped.utils import AcumuladorAnual, Dimensao, LinhaAnual, RegistroDimensoes
+
+from .dados import cpf
+
+
+def test_dimensao_ids_densos_na_ordem_de_chegada():
+    dimensao = Dimensao("organizacoes")
+    assert [dimensao.id_de(c) for c in [30, 10, 30, 20]] == [0, 1, 0, 2]
+    assert dimensao.ids_de([20, 40, 10]).tolist() == [2, 3, 1]
+    assert dimensao.ids_de([]).dtype == np.int32
+    assert dimensao.buscar(40) == 3
+    assert dimensao.buscar(50) is None
+    assert dimensao.chave(1) == 10
+    assert dimensao.chaves == [30, 10, 20, 40]
+    assert 20 in dimensao and 50 not in dimensao
+    assert len(dimensao) == 4
+    with pytest.raises(IndexError):
+        dimensao.chave(4)
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_acumulador_igual_a_dicionario(semente):
+    aleatorio = random.Random(semente)
+    acumulador, lote = AcumuladorAnual(), AcumuladorAnual()
+    esperado = defaultdict(dict)
+    linhas, anos, valores = [], [], []
+    for _ in range(500):
+        linha = aleatorio.randrange(40)
+        ano = aleatorio.randrange(2005, 2030)
+        valor = aleatorio.randrange(-100, 10_000)
+        acumulador.acumular(linha, ano, valor)
+        linhas.append(linha)
+        anos.append(ano)
+        valores.append(valor)
+        esperado[linha][ano] = esperado[linha].get(ano, 0) + valor
+    lote.acumular_muitos(np.array(linhas), np.array(anos), np.array(valores))
+
+    for alvo in (acumulador, lote):
+        for linha in range(45):
+            por_ano = dict(sorted(esperado.get(linha, {}).items()))
+            assert alvo.por_ano(linha) == por_ano
+            assert alvo.total(linha) == sum(por_ano.values())
+        assert alvo.anos == sorted({a for d in esperado.values() for a in d})
+        assert alvo.coluna(2010).tolist() == [
+            esperado.get(linha, {}).get(2010, 0) for linha in range(len(alvo))
+        ]
+        assert alvo.coluna(1990).tolist() == [0] * len(alvo)
+
+
+def test_acumulador_distingue_total_zero_de_ausente():
+    acumulador = AcumuladorAnual()
+    acumulador.acumular(2, 2020, 0)
+    assert acumulador.valor(2, 2020) == 0
+    assert acumulador.por_ano(2) == {2020: 0}
+    for linha, ano in [(2, 2021), (1, 2020), (9, 2020)]:
+        with pytest.raises(KeyError):
+            acumulador.valor(linha, ano)
+    acumulador.zerar(2)
+    assert acumulador.por_ano(2) == {}
+
+
+def test_acumulador_merge_com_anos_e_ids_diferentes():
+    a, b = AcumuladorAnual(), AcumuladorAnual()
+    a.acumular(0, 2020, 5)
+    a.acumular(1, 2022, 7)
+    b.acumular(0, 2015, 3)
+    b.acumular(1, 2020, 4)
+    b.acumular(2, 2030, 1)
+    # A linha i de b vai para a linha [1, 0, 3][i] de a
+    a.somar_estado(b.estado(), [1, 0, 3])
+    assert a.por_ano(0) == {2020: 9}
+    assert a.por_ano(1) == {2015: 3, 2022: 7}
+    assert a.por_ano(2) == {}
+    assert a.por_ano(3) == {2030: 1}
+
+
+def test_linha_anual_avulsa_e_vinculada():
+    avulsa = LinhaAnual()
+    avulsa.acumular(2021, 10)
+    avulsa.acumular(2021, 5)
+    assert avulsa.por_ano() == {2021: 15}
+    assert avulsa.total() == 15
+
+    matriz = AcumuladorAnual()
+    vinculada = LinhaAnual(matriz, 3)
+    vinculada.acumular(2019, 2)
+    assert matriz.por_ano(3) == {2019: 2}
+    assert vinculada.valor(2019) == 2
+
+
+def test_gestores_compartilham_as_dimensoes_do_registro():
+    registro = RegistroDimensoes()
+    credores = GestaoCredor(registro.credores)
+    categorias = GestorCategoriasDespesas(registro.categorias)
+    orgs = GestorOrgs(registro.organizacoes)
+    dia = date(2023, 5, 1)
+
+    indice = credores.upsert(cpf("111222333"), "A", 2023, 10)
+    credores.upsert(cpf("444555666"), "B", 2023, 20)
+    assert credores.upsert(cpf("111222333"), "A", 2024, 30) == indice
+    assert len(registro.credores) == 2
+    categorias.add("339039", "SERVIÇOS", dia, 10)
+    categorias.add("339039", "SERVIÇOS", date(2024, 1, 1), 5)
+    orgs.adicionar(7, "ORG 7", dia, 100)
+    orgs.adicionar(3, "ORG 3", dia, 50)
+
+    assert registro.categorias.chaves == ["339039"]
+    assert registro.organizacoes.chaves == [7, 3]
+    assert credores.obter_receitas_todos_os_anos(cpf("111222333")) == {
+        2023: 10,
+        2024: 30,
+    }
+    entidades, totais = credores.totais()
+    assert [str(c.identificador) for c in entidades] == [
+        cpf("111222333"),
+        cpf("444555666"),
+    ]
+    assert totais.tolist() == [40, 20]
+    assert credores.totais(2024)[1].tolist() == [30, 0]
+    assert categorias.receitas("339039") == {2023: 10, 2024: 5}
+    assert orgs.get_receitas(3) == {2023: 50}
+    assert orgs.get_organizacoes() == {3: "ORG 3", 7: "ORG 7"}
@@ -0,0 +1,69 @@
+import random
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pytest
+
+from projeto_ped.utils.dinheiro import centavos_para_reais, texto_para_centavos
+
+
+@pytest.mark.parametrize(
+    "texto, centavos",
+    [
+        ("1234.56", 123456),
+        ("300", 30000),
+        ("-12.5", -1250),
+        (" 7.1 ", 710),
+        (".5", 50),
+        ("+3", 300),
+        ("0.005", 1),
+        ("0.004", 0),
+        ("-0.005", -1),
+        ("2.675", 268),
+        ("1e3", 100000),
+        ("00012.30", 1230),
+    ],
+)
+def test_texto_para_centavos(texto, centavos):
+    assert texto_para_centavos(texto) == centavos
+
+
+@pytest.mark.parametrize(
+    "texto",
+    ["", "-", "1,5", "abc", "nan", "inf", "1.2.3", "+-5", "--5", "-+5", "--.5"],
+)
+def test_texto_invalido(texto):
+    with pytest.raises(ValueError):
+        texto_para_centavos(texto)
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_igual_ao_decimal(semente):
+    aleatorio = random.Random(semente)
+    for _ in range(2000):
+        inteiro = aleatorio.randrange(10 ** aleatorio.randrange(1, 13))
+        casas = aleatorio.randrange(0, 5)
+        fracao = aleatorio.randrange(10**casas) if casas else 0
+        sinal = aleatorio.choice(["", "-"])
+        texto = f"{sinal}{inteiro}"
+        if casas:
+            texto += f".{fracao:0{casas}d}"
+        esperado = int(
+            Decimal(texto).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP) * 100
+        )
+        assert texto_para_centavos(texto) == esperado
+
+
+def test_soma_exata_em_int64():
+    aleatorio = random.Random(0)
+    textos = [
+        f"{aleatorio.randrange(10**7)}.{aleatorio.randrange(100):02d}"
+        for _ in range(10**4)
+    ]
+    centavos = np.array(
+        [texto_para_centavos(texto) for texto in textos], dtype=np.int64
+    )
+    # A soma em int64 não depende da ordem e é igual à soma decimal
+    assert int(centavos.sum()) == int(sum(Decimal(texto) for texto in textos) * 100)
+    assert int(centavos[::-1].sum()) == int(centavos.sum())
+    assert centavos_para_reais(123456) == 1234.56
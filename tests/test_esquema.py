@@ -0,0 +1,151 @@
+import csv
+import random
+from datetime import date
+
+import pytest
+
+from projeto_ped.ingestao import (
+    CABECALHO_PAGAMENTOS,
+    ESQUEMA_PAGAMENTOS,
+    Carga,
+    Coluna,
+    Esquema,
+)
+from projeto_ped.ingestao.esquema import normalizar_nome
+from projeto_ped.utils.calendario import data_para_dia
+
+from .dados import carregar, estado, iguais, registro
+
+
+def _reordenar(origem, destino, ordem: list[int], cabecalho=None):
+    """
+    Regrava o CSV com as colunas na ordem `ordem` (posições do original) e,
+    se informado, com outro cabeçalho.
+    """
+    with open(origem, encoding="latin-1", newline="") as ficheiro:
+        linhas = list(csv.reader(ficheiro, delimiter=";"))
+    if cabecalho is not None:
+        linhas[0] = cabecalho
+    with open(destino, "w", encoding="latin-1", newline="") as ficheiro:
+        escritor = csv.writer(ficheiro, delimiter=";", quoting=csv.QUOTE_ALL)
+        escritor.writerows([linha[i] for i in ordem] for linha in linhas)
+    return str(destino)
+
+
+def _sem_linhas(estado_carga: dict) -> dict:
+    # As linhas rejeitadas são guardadas como estão no arquivo, na ordem das
+    # colunas dele
+    return {
+        chave: valor
+        for chave, valor in estado_carga.items()
+        if chave not in ("erros", "quarentena")
+    }
+
+
+def test_normalizar_nome():
+    assert normalizar_nome('\ufeff "Codigo Lancamento" ') == "CODIGO_LANCAMENTO"
+    assert normalizar_nome("cpf-cnpj credor") == "CPF_CNPJ_CREDOR"
+
+
+def test_tipo_invalido():
+    with pytest.raises(ValueError):
+        Coluna("valor", "decimal", "VALOR")
+
+
+def test_decodificador():
+    campos = registro(random.Random(0))
+    valores = dict(
+        zip(
+            ESQUEMA_PAGAMENTOS.campos,
+            ESQUEMA_PAGAMENTOS.compilar(CABECALHO_PAGAMENTOS)(campos),
+        )
+    )
+    assert valores["competencia"] == campos[1]
+    assert valores["codigo_organizacao_social"] == int(campos[2])
+    assert valores["codigo_lancamento"] == int(campos[4])
+    assert valores["dia_lancamento"] == data_para_dia(date.fromisoformat(campos[5]))
+    assert valores["cpf_cnpj_credor"] == campos[11]
+    assert valores["valor"] == round(float(campos[13]) * 100)
+    assert valores["observacao_lancamento"] == campos[14]
+
+
+def test_decodificador_de_um_campo():
+    esquema = Esquema(Coluna("valor", "centavos", "VALOR"))
+    assert esquema.compilar(["DATA", "VALOR"])(["2024-01-01", "1.50"]) == (150,)
+
+
+@pytest.mark.parametrize(
+    "ordem",
+    [list(range(15))[::-1], random.Random(5).sample(range(15), 15)],
+    ids=["invertida", "embaralhada"],
+)
+def test_decodificador_segue_o_cabecalho(ordem):
+    cabecalho = [CABECALHO_PAGAMENTOS[i] for i in ordem]
+    aleatorio = random.Random(1)
+    decodificar = ESQUEMA_PAGAMENTOS.compilar(CABECALHO_PAGAMENTOS)
+    reordenado = ESQUEMA_PAGAMENTOS.compilar(cabecalho)
+    for _ in range(100):
+        campos = registro(aleatorio)
+        assert reordenado([campos[i] for i in ordem]) == decodificar(campos)
+
+
+def test_colunas_extras_e_nao_usadas():
+    # EXERCICIO, tipo de lançamento e documento não são exigidos; colunas
+    # desconhecidas são ignoradas
+    usadas = [1, 2, 3, 4, 5, 9, 10, 11, 12, 13, 14]
+    cabecalho = ["NOVA"] + [CABECALHO_PAGAMENTOS[i] for i in usadas]
+    campos = registro(random.Random(2))
+    linha = ["?"] + [campos[i] for i in usadas]
+    compilar = ESQUEMA_PAGAMENTOS.compilar
+    assert compilar(cabecalho)(linha) == compilar(CABECALHO_PAGAMENTOS)(campos)
+
+
+def test_apelidos():
+    cabecalho = list(CABECALHO_PAGAMENTOS)
+    cabecalho[4] = "cod lancamento"
+    cabecalho[11] = "CPF_CNPJ_CREDOR"
+    cabecalho[13] = '"Valor"'
+    assert ESQUEMA_PAGAMENTOS.indices(cabecalho) == ESQUEMA_PAGAMENTOS.indices(
+        CABECALHO_PAGAMENTOS
+    )
+
+
+def test_coluna_ausente():
+    cabecalho = [nome for nome in CABECALHO_PAGAMENTOS if nome != "VALOR_LANCAMENTO"]
+    with pytest.raises(ValueError, match="VALOR_LANCAMENTO"):
+        Carga(cabecalho=cabecalho)
+
+
+def test_linha_curta():
+    decodificar = ESQUEMA_PAGAMENTOS.compilar(CABECALHO_PAGAMENTOS)
+    with pytest.raises(IndexError):
+        decodificar(registro(random.Random(3))[:-1])
+    extrair = ESQUEMA_PAGAMENTOS.extrator(CABECALHO_PAGAMENTOS, "cpf_cnpj_credor")
+    assert extrair(["2024"]) == ""
+
+
+@pytest.mark.parametrize(
+    "opcoes",
+    [{}, {"rapido": True}, {"processos": 2}],
+    ids=["csv", "rapido", "paralelo"],
+)
+def test_carga_com_colunas_invertidas(csv_valido, tmp_path, opcoes):
+    ordem = list(range(15))[::-1]
+    invertido = _reordenar(csv_valido, tmp_path / "invertido.csv", ordem)
+    original = carregar(csv_valido)
+    carga = carregar(invertido, **opcoes)
+    assert carga.cabecalho == [CABECALHO_PAGAMENTOS[i] for i in ordem]
+    assert iguais(_sem_linhas(estado(carga)), _sem_linhas(estado(original)))
+    assert original.quarentenados
+    assert [
+        (motivo, linha[::-1]) for motivo, linha in carga.quarentenados
+    ] == original.quarentenados
+
+
+def test_carga_com_cabecalho_renomeado(csv_valido, tmp_path):
+    cabecalho = list(CABECALHO_PAGAMENTOS)
+    cabecalho[2] = "COD_ORGANIZACAO_SOCIAL"
+    cabecalho[5] = "Data"
+    cabecalho[13] = "valor"
+    renomeado = _reordenar(csv_valido, tmp_path / "renomeado.csv", range(15), cabecalho)
+    assert iguais(estado(carregar(renomeado)), estado(carregar(csv_valido)))
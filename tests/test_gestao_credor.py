@@ -0,0 +1,83 @@
+import random
+from datetime import date
+
+import numpy as np
+import pytest
+
+from projeto_ped.gestores import Credor, GestaoCredor, IdentificadorCredor
+
+from .dados import cnpj, cpf
+
+DOCUMENTOS = [cpf("111222333"), cnpj("123456780001"), cpf("000000191")]
+
+
+def test_upsert_cadastra_na_primeira_vez_e_soma_nas_seguintes():
+    gestao = GestaoCredor()
+    indice = gestao.upsert(DOCUMENTOS[0], "PRIMEIRO NOME", 2022, 100)
+    credor = gestao.buscar_credor(DOCUMENTOS[0])
+    assert gestao.upsert(DOCUMENTOS[0], "OUTRO NOME", 2022, 50) == indice
+    assert (
+        gestao.upsert(IdentificadorCredor.parse(DOCUMENTOS[0]), "X", 2023, 7) == indice
+    )
+
+    # O mesmo objeto Credor, com o nome do cadastro
+    assert gestao.buscar_credor(DOCUMENTOS[0]) is credor
+    assert credor.nome_credor == "PRIMEIRO NOME"
+    assert credor.receitas == {2022: 150, 2023: 7}
+    assert gestao.obter_valor_total(DOCUMENTOS[0]) == 157
+    assert gestao.obter_receita_anual(DOCUMENTOS[0], 2022) == 150
+    assert len(gestao) == 1
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_upsert_lote_equivale_a_upsert(semente):
+    aleatorio = random.Random(semente)
+    linhas = [
+        (
+            aleatorio.choice(DOCUMENTOS),
+            f"NOME {aleatorio.randrange(3)}",
+            aleatorio.randrange(2019, 2025),
+            aleatorio.randrange(1, 10_000),
+        )
+        for _ in range(200)
+    ]
+    um_a_um, em_lote = GestaoCredor(), GestaoCredor()
+    indices = [um_a_um.upsert(*linha) for linha in linhas]
+    documentos, nomes, anos, valores = zip(*linhas)
+    obtidos = em_lote.upsert_lote(
+        list(documentos), list(nomes), np.array(anos), np.array(valores)
+    )
+    assert obtidos.tolist() == indices
+    for documento in DOCUMENTOS:
+        esperado = um_a_um.buscar_credor(documento)
+        obtido = em_lote.buscar_credor(documento)
+        if esperado is None:
+            assert obtido is None
+            continue
+        assert obtido.nome_credor == esperado.nome_credor
+        assert obtido.receitas == esperado.receitas
+
+
+def test_adicionar_credor_aceita_data_em_texto_date_ou_dias():
+    gestao = GestaoCredor()
+    credor = Credor(DOCUMENTOS[1], "EMPRESA")
+    gestao.adicionar_credor(credor, "2021-05-03", 10)
+    gestao.adicionar_credor(Credor(DOCUMENTOS[1], "OUTRA"), date(2021, 12, 31), 20)
+    gestao.adicionar_credor(credor, 19000, 30)  # 19000 dias = 2022
+    assert gestao.buscar_credor(DOCUMENTOS[1]) is credor
+    assert gestao.obter_receitas_todos_os_anos(DOCUMENTOS[1]) == {2021: 30, 2022: 30}
+
+
+def test_consultas_de_credor_ausente():
+    gestao = GestaoCredor()
+    gestao.upsert(DOCUMENTOS[0], "A", 2020, 1)
+    assert gestao.buscar_credor(DOCUMENTOS[2]) is None
+    assert gestao.buscar_credor("texto inválido") is None
+    with pytest.raises(KeyError):
+        gestao.obter_valor_total(DOCUMENTOS[2])
+    with pytest.raises(KeyError):
+        gestao.obter_receita_anual(DOCUMENTOS[0], 2021)
+    with pytest.raises(ValueError):
+        gestao.obter_receita_anual(DOCUMENTOS[0], 0)
+    with pytest.raises(ValueError):
+        gestao.upsert("123", "A", 2020, 1)
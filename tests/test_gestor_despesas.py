@@ -0,0 +1,198 @@
+from datetime import date, datetime
+from itertools import islice
+
+import pytest
+
+from projeto_ped.despesa import GestorDespesas
+from projeto_ped.despesa.ArvoreAVL import ArvoreAVLError
+from projeto_ped.despesa.indice_texto import tokenizar
+from projeto_ped.gestores import IdentificadorCredor
+
+from .dados import carregar, cpf
+
+CREDOR = IdentificadorCredor.parse(cpf("123456789"))
+
+
+def _gestor(lancamentos) -> GestorDespesas:
+    """
+    Gestor com lançamentos (código, observação) em 2024, na ordem informada.
+    """
+    gestor = GestorDespesas()
+    for codigo, observacao in lancamentos:
+        gestor.adicionar_lancamento(
+            "01/2024", 1, codigo, date(2024, 1, 2), "339039", CREDOR, 100, observacao
+        )
+    return gestor
+
+
+def test_pesquisar_observacao_com_codigo_repetido():
+    gestor = _gestor(
+        [
+            (10, "Aluguel do prédio de MANUTENÇÃO"),
+            (10, "compra de papel"),
+            (7, "papel e caneta"),
+        ]
+    )
+    encontradas = gestor.pesquisar_observacao("papel")
+    assert [d.observacao_lancamento for d in encontradas] == [
+        "papel e caneta",
+        "compra de papel",
+    ]
+    assert gestor.pesquisar_observacao("manutencao predio", "ou", True) == 1
+    frase = gestor.pesquisar_observacao("compra de papel", "frase")
+    assert [d.observacao_lancamento for d in frase] == ["compra de papel"]
+    assert gestor.pesquisar_observacao("de papel", "frase", True) == 1
+
+
+def test_acesso_por_posicao():
+    gestor = _gestor([(30, "c"), (10, "a"), (20, "b"), (10, "a2")])
+    assert gestor[0].observacao_lancamento == "a"
+    assert gestor[-1].codigo_lancamento == 30
+    assert [d.observacao_lancamento for d in gestor[1:3]] == ["a2", "b"]
+    assert gestor.posicao(20) == 2
+    assert gestor.posicao(gestor[0]) == 0
+    assert gestor.posicao(15) is None
+    with pytest.raises(IndexError):
+        gestor[4]
+
+
+def test_iter_from_e_iter_between(csv_valido):
+    gestor = carregar(csv_valido).gestor_despesas
+    codigos = [despesa.codigo_lancamento for despesa in gestor]
+    meio = codigos[len(codigos) // 2]
+    assert [d.codigo_lancamento for d in gestor.iter_from(meio)] == [
+        codigo for codigo in codigos if codigo >= meio
+    ]
+    assert [d.codigo_lancamento for d in gestor.iter_between(2000, 3000)] == [
+        codigo for codigo in codigos if 2000 <= codigo <= 3000
+    ]
+    primeiras = list(islice(gestor.iter_from(codigos[0]), 3))
+    assert [d.codigo_lancamento for d in primeiras] == codigos[:3]
+    with pytest.raises(ArvoreAVLError):
+        next(gestor.iter_between(3000, 2000))
+
+
+def test_paginas_iguais_a_varredura(csv_valido):
+    gestor = carregar(csv_valido).gestor_despesas
+    codigos = [despesa.codigo_lancamento for despesa in gestor]
+    paginas = []
+    for inicio in range(0, len(gestor), 250):
+        paginas.extend(d.codigo_lancamento for d in gestor[inicio : inicio + 250])
+    assert paginas == codigos
+
+
+@pytest.mark.parametrize("opcoes", [{}, {"rapido": True}, {"processos": 3}])
+@pytest.mark.parametrize("modo", ["e", "ou", "frase"])
+def test_pesquisar_observacao_igual_a_varredura(csv_malformado, opcoes, modo):
+    gestor = carregar(csv_malformado, **opcoes).gestor_despesas
+    consulta = "pagamento de"
+    termos = set(tokenizar(consulta))
+    esperadas = []
+    for despesa in gestor:
+        observacao = tokenizar(despesa.observacao_lancamento)
+        if modo == "e":
+            encontrada = termos <= set(observacao)
+        elif modo == "ou":
+            encontrada = bool(termos & set(observacao))
+        else:
+            encontrada = " pagamento de " in " " + " ".join(observacao) + " "
+        if encontrada:
+            esperadas.append(despesa.observacao_lancamento)
+    encontradas = gestor.pesquisar_observacao(consulta, modo)
+    assert sorted(d.observacao_lancamento for d in encontradas) == sorted(esperadas)
+    assert gestor.pesquisar_observacao(consulta, modo, True) == len(esperadas)
+
+
+def _campos(despesa) -> tuple:
+    return (
+        despesa.codigo_lancamento,
+        despesa.data_lancamento,
+        despesa.valor,
+        despesa.cpf_cpnj_credor,
+        despesa.codigo_organizacao_social,
+        despesa.codigo_categoria_despesa,
+        despesa.observacao_lancamento,
+    )
+
+
+@pytest.mark.parametrize("opcoes", [{}, {"rapido": True}, {"processos": 3}])
+def test_despesas_filtradas_iguais_a_varredura(csv_malformado, opcoes):
+    gestor = carregar(csv_malformado, **opcoes).gestor_despesas
+    todas = list(gestor)
+    credor = todas[len(todas) // 2].cpf_cpnj_credor
+
+    def varredura(**filtros):
+        return [
+            _campos(d)
+            for d in todas
+            if filtros.get("credor", d.cpf_cpnj_credor) == d.cpf_cpnj_credor
+            and filtros.get("organizacao", d.codigo_organizacao_social)
+            == d.codigo_organizacao_social
+            and filtros.get("categoria", d.codigo_categoria_despesa)
+            == d.codigo_categoria_despesa
+        ]
+
+    por_credor = [_campos(d) for d in gestor.despesas_por_credor(str(credor))]
+    assert por_credor == varredura(credor=credor)
+    for organizacao in (1, 7, 19, 99):
+        encontradas = gestor.despesas_por_organizacao(organizacao)
+        assert [_campos(d) for d in encontradas] == varredura(organizacao=organizacao)
+    for categoria in ("339030", "339039", "000000"):
+        encontradas = gestor.despesas_por_categoria(categoria)
+        assert [_campos(d) for d in encontradas] == varredura(categoria=categoria)
+    encontradas = gestor.despesas_filtradas(organizacao=3, categoria="339030")
+    assert [_campos(d) for d in encontradas] == varredura(
+        organizacao=3, categoria="339030"
+    )
+    linhas = gestor.linhas_filtradas(organizacao=3, categoria="339030")
+    assert len(linhas) == len(encontradas)
+    assert list(linhas) == sorted(linhas)
+
+
+def test_despesas_filtradas_sem_chave():
+    gestor = _gestor([(1, "a")])
+    with pytest.raises(ValueError):
+        gestor.despesas_filtradas()
+    with pytest.raises(ValueError):
+        gestor.despesas_por_credor("123")
+    assert gestor.despesas_por_credor(str(CREDOR))[0].codigo_lancamento == 1
+
+
+@pytest.mark.parametrize("opcoes", [{}, {"processos": 3}])
+def test_visoes_por_data_e_valor_iguais_a_varredura(csv_valido, opcoes):
+    gestor = carregar(csv_valido, **opcoes).gestor_despesas
+    todas = list(gestor)
+    por_data = sorted(todas, key=lambda d: d.data_lancamento)
+    por_valor = sorted(todas, key=lambda d: d.valor)
+
+    inicio, fim = datetime(2021, 3, 1), datetime(2022, 2, 28)
+    assert [_campos(d) for d in gestor.despesas_entre_datas(inicio, fim)] == [
+        _campos(d) for d in por_data if inicio <= d.data_lancamento <= fim
+    ]
+    assert [_campos(d) for d in gestor.despesas_entre_datas(fim=inicio)] == [
+        _campos(d) for d in por_data if d.data_lancamento <= inicio
+    ]
+    assert len(gestor.despesas_entre_datas()) == len(todas)
+
+    minimo, maximo = 10_000_00, 200_000_00
+    assert [_campos(d) for d in gestor.despesas_por_valor(minimo, maximo)] == [
+        _campos(d) for d in por_valor if minimo <= d.valor <= maximo
+    ]
+    assert [_campos(d) for d in gestor.despesas_por_valor(minimo=maximo)] == [
+        _campos(d) for d in por_valor if d.valor >= maximo
+    ]
+    maiores = gestor.maiores_despesas(5)
+    assert [d.valor for d in maiores] == sorted(d.valor for d in todas)[-5:][::-1]
+    assert gestor.maiores_despesas(0) == []
+
+
+def test_visoes_atualizadas_depois_de_inserir():
+    gestor = _gestor([(1, "a"), (2, "b")])
+    assert len(gestor.despesas_entre_datas(date(2024, 1, 1))) == 2
+    gestor.adicionar_lancamento(
+        "03/2024", 1, 3, date(2024, 3, 5), "339039", CREDOR, 50, "c"
+    )
+    assert [
+        d.codigo_lancamento for d in gestor.despesas_entre_datas(date(2024, 3, 1))
+    ] == [3]
+    assert [d.codigo_lancamento for d in gestor.despesas_por_valor(maximo=60)] == [3]
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from projeto_ped.gestores import IdentificadorCredor, desmascarar_cpf
+
+from .dados import cnpj, cpf
+
+
+@pytest.mark.parametrize(
+    "texto",
+    [cpf("000123456"), cpf("987654321"), cnpj("000000010001"), cnpj("123456780001")],
+)
+def test_formatacao_e_ida_e_volta(texto):
+    identificador = IdentificadorCredor.parse(texto)
+    assert str(identificador) == texto
+    assert IdentificadorCredor.parse(identificador.digitos) == identificador
+    assert identificador.eh_cnpj == (len(identificador.digitos) == 14)
+    assert identificador.eh_cpf != identificador.eh_cnpj
+    assert f"{identificador:>20}" == f"{texto:>20}"
+    assert repr(identificador) == f"IdentificadorCredor('{texto}')"
+
+
+def test_cpf_e_cnpj_com_os_mesmos_digitos_sao_diferentes():
+    como_cpf = IdentificadorCredor(12345678901, eh_cnpj=False)
+    como_cnpj = IdentificadorCredor(12345678901, eh_cnpj=True)
+    assert como_cpf != como_cnpj
+    assert como_cpf.numero == como_cnpj.numero == 12345678901
+    assert len({como_cpf, como_cnpj}) == 2
+    assert str(como_cnpj) == "00.012.345/6789-01"
+
+
+def test_cpf_mascarado_e_desmascarado():
+    mascarado = "***.456.789-**"
+    identificador = IdentificadorCredor.parse(mascarado)
+    assert identificador == IdentificadorCredor.parse(desmascarar_cpf(mascarado))
+    assert identificador.eh_cpf
+
+
+def test_guardado_em_array_int64():
+    identificadores = [
+        IdentificadorCredor.parse(cpf("111222333")),
+        IdentificadorCredor.parse(cnpj("999888770001")),
+    ]
+    array = np.array(identificadores, dtype=np.int64)
+    recuperados = [IdentificadorCredor.de_codigo(c) for c in array.tolist()]
+    assert recuperados == identificadores
+    assert all(isinstance(r, IdentificadorCredor) for r in recuperados)
+    assert [str(r) for r in recuperados] == [str(i) for i in identificadores]
+    assert sorted(identificadores) == sorted(int(i) for i in identificadores)
+
+
+@pytest.mark.parametrize("texto", ["", "abc", "123.456.789", "11.111.111/1111-1111"])
+def test_texto_invalido(texto):
+    with pytest.raises(ValueError):
+        IdentificadorCredor.parse(texto)
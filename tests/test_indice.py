@@ -0,0 +1,73 @@
+import csv
+import os
+
+import numpy as np
+import pytest
+
+from projeto_ped.ingestao import IndiceRegistros, arquivo_indice
+
+from .dados import carregar, estado, iguais
+
+
+def _registros(caminho):
+    with open(caminho, encoding="latin-1") as ficheiro:
+        return list(csv.reader(ficheiro, delimiter=";"))[1:]
+
+
+def test_registros_iguais_ao_csv_reader(csv_malformado):
+    indice = IndiceRegistros.criar(csv_malformado)
+    registros = _registros(csv_malformado)
+    assert len(indice) == len(registros)
+    for numero in range(0, len(indice), 7):
+        assert indice.registro(numero) == registros[numero]
+    with pytest.raises(KeyError):
+        indice.intervalo(len(indice))
+
+
+def test_gravar_e_abrir(csv_malformado):
+    indice = IndiceRegistros.para_arquivo(csv_malformado)
+    assert os.path.exists(arquivo_indice(csv_malformado))
+    aberto = IndiceRegistros.abrir(csv_malformado)
+    assert aberto is not None
+    assert np.array_equal(aberto.inicios, indice.inicios)
+    assert aberto.cabecalho == indice.cabecalho
+
+
+def test_indice_desatualizado(csv_valido):
+    indice = IndiceRegistros.para_arquivo(csv_valido)
+    with open(csv_valido, "ab") as ficheiro:
+        ficheiro.write(b'"2024";"01/2024"\r\n')
+    assert not indice.atualizado()
+    assert IndiceRegistros.abrir(csv_valido) is None
+    with pytest.raises(ValueError):
+        indice.bruto(0)
+
+
+@pytest.mark.parametrize("conteudo", [b"", b"lixo", b"PK\x03\x04lixo"])
+def test_indice_corrompido(csv_valido, conteudo):
+    indice = IndiceRegistros.para_arquivo(csv_valido)
+    with open(arquivo_indice(csv_valido), "wb") as ficheiro:
+        ficheiro.write(conteudo)
+    assert IndiceRegistros.abrir(csv_valido) is None
+    # O índice ilegível é refeito e gravado de novo
+    refeito = IndiceRegistros.para_arquivo(csv_valido)
+    assert np.array_equal(refeito.inicios, indice.inicios)
+    assert IndiceRegistros.abrir(csv_valido) is not None
+    assert carregar(csv_valido, indice=True).indice is not None
+
+
+@pytest.mark.parametrize("quantidade", [1, 3, 16])
+def test_blocos_em_limites_de_registro(csv_malformado, quantidade):
+    indice = IndiceRegistros.criar(csv_malformado)
+    blocos = indice.blocos(quantidade)
+    assert 1 <= len(blocos) <= quantidade
+    limites = set(indice.inicios.tolist())
+    assert all(inicio in limites and fim in limites for inicio, fim in blocos)
+    assert blocos[0][0] == indice.inicios[0] and blocos[-1][1] == indice.inicios[-1]
+
+
+@pytest.mark.parametrize("opcoes", [{}, {"rapido": True}, {"processos": 3}])
+def test_carga_indexada_igual_a_sequencial(csv_malformado, opcoes):
+    indexada = carregar(csv_malformado, indice=True, **opcoes)
+    assert iguais(estado(indexada), estado(carregar(csv_malformado)))
+    assert indexada.indice is not None
@@ -0,0 +1,84 @@
+import random
+
+import numpy as np
+import pytest
+
+from projeto_ped.despesa.indice_texto import (
+    IndiceTexto,
+    comprimir,
+    descomprimir,
+    normalizar,
+    tokenizar,
+)
+
+
+def test_tokenizar_ignora_acentos_e_caixa():
+    assert normalizar("MANUTENÇÃO Elétrica") == "manutencao eletrica"
+    assert tokenizar("Serviço de LIMPEZA, nº 2/2024") == (
+        "servico",
+        "de",
+        "limpeza",
+        "no",
+        "2",
+        "2024",
+    )
+    assert tokenizar("  --  ") == ()
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_comprimir_e_descomprimir(semente):
+    aleatorio = random.Random(semente)
+    codigos = np.unique(
+        np.array([aleatorio.randrange(2**40) for _ in range(500)], dtype=np.int64)
+    )
+    dados = comprimir(codigos)
+    assert np.array_equal(descomprimir(dados), codigos)
+    assert len(descomprimir(comprimir(np.arange(300)))) == 300
+    # Diferenças pequenas ocupam um byte cada
+    assert len(comprimir(np.arange(1, 301))) == 300
+    assert len(descomprimir(b"")) == 0
+
+
+def test_buscas_e_e_ou():
+    indice = IndiceTexto()
+    textos = ["pagamento de água", "Água e luz", "folha de PAGAMENTO", "luz"]
+    for linha, texto in enumerate(textos):
+        indice.adicionar(linha, texto)
+    indice.adicionar(4, "pagamento pagamento")
+
+    assert indice.linhas("agua").tolist() == [0, 1]
+    assert indice.linhas("PAGAMENTO").tolist() == [0, 2, 4]
+    assert indice.buscar_todos("pagamento de").tolist() == [0, 2]
+    assert indice.buscar_algum("água luz").tolist() == [0, 1, 3]
+    assert indice.buscar_todos("inexistente pagamento").tolist() == []
+    assert indice.buscar_algum("").tolist() == []
+    assert len(indice) == 6
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_merge_estado_equivale_ao_indice_completo(semente):
+    aleatorio = random.Random(semente)
+    palavras = ["agua", "luz", "folha", "pagamento", "de", "limpeza"]
+    textos = [
+        " ".join(aleatorio.choices(palavras, k=aleatorio.randrange(4)))
+        for _ in range(300)
+    ]
+    completo = IndiceTexto()
+    for linha, texto in enumerate(textos):
+        completo.adicionar(linha, texto)
+
+    combinado = IndiceTexto()
+    cortes = sorted(aleatorio.sample(range(1, 300), 3))
+    for inicio, fim in zip([0, *cortes], [*cortes, 300]):
+        parcial = IndiceTexto()
+        for linha, texto in enumerate(textos[inicio:fim]):
+            parcial.adicionar(linha, texto)
+        # Consultas no meio da combinação compactam parte das listas
+        combinado.linhas("agua")
+        combinado.merge(parcial, inicio)
+
+    esperado = completo.estado()
+    obtido = combinado.estado()
+    assert esperado.keys() == obtido.keys()
+    for termo in esperado:
+        assert np.array_equal(esperado[termo], obtido[termo])
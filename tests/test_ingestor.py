@@ -0,0 +1,164 @@
+import io
+import os
+import sys
+import threading
+
+import pytest
+
+from projeto_ped.ingestao import ERROS_FALHAR, ERROS_IGNORAR, Ingestor, carregar
+
+from .dados import carregar as carregar_sem_interface
+from .dados import estado, iguais
+
+
+class _Logger:
+    def __init__(self):
+        self.mensagens = []
+
+    def log_error(self, mensagem):
+        self.mensagens.append(mensagem)
+
+
+def test_caminho_igual_a_objeto_de_arquivo(csv_malformado):
+    with open(csv_malformado, "rb") as ficheiro:
+        carga = Ingestor(progresso=False).carregar(ficheiro)
+        assert not ficheiro.closed
+    assert iguais(estado(carga), estado(carregar_sem_interface(csv_malformado)))
+
+
+def test_mesmo_ingestor_varias_vezes(csv_malformado):
+    ingestor = Ingestor(progresso=False)
+    primeira = ingestor.carregar(csv_malformado)
+    segunda = ingestor.carregar(csv_malformado)
+    assert primeira is not segunda
+    assert primeira.gestor_despesas is not segunda.gestor_despesas
+    assert iguais(estado(primeira), estado(segunda))
+
+
+def test_atalho_do_modulo(csv_valido):
+    carga = carregar(csv_valido, progresso=False)
+    assert iguais(estado(carga), estado(carregar_sem_interface(csv_valido)))
+    info = carga.datasetinfo
+    # 3000 registros mais o cabeçalho, descartado
+    assert info.processed == 3001
+    assert info.loaded + info.disregard == 3001
+    assert len(carga.gestor_despesas) == info.loaded
+
+
+def test_sem_interface_nao_usa_alive_progress(csv_valido, monkeypatch):
+    # Um módulo None em sys.modules faz o import falhar
+    monkeypatch.setitem(sys.modules, "alive_progress", None)
+    carga = Ingestor(progresso=False).carregar(csv_valido)
+    assert carga.datasetinfo.processed == 3001
+
+
+@pytest.mark.parametrize(
+    "opcoes",
+    [{"erros": "parar"}, {"processos": 0}, {"tamanho_lote": 0}],
+    ids=["erros", "processos", "tamanho_lote"],
+)
+def test_opcoes_invalidas(opcoes):
+    with pytest.raises(ValueError):
+        Ingestor(**opcoes)
+
+
+@pytest.mark.parametrize(
+    "opcoes",
+    [{"processos": 2}, {"indice": True}, {"cache": True}],
+    ids=["paralelo", "indice", "cache"],
+)
+def test_opcoes_que_precisam_do_caminho(csv_valido, opcoes):
+    with open(csv_valido, "rb") as ficheiro, pytest.raises(ValueError):
+        Ingestor(progresso=False, **opcoes).carregar(ficheiro)
+
+
+def test_politicas_de_erro(csv_malformado):
+    registrada = carregar_sem_interface(csv_malformado)
+    assert registrada.erros
+
+    ignorada = carregar_sem_interface(csv_malformado, erros=ERROS_IGNORAR)
+    assert ignorada.erros == []
+    assert iguais(estado(ignorada)["despesas"], estado(registrada)["despesas"])
+
+    logger = _Logger()
+    com_logger = carregar_sem_interface(csv_malformado, logger=logger)
+    assert com_logger.erros == []
+    assert len(logger.mensagens) == len(registrada.erros)
+
+    with pytest.raises(ValueError):
+        carregar_sem_interface(csv_malformado, erros=ERROS_FALHAR)
+
+
+def _pelo_pipe(caminho, **opcoes):
+    """
+    Carrega o arquivo lido de um pipe, escrito por outra thread.
+    """
+    leitura, escrita = os.pipe()
+    with open(caminho, "rb") as ficheiro:
+        conteudo = ficheiro.read()
+
+    def escrever():
+        with open(escrita, "wb") as saida:
+            saida.write(conteudo)
+
+    escritor = threading.Thread(target=escrever)
+    escritor.start()
+    try:
+        with open(leitura, "rb") as entrada:
+            assert not entrada.seekable()
+            return Ingestor(**opcoes).carregar(entrada)
+    finally:
+        escritor.join()
+
+
+@pytest.mark.parametrize("rapido", [False, True], ids=["csv", "rapido"])
+def test_pipe(csv_malformado, rapido):
+    carga = _pelo_pipe(csv_malformado, progresso=False, rapido=rapido)
+    assert iguais(estado(carga), estado(carregar_sem_interface(csv_malformado)))
+
+
+def test_fonte_em_texto(csv_malformado):
+    with open(csv_malformado, encoding="latin-1") as ficheiro:
+        carga = Ingestor(progresso=False).carregar(ficheiro)
+    assert iguais(estado(carga), estado(carregar_sem_interface(csv_malformado)))
+
+
+def test_fonte_em_memoria(csv_valido):
+    with open(csv_valido, encoding="latin-1", newline="") as ficheiro:
+        texto = io.StringIO(ficheiro.read())
+    carga = Ingestor(progresso=False).carregar(texto)
+    assert iguais(estado(carga), estado(carregar_sem_interface(csv_valido)))
+
+
+@pytest.mark.parametrize("rapido", [False, True], ids=["csv", "rapido"])
+def test_progresso_em_bytes(csv_malformado, rapido):
+    avancos = []
+    Ingestor(progresso=avancos.append, intervalo_progresso=0, rapido=rapido).carregar(
+        csv_malformado
+    )
+    assert sum(avancos) == os.path.getsize(csv_malformado)
+    assert all(avanco > 0 for avanco in avancos)
+
+
+def test_progresso_do_pipe(csv_malformado):
+    avancos = []
+    _pelo_pipe(csv_malformado, progresso=avancos.append, intervalo_progresso=0)
+    assert sum(avancos) == os.path.getsize(csv_malformado)
+
+
+def test_progresso_por_lote_e_nao_por_linha(csv_valido):
+    avancos = []
+    Ingestor(
+        progresso=avancos.append, intervalo_progresso=0, tamanho_lote=100
+    ).carregar(csv_valido)
+    # Um avanço a cada lote de 100 registros
+    assert 1 < len(avancos) <= 3000 // 100 + 1
+
+
+def test_progresso_limitado_pelo_intervalo(csv_malformado):
+    avancos = []
+    Ingestor(
+        progresso=avancos.append, intervalo_progresso=3600, tamanho_lote=100
+    ).carregar(csv_malformado)
+    # Nenhuma atualização no intervalo: só a final, com todo o arquivo
+    assert avancos == [os.path.getsize(csv_malformado)]
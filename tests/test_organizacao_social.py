@@ -0,0 +1,20 @@
+from datetime import date
+
+from projeto_ped.gestores.organizacao_social.receita import Receita
+from projeto_ped.utils.calendario import como_dia
+
+
+def test_adicionar_receita_por_ano():
+    receita = Receita()
+    receita.adicionar_receita(2020, 100)
+    receita.adicionar_receita(2020, 50)
+    receita.adicionar_receita(2021, 7)
+    assert receita.ano_valor == {2020: 150, 2021: 7}
+
+
+def test_adicionar_receita_por_dia():
+    receita = Receita()
+    receita.adicionar_receita_dia(date(2020, 12, 31), 100)
+    receita.adicionar_receita_dia(como_dia(date(2021, 1, 1)), 5)
+    receita.adicionar_receita(2021, 1)
+    assert receita.ano_valor == {2020: 100, 2021: 6}
@@ -0,0 +1,64 @@
+from itertools import pairwise
+
+import numpy as np
+import pytest
+
+from projeto_ped.ingestao import Carga, carregar_paralelo, dividir_em_blocos, mapear
+from projeto_ped.ingestao.paralelo import (
+    cortes_aproximados,
+    fim_do_trecho,
+    inicios_dos_registros,
+    ler_cabecalho,
+)
+
+from .dados import carregar, estado, iguais
+
+
+@pytest.mark.parametrize("rapido", [False, True])
+@pytest.mark.parametrize("processos", [2, 3])
+def test_paralelo_igual_ao_sequencial(csv_malformado, processos, rapido):
+    sequencial = carregar(csv_malformado)
+    paralela = carregar(csv_malformado, processos=processos, rapido=rapido)
+    assert iguais(estado(paralela), estado(sequencial))
+
+
+def test_paralelo_arquivo_valido(csv_valido):
+    sequencial = carregar(csv_valido)
+    paralela = carregar(csv_valido, processos=3)
+    assert iguais(estado(paralela), estado(sequencial))
+
+
+def test_blocos_cobrem_o_arquivo(csv_malformado):
+    _, inicio = ler_cabecalho(csv_malformado)
+    blocos = dividir_em_blocos(csv_malformado, 12, inicio)
+    assert blocos[0][0] == inicio
+    assert all(fim == proximo for (_, fim), (proximo, _) in pairwise(blocos))
+    with open(csv_malformado, "rb") as ficheiro:
+        assert blocos[-1][1] == len(ficheiro.read())
+
+
+def test_fim_do_trecho_e_o_proximo_limite_de_registro(csv_malformado):
+    _, inicio = ler_cabecalho(csv_malformado)
+    limites = inicios_dos_registros(csv_malformado, inicio)
+    cortes = cortes_aproximados(csv_malformado, 500, inicio)
+    # Alguns cortes caem dentro de registros (quebras de linha entre aspas)
+    assert set(cortes) - set(limites.tolist())
+    with mapear(csv_malformado) as visao:
+        for corte in cortes:
+            esperado = limites[np.searchsorted(limites, corte)]
+            assert fim_do_trecho(visao, inicio, corte) == esperado
+
+
+@pytest.mark.parametrize("rapido", [False, True])
+@pytest.mark.parametrize("blocos_por_processo", [1, 40, 400])
+def test_cortes_dentro_de_registros(csv_malformado, rapido, blocos_por_processo):
+    sequencial = carregar(csv_malformado)
+    cabecalho, _ = ler_cabecalho(csv_malformado)
+    paralela = carregar_paralelo(
+        csv_malformado,
+        Carga(cabecalho=cabecalho),
+        2,
+        blocos_por_processo=blocos_por_processo,
+        rapido=rapido,
+    )
+    assert iguais(estado(paralela), estado(sequencial))
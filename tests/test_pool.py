@@ -0,0 +1,100 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from projeto_ped.despesa.armazem import ColunaTexto
+from projeto_ped.gestores import (
+    CategoriaDespesa,
+    Credor,
+    GestaoCredor,
+    GestorCategoriasDespesas,
+    GestorOrgs,
+    OrganizacaoSocial,
+)
+from projeto_ped.utils import PoolStrings
+
+from .dados import cpf
+
+
+def _copia(texto: str) -> str:
+    # Uma cópia igual, mas outro objeto, como as lidas de cada linha do arquivo
+    return "".join(list(texto))
+
+
+def test_pool_codifica_na_ordem_de_chegada():
+    pool = PoolStrings()
+    assert [pool.codificar(t) for t in ["b", "a", "b", "c", "a"]] == [0, 1, 0, 2, 1]
+    assert pool.valores == ["b", "a", "c"]
+    assert pool[2] == "c"
+    assert pool.codigo_de("a") == 1
+    assert pool.codigo_de("z") is None
+    assert "c" in pool and "z" not in pool
+    assert list(pool) == ["b", "a", "c"] and len(pool) == 3
+
+
+def test_pool_interna_uma_instancia_por_texto():
+    pool = PoolStrings()
+    original = _copia("ORGANIZAÇÃO SOCIAL")
+    outra = _copia("ORGANIZAÇÃO SOCIAL")
+    assert outra is not original
+    assert pool.internar(original) is original
+    assert pool.internar(outra) is original
+    assert len(pool) == 1
+
+
+def test_coluna_texto_filtra_por_codigo_e_recodifica_o_estado():
+    coluna = ColunaTexto()
+    for valor in ["x", "y", "x", "z"]:
+        coluna.anexar(valor)
+    assert coluna.linhas_com("x").tolist() == [0, 2]
+    assert coluna.linhas_com("w").tolist() == []
+    assert coluna.codigos.dtype == np.int32
+
+    parcial = ColunaTexto()
+    for valor in ["z", "w", "x"]:
+        parcial.anexar(valor)
+    coluna.estender_estado(parcial.estado())
+    assert [coluna[i] for i in range(len(coluna))] == [
+        "x",
+        "y",
+        "x",
+        "z",
+        "z",
+        "w",
+        "x",
+    ]
+    assert coluna.linhas_com("x").tolist() == [0, 2, 6]
+    assert len(coluna.pool) == 4
+
+
+def test_gestores_guardam_uma_copia_de_cada_nome():
+    categorias = GestorCategoriasDespesas()
+    orgs = GestorOrgs()
+    credores = GestaoCredor()
+    nome = _copia("OUTROS SERVIÇOS")
+    categorias.add("339039", nome, date(2024, 1, 1), 10)
+    categorias.add("339030", _copia(nome), date(2024, 1, 1), 10)
+    orgs.adicionar(1, nome, date(2024, 1, 1), 10)
+    orgs.adicionar(2, _copia(nome), date(2024, 1, 1), 10)
+    credores.upsert(cpf("123456789"), nome, 2024, 10)
+    credores.upsert(cpf("987654321"), _copia(nome), 2024, 10)
+
+    assert categorias.busca_categoria("339030").categoria is nome
+    assert orgs.get_nome_organizacao(2) is nome
+    assert credores.buscar_credor(cpf("987654321")).nome_credor is nome
+
+
+@pytest.mark.parametrize(
+    "entidade",
+    [
+        Credor(cpf("123456789"), "CREDOR"),
+        CategoriaDespesa("339039", "OUTROS SERVIÇOS"),
+        OrganizacaoSocial(1, "ORGANIZAÇÃO"),
+    ],
+    ids=["credor", "categoria", "organizacao"],
+)
+def test_entidades_sem_dicionario_de_atributos(entidade):
+    assert not hasattr(entidade, "__dict__")
+    with pytest.raises(AttributeError):
+        entidade.atributo_novo = 1
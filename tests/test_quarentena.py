@@ -0,0 +1,48 @@
+import csv
+import os
+
+from projeto_ped.ingestao import Ingestor
+from projeto_ped.utils import Quarentena
+from projeto_ped.utils.quarentena import TAMANHO_BUFFER
+
+
+def test_quarentena_no_encoding_do_arquivo(csv_valido, tmp_path):
+    caminho = tmp_path / "utf8.csv"
+    with open(csv_valido, encoding="latin-1", newline="") as origem:
+        caminho.write_text(origem.read(), encoding="utf-8", newline="")
+    destino = tmp_path / "quarentena.csv"
+    carga = Ingestor(
+        encoding="utf-8", progresso=False, arquivo_quarentena=str(destino)
+    ).carregar(str(caminho))
+    assert carga.validador.rejeitados > 0
+    with open(destino, encoding="utf-8", newline="") as ficheiro:
+        linhas = list(csv.reader(ficheiro, delimiter=";"))
+    assert linhas[0][0] == "MOTIVO" and linhas[0][1:] == carga.cabecalho
+    assert len(linhas) - 1 == carga.validador.rejeitados
+    assert any("ORGANIZAÇÃO" in campo for campo in linhas[1])
+
+
+def test_sem_arquivo_de_quarentena_por_padrao(csv_valido, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    carga = Ingestor(progresso=False).carregar(csv_valido)
+    assert carga.validador.rejeitados > 0
+    assert len(carga.quarentenados) == carga.validador.rejeitados
+    assert os.listdir(tmp_path) == [os.path.basename(csv_valido)]
+
+
+def test_gravacao_em_partes(tmp_path):
+    destino = tmp_path / "quarentena.csv"
+    linhas = [[str(numero), "ção"] for numero in range(TAMANHO_BUFFER * 2 + 3)]
+    with Quarentena(str(destino), ["A", "B"], "cp1252") as quarentena:
+        for linha in linhas[:TAMANHO_BUFFER]:
+            quarentena.registrar(linha, "formato_invalido")
+        # As primeiras linhas já foram gravadas
+        assert destino.exists()
+        for linha in linhas[TAMANHO_BUFFER:]:
+            quarentena.registrar(linha, "formato_invalido")
+    assert quarentena.quantidade == len(linhas)
+    with open(destino, encoding="cp1252", newline="") as ficheiro:
+        gravadas = list(csv.reader(ficheiro, delimiter=";"))
+    assert gravadas == [["MOTIVO", "A", "B"]] + [
+        ["formato_invalido", *linha] for linha in linhas
+    ]
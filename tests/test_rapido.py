@@ -0,0 +1,63 @@
+import csv
+
+import pytest
+
+from projeto_ped.ingestao import Carga, LeitorRapido
+from projeto_ped.ingestao.paralelo import ler_cabecalho
+from projeto_ped.ingestao.rapido import fins_dos_registros
+
+from .dados import carregar, estado, gerar_csv, iguais
+
+
+def _rapida(caminho, tamanho):
+    cabecalho, inicio = ler_cabecalho(caminho)
+    carga = Carga(cabecalho=cabecalho)
+    carga.descartar_cabecalho()
+    with open(caminho, "rb") as ficheiro:
+        ficheiro.seek(inicio)
+        LeitorRapido(cabecalho).ler(carga, ficheiro, tamanho)
+    return carga
+
+
+@pytest.mark.parametrize("tamanho", [777, 5000, 1 << 22])
+def test_leitor_rapido_igual_ao_csv_reader(csv_malformado, tamanho):
+    sequencial = carregar(csv_malformado)
+    assert iguais(estado(_rapida(csv_malformado, tamanho)), estado(sequencial))
+
+
+def test_ingestor_rapido(csv_valido):
+    assert iguais(
+        estado(carregar(csv_valido, rapido=True)), estado(carregar(csv_valido))
+    )
+
+
+def test_campo_longo(tmp_path):
+    caminho = gerar_csv(tmp_path / "longo.csv", 500, semente=3)
+    with open(caminho, "rb") as ficheiro:
+        linhas = ficheiro.read().split(b"\r\n")
+    # Uma observação muito maior que a largura das matrizes de bytes
+    linhas[250] = (
+        linhas[250][: linhas[250].rindex(b";")] + b';"' + b"x" * 100_000 + b'"'
+    )
+    with open(caminho, "wb") as ficheiro:
+        ficheiro.write(b"\r\n".join(linhas))
+    assert iguais(estado(_rapida(caminho, 1 << 22)), estado(carregar(caminho)))
+
+
+def test_fins_dos_registros(csv_malformado):
+    with open(csv_malformado, "rb") as ficheiro:
+        dados = ficheiro.read()
+    fins, consumidos = fins_dos_registros(dados)
+    assert consumidos == len(dados)
+    inicios = [0, *fins.tolist()[:-1]]
+    with open(csv_malformado, encoding="latin-1") as ficheiro:
+        esperado = list(csv.reader(ficheiro, delimiter=";"))
+    assert len(fins) == len(esperado)
+    for inicio, fim, registro in zip(inicios, fins.tolist(), esperado):
+        texto = (
+            dados[inicio:fim]
+            .decode("latin-1")
+            .replace("\r\n", "\n")
+            .replace("\r", "\n")
+        )
+        assert next(csv.reader([texto], delimiter=";")) == registro
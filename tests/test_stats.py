@@ -0,0 +1,89 @@
+import random
+from collections import defaultdict
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from projeto_ped.utils import Stats
+from projeto_ped.utils.calendario import data_para_dia
+
+
+def _lancamentos(semente: int, quantidade: int = 400):
+    aleatorio = random.Random(semente)
+    return [
+        (
+            aleatorio.randrange(1, 100_000),
+            date(2015, 1, 1) + timedelta(days=aleatorio.randrange(3650)),
+        )
+        for _ in range(quantidade)
+    ]
+
+
+def _referencia(lancamentos):
+    por_mes = defaultdict(int)
+    for valor, data in lancamentos:
+        por_mes[data.year, data.month] += valor
+    return por_mes
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_matriz_igual_a_somas_por_mes(semente):
+    lancamentos = _lancamentos(semente)
+    um_a_um, em_lote = Stats(), Stats()
+    for valor, data in lancamentos:
+        um_a_um.acumular(valor, data)
+    valores, datas = zip(*lancamentos)
+    em_lote.acumular_muitos(
+        np.array(valores), np.array([data_para_dia(d) for d in datas])
+    )
+    por_mes = _referencia(lancamentos)
+    anos = sorted({ano for ano, _ in por_mes})
+
+    for stats in (um_a_um, em_lote):
+        assert stats.total == sum(valores)
+        assert stats.get_total_por_ano() == [
+            (ano, sum(v for (a, _), v in por_mes.items() if a == ano)) for ano in anos
+        ]
+        for ano in anos:
+            totais = [total for _, total in stats.get_total_por_mes(ano)]
+            assert totais == [por_mes.get((ano, mes), 0) for mes in range(1, 13)]
+            objeto = stats.get_ano(ano)
+            assert objeto.total == sum(totais)
+            assert [m.total for m in objeto.meses] == totais
+
+
+def test_anos_sem_dados():
+    stats = Stats()
+    assert stats.get_total_por_ano() == []
+    assert stats.total == 0
+    stats.acumular(10, date(2020, 3, 1))
+    stats.acumular(5, date(2017, 12, 31))
+    # 2018 e 2019 ficam entre os anos com dados, sem lançamentos
+    assert stats.get_total_por_ano() == [(2017, 5), (2020, 10)]
+    assert stats.get_ano(2018) is None
+    assert stats.get_ano(2030) is None
+    with pytest.raises(AssertionError):
+        stats.get_total_por_mes(2019)
+    assert stats.get_total_por_mes(2020)[2] == ("mar", 10)
+
+
+@pytest.mark.parametrize("semente", range(3))
+def test_merge_equivale_a_acumular_tudo(semente):
+    lancamentos = _lancamentos(semente)
+    completo = Stats()
+    for valor, data in lancamentos:
+        completo.acumular(valor, data)
+
+    partes = [Stats() for _ in range(3)]
+    for i, (valor, data) in enumerate(lancamentos):
+        partes[i % 3].acumular(valor, data)
+    combinado = Stats()
+    combinado.merge(partes[2])
+    combinado.merge_estado(partes[0].estado())
+    combinado.merge(Stats.de_estado(partes[1].estado()))
+    combinado.merge(Stats())
+
+    assert combinado.get_total_por_ano() == completo.get_total_por_ano()
+    for ano, _ in completo.get_total_por_ano():
+        assert combinado.get_total_por_mes(ano) == completo.get_total_por_mes(ano)
@@ -0,0 +1,118 @@
+import random
+
+import numpy as np
+import pytest
+
+from projeto_ped.gestores import DesmascaradorCPF, IdentificadorCredor
+from projeto_ped.gestores.credor.validacao import (
+    DESCRICAO_MOTIVOS,
+    MOTIVO_DV_CNPJ,
+    MOTIVO_DV_CPF,
+    MOTIVO_FORMATO,
+    MOTIVO_REPETIDO,
+    MOTIVO_VALIDO,
+    ValidadorCredores,
+    validar_identificadores,
+)
+
+from .dados import cnpj, cpf
+
+
+def _documentos(semente: int, quantidade: int = 500) -> list[str]:
+    aleatorio = random.Random(semente)
+    documentos = []
+    for _ in range(quantidade):
+        if aleatorio.random() < 0.5:
+            documentos.append(cpf(f"{aleatorio.randrange(1, 10**9):09d}"))
+        else:
+            documentos.append(cnpj(f"{aleatorio.randrange(1, 10**12):012d}"))
+    return documentos
+
+
+def _trocar_ultimo_digito(documento: str) -> str:
+    return documento[:-1] + str((int(documento[-1]) + 1) % 10)
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_documentos_validos(semente):
+    documentos = _documentos(semente)
+    _, motivos = ValidadorCredores().validar_lote(documentos)
+    assert (motivos == MOTIVO_VALIDO).all()
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_digito_verificador_errado(semente):
+    documentos = [_trocar_ultimo_digito(d) for d in _documentos(semente)]
+    identificadores, motivos = ValidadorCredores().validar_lote(documentos)
+    for identificador, motivo in zip(identificadores, motivos):
+        assert motivo == (MOTIVO_DV_CNPJ if identificador.eh_cnpj else MOTIVO_DV_CPF)
+
+
+def test_motivos():
+    textos = [
+        "000.000.000-00",
+        "111.111.111-11",
+        "00.000.000/0000-00",
+        "11.111.111/1111-11",
+        "123",
+        "",
+        "***.abc.000-**",
+        "***.742.041-**",
+        cpf("123456789"),
+    ]
+    validador = ValidadorCredores()
+    identificadores, motivos = validador.validar_lote(textos)
+    assert (
+        motivos.tolist()
+        == [MOTIVO_REPETIDO] * 4 + [MOTIVO_FORMATO] * 3 + [MOTIVO_VALIDO] * 2
+    )
+    assert identificadores[4] is None
+    assert str(identificadores[8]) == cpf("123456789")
+    assert validador.rejeitados == 7
+    assert validador.rejeitados_por_motivo == {
+        DESCRICAO_MOTIVOS[MOTIVO_REPETIDO]: 4,
+        DESCRICAO_MOTIVOS[MOTIVO_FORMATO]: 3,
+    }
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_lote_igual_a_codificados(semente):
+    aleatorio = random.Random(semente)
+    distintos = _documentos(semente, 50) + ["***.123.456-**", "1", "000.000.000-00"]
+    distintos += [_trocar_ultimo_digito(d) for d in distintos[:10]]
+    codigos = np.array([aleatorio.randrange(len(distintos)) for _ in range(1000)])
+    textos = [distintos[codigo] for codigo in codigos]
+
+    lote = ValidadorCredores(DesmascaradorCPF())
+    codificado = ValidadorCredores(DesmascaradorCPF())
+    identificadores, motivos = lote.validar_lote(textos)
+    compactados, motivos_codificados = codificado.validar_codificados(
+        distintos, codigos
+    )
+    assert motivos.tolist() == motivos_codificados.tolist()
+    assert [i or 0 for i in identificadores] == compactados.tolist()
+    assert lote.estado().keys() == codificado.estado().keys()
+    assert lote.rejeitados_por_motivo == codificado.rejeitados_por_motivo
+    assert lote.mascarados == codificado.mascarados == textos.count("***.123.456-**")
+    assert lote.desmascarados == codificado.desmascarados == 1
+
+
+def test_validar_identificadores_em_lote():
+    documentos = _documentos(7)
+    codigos = [IdentificadorCredor.parse(d) for d in documentos]
+    assert (validar_identificadores(codigos) == MOTIVO_VALIDO).all()
+
+
+def test_desmascarados_vem_do_cache_do_desmascarador():
+    desmascarador = DesmascaradorCPF()
+    validador = ValidadorCredores(desmascarador)
+    textos = ["***.742.041-**", "***.742.041-**", "***.123.456-**"]
+    validador.validar_lote(textos)
+    # Um cálculo por texto distinto; a repetição não passa pelo cache
+    assert desmascarador.cache_info()[:2] == (0, 2)
+    assert validador.mascarados == 3 and validador.desmascarados == 2
+    # Os textos já calculados em outro lote vêm do cache
+    validador.validar_lote(textos[:2] + ["***.000.111-**"])
+    assert desmascarador.cache_info()[:2] == (1, 3)
+    assert validador.mascarados == 6 and validador.desmascarados == 3
+    assert validador.taxa_acertos == pytest.approx(0.5)